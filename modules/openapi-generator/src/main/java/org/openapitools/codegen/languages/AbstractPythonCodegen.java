@@ -45,7 +45,6 @@ import org.apache.commons.io.FilenameUtils;
 import org.apache.commons.lang3.StringUtils;
 import org.openapitools.codegen.CodegenConfig;
 import org.openapitools.codegen.CodegenConstants;
-import org.openapitools.codegen.CodegenDiscriminator;
 import org.openapitools.codegen.CodegenMediaType;
 import org.openapitools.codegen.CodegenModel;
 import org.openapitools.codegen.CodegenOperation;
@@ -924,13 +923,9 @@ public abstract class AbstractPythonCodegen extends DefaultCodegen implements Co
             } else { // typical model
                 codegenProperties = model.vars;
 
-                // if super class
+                // if super class (the mapped models are looked up lazily, as they import it)
                 if (model.getDiscriminator() != null && model.getDiscriminator().getMappedModels() != null) {
                     typingImports.add("Union");
-                    Set<CodegenDiscriminator.MappedModel> discriminator = model.getDiscriminator().getMappedModels();
-                    for (CodegenDiscriminator.MappedModel mappedModel : discriminator) {
-                        postponedModelImports.add(mappedModel.getMappingName());
-                    }
                 }
             }
 
@@ -954,6 +949,7 @@ public abstract class AbstractPythonCodegen extends DefaultCodegen implements Co
                 typingImports.add("List");
                 typingImports.add("Any");
                 typingImports.add("ClassVar");
+                typingImports.add("FrozenSet");
             }
 
             //loop through properties/schemas to set up typing, pydantic
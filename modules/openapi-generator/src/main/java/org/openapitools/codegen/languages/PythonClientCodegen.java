@@ -320,6 +320,11 @@ public class PythonClientCodegen extends AbstractPythonCodegen implements Codege
 
         supportingFiles.add(new SupportingFile("api_client.mustache", packagePath(), "api_client.py"));
         supportingFiles.add(new SupportingFile("api_response.mustache", packagePath(), "api_response.py"));
+        supportingFiles.add(new SupportingFile("json_backend.mustache", packagePath(), "json_backend.py"));
+        supportingFiles.add(new SupportingFile("multipart.mustache", packagePath(), "multipart.py"));
+        supportingFiles.add(new SupportingFile("response_cache.mustache", packagePath(), "response_cache.py"));
+        supportingFiles.add(new SupportingFile("serialization.mustache", packagePath(), "serialization.py"));
+        supportingFiles.add(new SupportingFile("validation.mustache", packagePath(), "validation.py"));
 
         if ("asyncio".equals(getLibrary())) {
             supportingFiles.add(new SupportingFile("asyncio/rest.mustache", packagePath(), "rest.py"));
@@ -28,6 +28,7 @@ import org.openapitools.codegen.*;
 import org.openapitools.codegen.languages.PythonClientCodegen;
 import org.openapitools.codegen.languages.features.CXFServerFeatures;
 import static org.openapitools.codegen.TestUtils.assertFileContains;
+import static org.openapitools.codegen.TestUtils.assertFileNotContains;
 import static org.openapitools.codegen.TestUtils.assertFileExists;
 import org.openapitools.codegen.TestUtils;
 import org.testng.Assert;
@@ -412,6 +413,21 @@ public class PythonClientCodegenTest {
         assertFileContains(p, "openapi_client.ApiClient(configuration) as api_client");
     }
 
+    @Test(description = "check the tornado client decodes lazily, uses the JSON backend and rejects streams")
+    public void tornadoRestClientTest() throws Exception {
+        final DefaultCodegen codegen = new PythonClientCodegen();
+        codegen.setLibrary("tornado");
+        final String outputPath = generateFiles(codegen, "src/test/resources/3_0/generic.yaml");
+        final Path apiClient = Paths.get(outputPath + "openapi_client/api_client.py");
+        final Path rest = Paths.get(outputPath + "openapi_client/rest.py");
+
+        assertFileContains(apiClient, "response_data.decode_later(encoding)",
+                "Streaming responses are not supported by the tornado client");
+        assertFileContains(rest, "class LazilyDecodedData:", "class RESTResponse(LazilyDecodedData, io.IOBase):");
+        assertFileContains(rest, "body = self.configuration.get_json_backend().dump_body(body)");
+        assertFileNotContains(rest, "json.dumps(body)");
+    }
+
     // Helper function, intended to reduce boilerplate
     static private String generateFiles(DefaultCodegen codegen, String filePath) throws IOException {
         final File output = Files.createTempDirectory("test").toFile().getCanonicalFile();
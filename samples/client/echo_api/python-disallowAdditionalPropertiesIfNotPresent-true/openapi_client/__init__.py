@@ -17,34 +17,110 @@
 
 __version__ = "1.0.0"
 
-# import apis into sdk package
-from openapi_client.api.auth_api import AuthApi
-from openapi_client.api.body_api import BodyApi
-from openapi_client.api.form_api import FormApi
-from openapi_client.api.header_api import HeaderApi
-from openapi_client.api.path_api import PathApi
-from openapi_client.api.query_api import QueryApi
-
-# import ApiClient
-from openapi_client.api_response import ApiResponse
-from openapi_client.api_client import ApiClient
-from openapi_client.configuration import Configuration
-from openapi_client.exceptions import OpenApiException
-from openapi_client.exceptions import ApiTypeError
-from openapi_client.exceptions import ApiValueError
-from openapi_client.exceptions import ApiKeyError
-from openapi_client.exceptions import ApiAttributeError
-from openapi_client.exceptions import ApiException
-
-# import models into sdk package
-from openapi_client.models.bird import Bird
-from openapi_client.models.category import Category
-from openapi_client.models.data_query import DataQuery
-from openapi_client.models.default_value import DefaultValue
-from openapi_client.models.number_properties_only import NumberPropertiesOnly
-from openapi_client.models.pet import Pet
-from openapi_client.models.query import Query
-from openapi_client.models.string_enum_ref import StringEnumRef
-from openapi_client.models.tag import Tag
-from openapi_client.models.test_query_style_deep_object_explode_true_object_all_of_query_object_parameter import TestQueryStyleDeepObjectExplodeTrueObjectAllOfQueryObjectParameter
-from openapi_client.models.test_query_style_form_explode_true_array_string_query_object_parameter import TestQueryStyleFormExplodeTrueArrayStringQueryObjectParameter
+import importlib
+from typing import TYPE_CHECKING
+
+# The public names are imported on first access (PEP 562), so that importing
+# the package does not import every API and model module.
+_LAZY_IMPORTS = {
+    # apis
+    'AuthApi': 'openapi_client.api.auth_api',
+    'BodyApi': 'openapi_client.api.body_api',
+    'FormApi': 'openapi_client.api.form_api',
+    'HeaderApi': 'openapi_client.api.header_api',
+    'PathApi': 'openapi_client.api.path_api',
+    'QueryApi': 'openapi_client.api.query_api',
+    # ApiClient
+    'ApiResponse': 'openapi_client.api_response',
+    'ApiClient': 'openapi_client.api_client',
+    'BoundedExecutor': 'openapi_client.api_client',
+    'Configuration': 'openapi_client.configuration',
+    'ResponseCache': 'openapi_client.response_cache',
+    'OpenApiException': 'openapi_client.exceptions',
+    'ApiTypeError': 'openapi_client.exceptions',
+    'ApiValueError': 'openapi_client.exceptions',
+    'ApiKeyError': 'openapi_client.exceptions',
+    'ApiAttributeError': 'openapi_client.exceptions',
+    'ApiException': 'openapi_client.exceptions',
+    # models
+    'Bird': 'openapi_client.models.bird',
+    'Category': 'openapi_client.models.category',
+    'DataQuery': 'openapi_client.models.data_query',
+    'DefaultValue': 'openapi_client.models.default_value',
+    'NumberPropertiesOnly': 'openapi_client.models.number_properties_only',
+    'Pet': 'openapi_client.models.pet',
+    'Query': 'openapi_client.models.query',
+    'StringEnumRef': 'openapi_client.models.string_enum_ref',
+    'Tag': 'openapi_client.models.tag',
+    'TestQueryStyleDeepObjectExplodeTrueObjectAllOfQueryObjectParameter': 'openapi_client.models.test_query_style_deep_object_explode_true_object_all_of_query_object_parameter',
+    'TestQueryStyleFormExplodeTrueArrayStringQueryObjectParameter': 'openapi_client.models.test_query_style_form_explode_true_array_string_query_object_parameter',
+}
+
+# submodules available as attributes of the package
+_LAZY_MODULES = frozenset((
+    'api',
+    'api_client',
+    'api_response',
+    'configuration',
+    'exceptions',
+    'json_backend',
+    'models',
+    'multipart',
+    'response_cache',
+    'rest',
+    'serialization',
+    'validation',
+))
+
+__all__ = list(_LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    # import apis into sdk package
+    from openapi_client.api.auth_api import AuthApi
+    from openapi_client.api.body_api import BodyApi
+    from openapi_client.api.form_api import FormApi
+    from openapi_client.api.header_api import HeaderApi
+    from openapi_client.api.path_api import PathApi
+    from openapi_client.api.query_api import QueryApi
+
+    # import ApiClient
+    from openapi_client.api_response import ApiResponse
+    from openapi_client.api_client import ApiClient
+    from openapi_client.api_client import BoundedExecutor
+    from openapi_client.configuration import Configuration
+    from openapi_client.response_cache import ResponseCache
+    from openapi_client.exceptions import OpenApiException
+    from openapi_client.exceptions import ApiTypeError
+    from openapi_client.exceptions import ApiValueError
+    from openapi_client.exceptions import ApiKeyError
+    from openapi_client.exceptions import ApiAttributeError
+    from openapi_client.exceptions import ApiException
+
+    # import models into sdk package
+    from openapi_client.models.bird import Bird
+    from openapi_client.models.category import Category
+    from openapi_client.models.data_query import DataQuery
+    from openapi_client.models.default_value import DefaultValue
+    from openapi_client.models.number_properties_only import NumberPropertiesOnly
+    from openapi_client.models.pet import Pet
+    from openapi_client.models.query import Query
+    from openapi_client.models.string_enum_ref import StringEnumRef
+    from openapi_client.models.tag import Tag
+    from openapi_client.models.test_query_style_deep_object_explode_true_object_all_of_query_object_parameter import TestQueryStyleDeepObjectExplodeTrueObjectAllOfQueryObjectParameter
+    from openapi_client.models.test_query_style_form_explode_true_array_string_query_object_parameter import TestQueryStyleFormExplodeTrueArrayStringQueryObjectParameter
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    elif name in _LAZY_MODULES:
+        value = importlib.import_module(__name__ + '.' + name)
+    else:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _LAZY_MODULES)
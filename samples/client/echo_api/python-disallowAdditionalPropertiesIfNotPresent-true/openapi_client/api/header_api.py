@@ -14,10 +14,8 @@
 
 
 import re  # noqa: F401
-import io
-import warnings
 
-from pydantic import validate_call, ValidationError
+from pydantic import ValidationError
 from typing import Dict, List, Optional, Tuple
 
 from pydantic import StrictBool, StrictInt, StrictStr
@@ -25,7 +23,7 @@ from pydantic import StrictBool, StrictInt, StrictStr
 from typing import Optional
 
 
-from openapi_client.api_client import ApiClient
+from openapi_client.api_client import ApiClient, OperationSpec, ParamSpec, validate_arguments
 from openapi_client.api_response import ApiResponse
 from openapi_client.exceptions import (  # noqa: F401
     ApiTypeError,
@@ -45,7 +43,7 @@ class HeaderApi:
             api_client = ApiClient.get_default()
         self.api_client = api_client
 
-    @validate_call
+    @validate_arguments
     def test_header_integer_boolean_string(self, integer_header : Optional[StrictInt] = None, boolean_header : Optional[StrictBool] = None, string_header : Optional[StrictStr] = None, **kwargs) -> str:  # noqa: E501
         """Test header parameter(s)  # noqa: E501
 
@@ -77,9 +75,26 @@ class HeaderApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the test_header_integer_boolean_string_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return self.test_header_integer_boolean_string_with_http_info(integer_header, boolean_header, string_header, **kwargs)  # noqa: E501
+        # the arguments are validated once, by this method
+        return self.api_client.call_operation(
+            self._test_header_integer_boolean_string_operation,
+            [integer_header, boolean_header, string_header],
+            kwargs)
+
+    _test_header_integer_boolean_string_operation = OperationSpec.create(
+        'test_header_integer_boolean_string', 'GET', '/header/integer/boolean/string',
+        params=[
+            ParamSpec('integer_header', 'header', 'integer_header'),
+            ParamSpec('boolean_header', 'header', 'boolean_header'),
+            ParamSpec('string_header', 'header', 'string_header'),
+        ],
+        accepts=['text/plain'],
+        response_types_map={
+            '200': "str",
+        },
+    )
 
-    @validate_call
+    @validate_arguments
     def test_header_integer_boolean_string_with_http_info(self, integer_header : Optional[StrictInt] = None, boolean_header : Optional[StrictBool] = None, string_header : Optional[StrictStr] = None, **kwargs) -> ApiResponse:  # noqa: E501
         """Test header parameter(s)  # noqa: E501
 
@@ -103,6 +118,14 @@ class HeaderApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -120,83 +143,7 @@ class HeaderApi:
                  returns the request thread.
         :rtype: tuple(str, status_code(int), headers(HTTPHeaderDict))
         """
-
-        _params = locals()
-
-        _all_params = [
-            'integer_header',
-            'boolean_header',
-            'string_header'
-        ]
-        _all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method test_header_integer_boolean_string" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        if _params['integer_header'] is not None:
-            _header_params['integer_header'] = _params['integer_header']
-
-        if _params['boolean_header'] is not None:
-            _header_params['boolean_header'] = _params['boolean_header']
-
-        if _params['string_header'] is not None:
-            _header_params['string_header'] = _params['string_header']
-
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        # process the body parameter
-        _body_params = None
-        # set the HTTP header `Accept`
-        _header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain'])  # noqa: E501
-
-        # authentication setting
-        _auth_settings: List[str] = []  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-        }
-
-        return self.api_client.call_api(
-            '/header/integer/boolean/string', 'GET',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            async_req=_params.get('async_req'),
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+        return self.api_client.call_operation(
+            self._test_header_integer_boolean_string_operation,
+            [integer_header, boolean_header, string_header],
+            kwargs)
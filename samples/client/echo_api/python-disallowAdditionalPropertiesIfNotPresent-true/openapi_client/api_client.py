@@ -14,22 +14,379 @@
 
 
 import atexit
+import codecs
+import contextlib
+import concurrent.futures
 import datetime
 from dateutil.parser import parse
+import functools
+import hashlib
+import itertools
 import json
-import mimetypes
 from multiprocessing.pool import ThreadPool
 import os
+import queue
+import random
 import re
 import tempfile
+import threading
+from types import MappingProxyType
+from typing import Any, FrozenSet, Mapping, NamedTuple, Optional, Tuple
+import warnings
 
 from urllib.parse import quote
+from pydantic import validate_call
 
 from openapi_client.configuration import Configuration
 from openapi_client.api_response import ApiResponse
 import openapi_client.models
 from openapi_client import rest
-from openapi_client.exceptions import ApiValueError, ApiException
+from openapi_client.multipart import FilePart
+from openapi_client.validation import compact, trusted
+from openapi_client.exceptions import ApiTypeError, ApiValueError, ApiException
+
+RFC3339_DATETIME = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})[Tt ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?'
+    r'(?:([Zz])|([+-])(\d{2}):?(\d{2}))?')
+
+
+def parse_rfc3339_datetime(string):
+    """Parses an RFC 3339 date-time without going through dateutil.
+
+    Fractions of a second are truncated to microseconds.
+
+    :param string: str.
+    :return: datetime, or None if the string is not an RFC 3339 date-time.
+    """
+    match = RFC3339_DATETIME.fullmatch(string)
+    if match is None:
+        return None
+    (year, month, day, hour, minute, second, fraction,
+     utc, sign, offset_hours, offset_minutes) = match.groups()
+    microsecond = int(fraction[:6].ljust(6, '0')) if fraction else 0
+    try:
+        if utc:
+            tzinfo = datetime.timezone.utc
+        elif sign:
+            offset = datetime.timedelta(hours=int(offset_hours),
+                                        minutes=int(offset_minutes))
+            tzinfo = datetime.timezone(-offset if sign == '-' else offset)
+        else:
+            tzinfo = None
+        return datetime.datetime(int(year), int(month), int(day), int(hour),
+                                 int(minute), int(second), microsecond, tzinfo)
+    except ValueError:
+        # out of range fields
+        return None
+
+
+class JsonArrayStreamParser:
+    """Incremental parser for the items of a top-level JSON array.
+
+    Text is fed in chunks as it is read from the response; every item is
+    returned as soon as it is complete, so only a single item is buffered at
+    any time regardless of the size of the array.
+    """
+
+    _WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        # one of: 'start', 'first_item', 'item', 'delimiter', 'end'
+        self._state = 'start'
+
+    def feed(self, text, final=False):
+        """Feeds a chunk of text and returns the items completed by it.
+
+        :param text: next chunk of the JSON document.
+        :param final: whether this is the last chunk of the document.
+        :return: list of decoded items.
+        :raises json.JSONDecodeError: if the document is not a JSON array.
+        """
+        buf = self._buffer + text
+        pos = 0
+        items = []
+        while True:
+            pos = self._WHITESPACE.match(buf, pos).end()
+            if pos == len(buf):
+                break
+            char = buf[pos]
+            if self._state == 'start':
+                if char != '[':
+                    raise json.JSONDecodeError("Expecting '['", buf, pos)
+                pos += 1
+                self._state = 'first_item'
+            elif self._state == 'end':
+                raise json.JSONDecodeError("Extra data", buf, pos)
+            elif char == ']' and self._state in ('first_item', 'delimiter'):
+                pos += 1
+                self._state = 'end'
+            elif self._state == 'delimiter':
+                if char != ',':
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+                pos += 1
+                self._state = 'item'
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break  # wait for the rest of the item
+                if not final and (end == len(buf) or (
+                        char in '-0123456789' and buf[end] not in ' \t\n\r,]')):
+                    break  # a number may continue in the next chunk
+                items.append(item)
+                pos = end
+                self._state = 'delimiter'
+        self._buffer = buf[pos:]
+        if final and self._state != 'end':
+            raise json.JSONDecodeError("Unterminated array", buf, pos)
+        return items
+
+
+class ParamSpec(NamedTuple):
+    """Describes a parameter of an API operation."""
+
+    name: str
+    # one of: 'path', 'query', 'header', 'form', 'file', 'body', 'cookie'
+    location: str
+    # name in the request, not set for the body
+    base_name: Optional[str] = None
+    collection_format: Optional[str] = None
+    # 'date', 'date-time' or 'enum' for query parameters, 'binary' for body
+    data_format: Optional[str] = None
+
+
+class OperationSpec(NamedTuple):
+    """Immutable description of an API operation.
+
+    Specs are built once per operation with `create` when the API module is
+    imported, so that the per-call work left to `ApiClient.call_operation`
+    only depends on the values passed.
+    """
+
+    operation_id: str
+    method: str
+    path: str
+    params: Tuple[ParamSpec, ...]
+    # literal parts of the path alternating with path parameter names
+    path_template: Tuple[str, ...]
+    hosts: Tuple[str, ...]
+    # servers of the operation, in the format of
+    # Configuration.get_host_settings
+    servers: Tuple[Mapping[str, Any], ...]
+    accept: Optional[str]
+    content_type: Optional[str]
+    auth_settings: Tuple[str, ...]
+    response_types_map: Mapping[str, Optional[str]]
+    collection_formats: Mapping[str, str]
+    # keyword arguments accepted by the operation method
+    options: FrozenSet[str]
+    deprecated: bool
+
+    PATH_PARAM = re.compile(r'{([^}]+)}')
+    OPTIONS = frozenset((
+        'async_req',
+        '_return_http_data_only',
+        '_preload_content',
+        '_stream',
+        '_download',
+        '_request_timeout',
+        '_request_auth',
+        '_content_type',
+        '_headers',
+    ))
+
+    @classmethod
+    def create(cls, operation_id, method, path, params=(), hosts=(),
+               accepts=(), content_types=(), auth_settings=(),
+               response_types_map=None, deprecated=False):
+        """Builds the spec of an operation.
+
+        :param operation_id: Name of the operation method.
+        :param method: HTTP method.
+        :param path: Path of the operation, with `{name}` placeholders.
+        :param params: ParamSpec of each parameter, in the order of the
+            operation method arguments.
+        :param hosts: Servers defined for the operation, if any: their URL
+            or a dict in the format of `Configuration.get_host_settings`.
+        :param accepts: Media types the operation produces.
+        :param content_types: Media types the operation consumes.
+        :param auth_settings: Auth Settings names of the operation.
+        :param response_types_map: Response type per HTTP status code.
+        :param deprecated: Whether the operation is deprecated.
+        :return: The OperationSpec.
+        """
+        options = cls.OPTIONS
+        servers = tuple(host if isinstance(host, Mapping) else {'url': host}
+                        for host in hosts)
+        if hosts:
+            options = options | {'_host_index'}
+        return cls(
+            operation_id=operation_id,
+            method=method,
+            path=path,
+            params=tuple(params),
+            path_template=tuple(cls.PATH_PARAM.split(path)),
+            hosts=tuple(server['url'] for server in servers),
+            servers=servers,
+            accept=select_media_type(accepts),
+            content_type=select_media_type(content_types),
+            auth_settings=tuple(auth_settings),
+            response_types_map=MappingProxyType(dict(response_types_map or {})),
+            collection_formats=MappingProxyType({
+                param.base_name: param.collection_format
+                for param in params if param.collection_format}),
+            options=options,
+            deprecated=deprecated,
+        )
+
+
+def validate_arguments(method):
+    """Decorates an API operation method, validating its arguments with
+    pydantic's `validate_call` unless the client side validation is disabled
+    (see `Configuration.client_side_validation`), e.g. for trusted callers.
+
+    Both variants of the method are built once, when the API module is
+    imported; the one called is selected per call. The validator of the
+    arguments is built on the first validated call, so that importing an
+    API module does not build the schemas of all its operations.
+
+    :param method: The operation method.
+    :return: The decorated method.
+    """
+    validated = validate_call(method, config={"defer_build": True})
+
+    @functools.wraps(method)
+    def operation(self, *args, **kwargs):
+        if self.api_client.client_side_validation:
+            return validated(self, *args, **kwargs)
+        return method(self, *args, **kwargs)
+    return operation
+
+
+def select_media_type(media_types):
+    """Returns the first JSON media type, or the first one if none is JSON.
+
+    :param media_types: List of media types.
+    :return: The media type (e.g. application/json), None for an empty list.
+    """
+    if not media_types:
+        return None
+
+    for media_type in media_types:
+        if re.search('json', media_type, re.IGNORECASE):
+            return media_type
+
+    return media_types[0]
+
+
+def _flight_result(flight):
+    """Returns the result of a coalesced request to one of its waiters.
+
+    Its exception is raised as a copy chained to the original, since raising
+    the same instance in several threads or tasks mixes up its traceback.
+
+    :param flight: The future of the request, done if it is an asyncio one.
+    """
+    error = flight.exception()
+    if error is None:
+        return flight.result()
+    try:
+        copy = type(error).__new__(type(error), *error.args)
+        copy.__dict__.update(error.__dict__)
+    except Exception:
+        # e.g. no `__dict__`
+        raise error
+    raise copy from error
+
+
+class DownloadedFile(NamedTuple):
+    """A response body downloaded to a file."""
+
+    path: str
+    # number of bytes written
+    size: int
+    # hex digest of the content, if `Configuration.download_digest` is set
+    digest: Optional[str] = None
+
+
+class MapResult(NamedTuple):
+    """Outcome of one invocation of an operation by `ApiClient.map`."""
+
+    # position of the argument set in the batch
+    index: int
+    arguments: Any
+    result: Any = None
+    # the exception raised by the invocation, if it failed
+    exception: Optional[Exception] = None
+
+
+class BoundedExecutor:
+    """Executor for `async_req` requests with a bounded submission queue.
+
+    Requests run on a `concurrent.futures.ThreadPoolExecutor` and `submit`
+    returns a `concurrent.futures.Future`. At most `max_workers + queue_size`
+    requests are pending at any time; when that is reached, `submit` waits
+    for a free slot (`policy='block'`) or raises `queue.Full`
+    (`policy='reject'`).
+
+    An executor can be shared by several ApiClient instances, it is not shut
+    down when a client is closed.
+
+    :param max_workers: The number of threads, defaults to the
+        `ThreadPoolExecutor` default.
+    :param queue_size: The number of requests waiting for a thread.
+    :param policy: `block` or `reject`.
+    """
+
+    POLICIES = ('block', 'reject')
+
+    def __init__(self, max_workers=None, queue_size=0, policy='block') -> None:
+        if policy not in self.POLICIES:
+            raise ApiValueError(
+                "Invalid executor policy `{0}`. Must be one of {1}.".format(
+                    policy, list(self.POLICIES)))
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        self.max_workers = max_workers
+        self.queue_size = queue_size
+        self.policy = policy
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers)
+        self._slots = threading.BoundedSemaphore(max_workers + queue_size)
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedules `fn(*args, **kwargs)`.
+
+        :return: The concurrent.futures.Future of the call.
+        :raises queue.Full: if the queue is full and the policy is `reject`.
+        """
+        if not self._slots.acquire(blocking=self.policy == 'block'):
+            raise queue.Full(
+                "Request queue is full ({0} pending requests)".format(
+                    self.max_workers + self.queue_size))
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(self.__release)
+        return future
+
+    def __release(self, future):
+        self._slots.release()
+
+    def shutdown(self, wait=True):
+        """Shuts down the thread pool, see `Executor.shutdown`."""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
 
 
 class ApiClient:
@@ -48,9 +405,18 @@ class ApiClient:
         to the API
     :param pool_threads: The number of threads to use for async requests
         to the API. More threads means more concurrent API requests.
+    :param executor: A `concurrent.futures.Executor` (e.g. a
+        BoundedExecutor, possibly shared with other clients) to run async
+        requests on instead of a thread pool per client. Async requests then
+        return a Future, use `result()` instead of `get()`.
+    :param cache: A ResponseCache, caching the responses to GET requests
+        (and the data deserialized from them) per their `Cache-Control`
+        headers.
     """
 
     PRIMITIVE_TYPES = (float, bool, bytes, str, int)
+    # types serialized as is, matched exactly
+    NATIVE_TYPES = frozenset((type(None), float, bool, bytes, str, int))
     NATIVE_TYPES_MAPPING = {
         'int': int,
         'long': int, # TODO remove as only py3 is supported?
@@ -61,15 +427,21 @@ class ApiClient:
         'datetime': datetime.datetime,
         'object': object,
     }
+    DESERIALIZER_CACHE_SIZE = 256
+    STREAM_CHUNK_SIZE = 64 * 1024
+    CHARSET_CACHE_SIZE = 64
     _pool = None
 
     def __init__(self, configuration=None, header_name=None, header_value=None,
-                 cookie=None, pool_threads=1) -> None:
+                 cookie=None, pool_threads=1, executor=None,
+                 cache=None) -> None:
         # use default configuration if none is provided
         if configuration is None:
             configuration = Configuration.get_default()
         self.configuration = configuration
         self.pool_threads = pool_threads
+        self.executor = executor
+        self.cache = cache
 
         self.rest_client = rest.RESTClientObject(configuration)
         self.default_headers = {}
@@ -79,6 +451,12 @@ class ApiClient:
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/1.0.0/python'
         self.client_side_validation = configuration.client_side_validation
+        self.__deserializers = functools.lru_cache(
+            maxsize=self.DESERIALIZER_CACHE_SIZE)(self.__compile_deserializer)
+        self.__serializers = {}
+        # requests in flight, by key, when coalescing
+        self.__flights = {}
+        self.__flights_lock = threading.Lock()
 
     def __enter__(self):
         return self
@@ -149,7 +527,7 @@ class ApiClient:
             files=None, response_types_map=None, auth_settings=None,
             _return_http_data_only=None, collection_formats=None,
             _preload_content=True, _request_timeout=None, _host=None,
-            _request_auth=None):
+            _request_auth=None, _stream=False, _download=None):
 
         config = self.configuration
 
@@ -207,56 +585,191 @@ class ApiClient:
                                                      collection_formats)
             url += "?" + url_query
 
+        args = (method, url, query_params, header_params, body, post_params,
+                response_types_map, _return_http_data_only, _preload_content,
+                _request_timeout, _stream, _download)
+        if (config.coalesce_requests and method in ('GET', 'HEAD') and
+                _preload_content and not _stream and not _download and
+                'file' not in (response_types_map or {}).values()):
+            # identical concurrent requests share a single call
+            key = (method, url, tuple(sorted(header_params.items())),
+                   frozenset((response_types_map or {}).items()),
+                   bool(_return_http_data_only))
+            return self.__coalesce(key, *args)
+        return self.__send(*args)
+
+    def __coalesce(self, key, *args):
+        """Sends a request, or waits for the result of the identical request
+        in flight."""
+        with self.__flights_lock:
+            flight = self.__flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.__flights[key] = concurrent.futures.Future()
+        if not leader:
+            return _flight_result(flight)
+
         try:
-            # perform request and return response
-            response_data = self.request(
-                method, url,
-                query_params=query_params,
-                headers=header_params,
-                post_params=post_params, body=body,
-                _preload_content=_preload_content,
-                _request_timeout=_request_timeout)
-        except ApiException as e:
-            if e.body:
-                e.body = e.body.decode('utf-8')
-            raise e
+            result = self.__send(*args)
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            with self.__flights_lock:
+                del self.__flights[key]
+
+    def __send(self, method, url, query_params, header_params, body,
+               post_params, response_types_map, _return_http_data_only,
+               _preload_content, _request_timeout, _stream, _download):
+        """Sends a prepared request and deserializes its response."""
+        # file responses are streamed to disk
+        download = _preload_content and not _stream and bool(
+            _download or 'file' in (response_types_map or {}).values())
+
+        cache = None
+        cache_entry = None
+        fresh = False
+        if (self.cache is not None and method == 'GET' and _preload_content
+                and not _stream and not download):
+            cache = self.cache
+            cache_entry, fresh = cache.lookup(url, header_params)
+        elif (self.cache is not None and
+                method in ('POST', 'PUT', 'PATCH', 'DELETE')):
+            # unsafe methods invalidate the cached responses of the URL
+            self.cache.invalidate(url)
+
+        if fresh:
+            response_data = cache_entry.response()
+        else:
+            request_headers = header_params
+            if cache_entry is not None:
+                request_headers = dict(header_params,
+                                       **cache_entry.conditional_headers())
+            try:
+                # perform request and return response
+                response_data = self.request(
+                    method, url,
+                    query_params=query_params,
+                    headers=request_headers,
+                    post_params=post_params, body=body,
+                    _preload_content=(_preload_content and not _stream and
+                                      not download),
+                    _request_timeout=_request_timeout)
+            except ApiException as e:
+                if cache_entry is not None and e.status == 304:
+                    # not modified, the cached data is used
+                    response_data = cache.revalidated(cache_entry,
+                                                      e.headers).response()
+                else:
+                    if e.body:
+                        e.body = e.body.decode('utf-8')
+                    raise e
+            else:
+                if cache is not None:
+                    cache_entry = cache.store(url, header_params,
+                                              response_data)
 
         self.last_response = response_data
 
+        if download:
+            response_type = self.__select_response_type(response_types_map,
+                                                        response_data.status)
+            if not _download and response_type != "file":
+                # e.g. an error model
+                download = False
+                response_data = self.__preload(response_data)
+                self.last_response = response_data
+
         return_data = None # assuming deserialization is not needed
+        if download:
+            return_data = self.__download(
+                response_data, _download, method, url, header_params,
+                _request_timeout)
+            if not _download:
+                # `file` responses are deserialized to the path of the file
+                return_data = return_data.path
+        elif _stream:
+            # items are deserialized while the response body is being read
+            response_type = self.__select_response_type(response_types_map,
+                                                        response_data.status)
+            return_data = self.deserialize_stream(response_data, response_type)
         # data needs deserialization or returns HTTP data (deserialized) only
-        if _preload_content or _return_http_data_only:
-          response_type = response_types_map.get(str(response_data.status), None)
-          if not response_type and isinstance(response_data.status, int) and 100 <= response_data.status <= 599:
-              # if not found, look for '1XX', '2XX', etc.
-              response_type = response_types_map.get(str(response_data.status)[0] + "XX", None)
-
-          if response_type == "bytearray":
-              response_data.data = response_data.data
-          else:
-              match = None
-              content_type = response_data.getheader('content-type')
-              if content_type is not None:
-                  match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
-              encoding = match.group(1) if match else "utf-8"
-              response_data.data = response_data.data.decode(encoding)
+        elif _preload_content or _return_http_data_only:
+          response_type = self.__select_response_type(response_types_map,
+                                                      response_data.status)
+
+          encoding = None
+          if response_type != "bytearray":
+              encoding = self.__charset(response_data.getheader('content-type'))
+              if encoding != "utf-8":
+                  # UTF-8 bodies are handed to the JSON parser as bytes,
+                  # other charsets are decoded first
+                  response_data.data = response_data.data.decode(encoding)
+                  encoding = None
 
           # deserialize response data
+          raw_data = response_data.data
           if response_type == "bytearray":
               return_data = response_data.data
+          elif cache_entry is not None and response_type in cache_entry.data:
+              return_data = cache_entry.data[response_type]
           elif response_type:
               return_data = self.deserialize(response_data, response_type)
+              if cache_entry is not None:
+                  cache_entry.data[response_type] = return_data
           else:
               return_data = None
+          if encoding is not None:
+              # last_response.data is decoded on first access
+              response_data.decode_later(encoding)
 
         if _return_http_data_only:
             return return_data
+        elif _stream or download:
+            return ApiResponse(status_code = response_data.status,
+                           data = return_data,
+                           headers = response_data.headers)
+        elif _preload_content:
+            return ApiResponse(status_code = response_data.status,
+                           data = return_data,
+                           headers = response_data.getheaders(),
+                           raw_data = raw_data,
+                           encoding = encoding)
         else:
             return ApiResponse(status_code = response_data.status,
                            data = return_data,
                            headers = response_data.getheaders(),
                            raw_data = response_data.data)
 
+    def __select_response_type(self, response_types_map, status):
+        """Returns the response type declared for the HTTP status code."""
+        response_type = response_types_map.get(str(status), None)
+        if not response_type and isinstance(status, int) and 100 <= status <= 599:
+            # if not found, look for '1XX', '2XX', etc.
+            response_type = response_types_map.get(str(status)[0] + "XX", None)
+        return response_type
+
+    @staticmethod
+    @functools.lru_cache(maxsize=CHARSET_CACHE_SIZE)
+    def __charset(content_type):
+        """Returns the charset of a Content-Type header, utf-8 by default.
+
+        Known charsets are normalized to their codec name (e.g. `UTF8` to
+        `utf-8`). Results are cached per header value.
+        """
+        match = None
+        if content_type is not None:
+            match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
+        if not match:
+            return "utf-8"
+        try:
+            return codecs.lookup(match.group(1)).name
+        except LookupError:
+            return match.group(1)
+
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
 
@@ -268,34 +781,61 @@ class ApiClient:
         If obj is dict, return the dict.
         If obj is OpenAPI model, return the properties dict.
 
+        The serializer is looked up by the exact type of obj, so native
+        values are returned without going through an isinstance chain.
+
         :param obj: The data to serialize.
         :return: The serialized form of data.
         """
-        if obj is None:
-            return None
-        elif isinstance(obj, self.PRIMITIVE_TYPES):
+        cls = type(obj)
+        if cls in self.NATIVE_TYPES:
             return obj
-        elif isinstance(obj, list):
-            return [self.sanitize_for_serialization(sub_obj)
-                    for sub_obj in obj]
-        elif isinstance(obj, tuple):
-            return tuple(self.sanitize_for_serialization(sub_obj)
-                         for sub_obj in obj)
-        elif isinstance(obj, (datetime.datetime, datetime.date)):
-            return obj.isoformat()
-
-        if isinstance(obj, dict):
-            obj_dict = obj
-        else:
-            # Convert model obj to dict except
-            # attributes `openapi_types`, `attribute_map`
-            # and attributes which value is not None.
-            # Convert attribute name to json key in
-            # model definition for request.
-            obj_dict = obj.to_dict()
-
-        return {key: self.sanitize_for_serialization(val)
-                for key, val in obj_dict.items()}
+        serializer = self.__serializers.get(cls)
+        if serializer is None:
+            serializer = self.__serializers[cls] = self.__serializer_for(cls)
+        return serializer(obj)
+
+    def __serializer_for(self, cls):
+        """Returns the serializer of a type which is not a native one."""
+        if issubclass(cls, self.PRIMITIVE_TYPES):
+            # e.g. str enums
+            return self.__serialize_native
+        elif issubclass(cls, list):
+            return self.__serialize_list
+        elif issubclass(cls, tuple):
+            return self.__serialize_tuple
+        elif issubclass(cls, (datetime.datetime, datetime.date)):
+            return cls.isoformat
+        elif issubclass(cls, dict):
+            return self.__serialize_dict
+        # Convert model obj to dict except
+        # attributes `openapi_types`, `attribute_map`
+        # and attributes which value is not None.
+        # Convert attribute name to json key in
+        # model definition for request.
+        return self.__serialize_model
+
+    @staticmethod
+    def __serialize_native(obj):
+        return obj
+
+    def __serialize_list(self, obj):
+        native_types = self.NATIVE_TYPES
+        sanitize = self.sanitize_for_serialization
+        return [sub_obj if type(sub_obj) in native_types else sanitize(sub_obj)
+                for sub_obj in obj]
+
+    def __serialize_tuple(self, obj):
+        return tuple(self.__serialize_list(obj))
+
+    def __serialize_dict(self, obj):
+        native_types = self.NATIVE_TYPES
+        sanitize = self.sanitize_for_serialization
+        return {key: val if type(val) in native_types else sanitize(val)
+                for key, val in obj.items()}
+
+    def __serialize_model(self, obj):
+        return self.__serialize_dict(obj.to_dict())
 
     def deserialize(self, response, response_type):
         """Deserializes response into an object.
@@ -313,11 +853,91 @@ class ApiClient:
 
         # fetch data from response object
         try:
-            data = json.loads(response.data)
+            data = self.configuration.get_json_backend().loads(response.data)
         except ValueError:
             data = response.data
-
-        return self.__deserialize(data, response_type)
+            if isinstance(data, bytes):
+                # not JSON, bodies are kept as bytes only when UTF-8 encoded
+                data = data.decode('utf-8')
+
+        with self.__models_context(self.__trust_response()):
+            return self.__deserialize(data, response_type)
+
+    def __trust_response(self):
+        """Whether a response is deserialized without validation, see
+        `Configuration.trust_responses`."""
+        if not self.configuration.trust_responses:
+            return False
+        # a sample of the responses is validated anyway
+        return random.random() >= self.configuration.trusted_validation_rate
+
+    def __models_context(self, trust):
+        """Context in which the models of a response are built, see
+        `Configuration.trust_responses` and `Configuration.compact_responses`."""
+        context = contextlib.ExitStack()
+        if trust:
+            context.enter_context(trusted())
+        if self.configuration.compact_responses:
+            context.enter_context(compact())
+        return context
+
+    def __in_models_context(self, deserializer, trust):
+        def deserialize_in_context(data):
+            with self.__models_context(trust):
+                return deserializer(data)
+        return deserialize_in_context
+
+    def deserialize_stream(self, response, response_type):
+        """Deserializes the items of a JSON array response as they arrive.
+
+        The body is read from the response (which must not be preloaded) in
+        chunks of `STREAM_CHUNK_SIZE` bytes and parsed incrementally, so the
+        memory used does not depend on the size of the response.
+
+        :param response: HTTP response object, not preloaded.
+        :param response_type: `List[...]` type string of the response.
+
+        :return: iterator of deserialized items.
+        """
+        if not isinstance(response_type, str) or not response_type.startswith('List['):
+            raise ApiValueError(
+                "Streaming is only supported for `List[...]` responses, "
+                "not `{0}`".format(response_type))
+
+        sub_kls = re.match(r'List\[(.*)]', response_type).group(1)
+        encoding = self.__charset(response.headers.get('content-type'))
+        deserialize_item = self.__deserializers(sub_kls)
+        trust = self.__trust_response()
+        if trust or self.configuration.compact_responses:
+            deserialize_item = self.__in_models_context(deserialize_item, trust)
+        return self.__iter_stream(response, deserialize_item,
+                                  codecs.getincrementaldecoder(encoding)())
+
+    def __iter_stream(self, response, deserialize_item, text_decoder):
+        parser = JsonArrayStreamParser()
+        completed = False
+        try:
+            for chunk in response.stream(self.STREAM_CHUNK_SIZE):
+                for item in self.__feed(parser, text_decoder.decode(chunk)):
+                    yield None if item is None else deserialize_item(item)
+            for item in self.__feed(parser, text_decoder.decode(b'', final=True),
+                                    final=True):
+                yield None if item is None else deserialize_item(item)
+            completed = True
+        finally:
+            if not completed:
+                # the rest of the body is not read, drop the connection
+                response.close()
+            response.release_conn()
+
+    def __feed(self, parser, text, final=False):
+        try:
+            return parser.feed(text, final=final)
+        except json.JSONDecodeError as e:
+            raise ApiException(
+                status=0,
+                reason="Failed to parse streamed JSON array: {0}".format(e)
+            )
 
     def __deserialize(self, data, klass):
         """Deserializes dict, list, str into an object.
@@ -330,16 +950,27 @@ class ApiClient:
         if data is None:
             return None
 
+        return self.__deserializers(klass)(data)
+
+    def __compile_deserializer(self, klass):
+        """Compiles a type into a reusable deserializer.
+
+        The type string (e.g. `List[Pet]`, `Dict[str, int]`) is parsed and the
+        model class is looked up only once; the returned callable is cached
+        (see `DESERIALIZER_CACHE_SIZE`) and applied to every response of that
+        type.
+
+        :param klass: class literal, or string of class name.
+        :return: callable taking the decoded JSON data.
+        """
         if isinstance(klass, str):
             if klass.startswith('List['):
                 sub_kls = re.match(r'List\[(.*)]', klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
+                return self.__compile_list_deserializer(sub_kls)
 
             if klass.startswith('Dict['):
                 sub_kls = re.match(r'Dict\[([^,]*), (.*)]', klass).group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in data.items()}
+                return self.__compile_dict_deserializer(sub_kls)
 
             # convert str to class
             if klass in self.NATIVE_TYPES_MAPPING:
@@ -348,15 +979,59 @@ class ApiClient:
                 klass = getattr(openapi_client.models, klass)
 
         if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+            return functools.partial(self.__deserialize_primitive, klass=klass)
         elif klass == object:
-            return self.__deserialize_object(data)
+            return self.__deserialize_object
         elif klass == datetime.date:
-            return self.__deserialize_date(data)
+            return self.__deserialize_date
         elif klass == datetime.datetime:
-            return self.__deserialize_datetime(data)
+            return self.__deserialize_datetime
         else:
-            return self.__deserialize_model(data, klass)
+            return klass.from_dict
+
+    def __compile_list_deserializer(self, sub_kls):
+        """Compiles a deserializer for `List[sub_kls]`."""
+        primitive = self.__native_primitive(sub_kls)
+        if primitive is object:
+            return self.__deserialize_object
+        sub_deserializer = self.__deserializers(sub_kls)
+
+        def deserialize_list(data):
+            # homogeneous lists of the expected primitive type (as produced
+            # by the JSON decoder) are returned without per-element calls
+            if primitive is not None and set(map(type, data)) <= {primitive}:
+                return data
+            return [None if sub_data is None else sub_deserializer(sub_data)
+                    for sub_data in data]
+
+        return deserialize_list
+
+    def __compile_dict_deserializer(self, sub_kls):
+        """Compiles a deserializer for `Dict[str, sub_kls]`."""
+        primitive = self.__native_primitive(sub_kls)
+        if primitive is object:
+            return self.__deserialize_object
+        sub_deserializer = self.__deserializers(sub_kls)
+
+        def deserialize_dict(data):
+            # homogeneous dicts of the expected primitive type (as produced
+            # by the JSON decoder) are returned without per-element calls
+            if primitive is not None and set(map(type, data.values())) <= {primitive}:
+                return data
+            return {k: None if v is None else sub_deserializer(v)
+                    for k, v in data.items()}
+
+        return deserialize_dict
+
+    def __native_primitive(self, klass):
+        """Returns the native type of `klass` if it needs no conversion.
+
+        :return: a primitive type, `object` or None.
+        """
+        native = self.NATIVE_TYPES_MAPPING.get(klass)
+        if native is object or native in self.PRIMITIVE_TYPES:
+            return native
+        return None
 
     def call_api(self, resource_path, method,
                  path_params=None, query_params=None, header_params=None,
@@ -364,7 +1039,8 @@ class ApiClient:
                  response_types_map=None, auth_settings=None,
                  async_req=None, _return_http_data_only=None,
                  collection_formats=None, _preload_content=True,
-                 _request_timeout=None, _host=None, _request_auth=None):
+                 _request_timeout=None, _host=None, _request_auth=None,
+                 _stream=False, _download=None):
         """Makes the HTTP request (synchronous) and returns deserialized data.
 
         To make an async_req request, set the async_req parameter.
@@ -399,10 +1075,19 @@ class ApiClient:
                               request; this effectively ignores the authentication
                               in the spec for a single request.
         :type _request_token: dict, optional
+        :param _stream: if True, the response body (a JSON array) is parsed
+                        incrementally while it is read and the data is an
+                        iterator of the deserialized items.
+                        Default is False.
+        :param _download: a path, or True for a file in the temp folder: the
+                          response body is streamed to the file and the data
+                          is a DownloadedFile. `file` responses are always
+                          streamed to the temp folder.
         :return:
             If async_req parameter is True,
             the request will be called asynchronously.
-            The method will return the request thread.
+            The method will return the request thread, or a Future
+            when the client has an executor.
             If parameter async_req is False or missing,
             then the method will return the response directly.
         """
@@ -423,12 +1108,210 @@ class ApiClient:
             _request_timeout,
             _host,
             _request_auth,
+            _stream,
+            _download,
         )
         if not async_req:
             return self.__call_api(*args)
 
+        if self.executor is not None:
+            return self.executor.submit(self.__call_api, *args)
         return self.pool.apply_async(self.__call_api, args)
 
+    def call_operation(self, spec, args, kwargs):
+        """Calls an API operation described by an OperationSpec.
+
+        This is what the generated `*_with_http_info` methods delegate to.
+
+        :param spec: OperationSpec of the operation.
+        :param args: Values of the operation parameters, in the order of
+            `spec.params`.
+        :param kwargs: Keyword arguments given to the operation method
+            (e.g. `_request_timeout`), see `call_api`.
+        :return: see `call_api`.
+        """
+        for key in kwargs:
+            if key not in spec.options:
+                raise ApiTypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method %s" % (key, spec.operation_id)
+                )
+
+        if spec.deprecated:
+            warnings.warn("%s %s is deprecated." % (spec.method, spec.path),
+                          DeprecationWarning)
+
+        _host = None
+        if spec.hosts:
+            _host_index = kwargs.get('_host_index')
+            if _host_index is not None:
+                _host_index = int(_host_index)
+                if _host_index < 0 or _host_index >= len(spec.hosts):
+                    raise ApiValueError(
+                        "Invalid host index. Must be 0 <= index < %s"
+                        % len(spec.hosts)
+                    )
+            _host = self.configuration.get_operation_host(
+                spec.operation_id, spec.servers, _host_index)
+
+        path_params = {}
+        query_params = []
+        header_params = dict(kwargs.get('_headers', {}))
+        form_params = []
+        files = {}
+        body = None
+        for param, value in zip(spec.params, args):
+            if value is None:
+                continue
+            location = param.location
+            if location == 'query':
+                if param.data_format == 'date-time':
+                    if isinstance(value, datetime.datetime):
+                        value = value.strftime(self.configuration.datetime_format)
+                elif param.data_format == 'date':
+                    if isinstance(value, datetime.date):
+                        value = value.strftime(self.configuration.date_format)
+                elif param.data_format == 'enum':
+                    value = value.value
+                query_params.append((param.base_name, value))
+            elif location == 'path':
+                path_params[param.base_name] = value
+            elif location == 'header':
+                header_params[param.base_name] = value
+            elif location == 'form':
+                form_params.append((param.base_name, value))
+            elif location == 'file':
+                files[param.base_name] = value
+            elif location == 'body':
+                if param.data_format == 'binary' and isinstance(value, str):
+                    # convert to byte array if the input is a file name (str)
+                    with open(value, 'rb') as f:
+                        value = f.read()
+                body = value
+
+        if spec.accept is not None:
+            header_params['Accept'] = spec.accept
+        if spec.content_type is not None:
+            content_type = kwargs.get('_content_type', spec.content_type)
+            if content_type:
+                header_params['Content-Type'] = content_type
+
+        resource_path = spec.path
+        if path_params:
+            resource_path = self.__resolve_path(spec, path_params)
+
+        return self.call_api(
+            resource_path, spec.method,
+            {},
+            query_params,
+            header_params,
+            body=body,
+            post_params=form_params,
+            files=files,
+            response_types_map=spec.response_types_map,
+            auth_settings=spec.auth_settings,
+            async_req=kwargs.get('async_req'),
+            _return_http_data_only=kwargs.get('_return_http_data_only'),
+            _preload_content=kwargs.get('_preload_content', True),
+            _stream=kwargs.get('_stream', False),
+            _download=kwargs.get('_download'),
+            _request_timeout=kwargs.get('_request_timeout'),
+            _host=_host,
+            collection_formats=spec.collection_formats,
+            _request_auth=kwargs.get('_request_auth'))
+
+    def __resolve_path(self, spec, path_params):
+        """Fills the path parameters into the precompiled path template."""
+        path_params = dict(self.parameters_to_tuples(
+            self.sanitize_for_serialization(path_params),
+            spec.collection_formats))
+        safe = self.configuration.safe_chars_for_path_param
+        template = spec.path_template
+        parts = [template[0]]
+        for i in range(1, len(template), 2):
+            name = template[i]
+            if name in path_params:
+                # specified safe chars, encode everything
+                parts.append(quote(str(path_params[name]), safe=safe))
+            else:
+                parts.append('{%s}' % name)
+            parts.append(template[i + 1])
+        return ''.join(parts)
+
+    def map(self, operation, arguments, concurrency=None, ordered=True):
+        """Invokes an operation once per argument set, concurrently.
+
+        The invocations share the connection pool of the client; at most
+        `concurrency` of them are in flight at any time, on threads, and the
+        argument sets are consumed lazily.
+
+        A failed invocation does not abort the batch, its exception is
+        reported in the MapResult of the item.
+
+        :param operation: The API method, e.g. `pet_api.get_pet_by_id`.
+        :param arguments: Iterable of argument sets: a tuple of positional
+            arguments, a dict of keyword arguments or a single argument.
+        :param concurrency: Maximum number of concurrent invocations,
+            defaults to `configuration.connection_pool_maxsize`.
+        :param ordered: If True, results are yielded in the order of the
+            argument sets, otherwise as soon as they complete.
+        :return: Iterator of MapResult.
+        """
+        if concurrency is None:
+            concurrency = self.configuration.connection_pool_maxsize or 1
+        if concurrency < 1:
+            raise ApiValueError(
+                "Invalid concurrency `{0}`. Must be at least 1.".format(
+                    concurrency))
+        return self.__map(operation, iter(arguments), concurrency, ordered)
+
+    def __map(self, operation, arguments, concurrency, ordered):
+        # future -> (index, argument set), in submission order
+        pending = {}
+        items = enumerate(arguments)
+        executor = concurrent.futures.ThreadPoolExecutor(concurrency)
+
+        def fill():
+            for index, args in itertools.islice(items,
+                                                concurrency - len(pending)):
+                future = executor.submit(self.__invoke, operation, args)
+                pending[future] = (index, args)
+
+        try:
+            fill()
+            while pending:
+                if ordered:
+                    done = [next(iter(pending))]
+                    concurrent.futures.wait(done)
+                else:
+                    done, _ = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                results = [self.__map_result(future, *pending.pop(future))
+                           for future in done]
+                fill()
+                for result in results:
+                    yield result
+        finally:
+            # the iteration was abandoned
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    def __invoke(operation, args):
+        if isinstance(args, dict):
+            return operation(**args)
+        if isinstance(args, tuple):
+            return operation(*args)
+        return operation(args)
+
+    @staticmethod
+    def __map_result(future, index, args):
+        exception = future.exception()
+        if exception is not None:
+            return MapResult(index, args, exception=exception)
+        return MapResult(index, args, result=future.result())
+
     def request(self, method, url, query_params=None, headers=None,
                 post_params=None, body=None, _preload_content=True,
                 _request_timeout=None):
@@ -559,7 +1442,11 @@ class ApiClient:
     def files_parameters(self, files=None):
         """Builds form parameters.
 
-        :param files: File parameters.
+        Files are not read here, they are streamed when the request is sent.
+
+        :param files: File parameters. A value is a path, a binary file
+            object, the content (bytes, bytearray, memoryview or mmap), a
+            FilePart or a list of those.
         :return: Form parameters with files.
         """
         params = []
@@ -568,15 +1455,14 @@ class ApiClient:
             for k, v in files.items():
                 if not v:
                     continue
-                file_names = v if type(v) is list else [v]
-                for n in file_names:
-                    with open(n, 'rb') as f:
-                        filename = os.path.basename(f.name)
-                        filedata = f.read()
-                        mimetype = (mimetypes.guess_type(filename)[0] or
-                                    'application/octet-stream')
-                        params.append(
-                            tuple([k, tuple([filename, filedata, mimetype])]))
+                sources = v if type(v) is list else [v]
+                for source in sources:
+                    if not isinstance(source, FilePart):
+                        # content without a name is sent under the field name
+                        source = FilePart(source)
+                        if source.filename is None:
+                            source.filename = k
+                    params.append((k, source))
 
         return params
 
@@ -586,14 +1472,7 @@ class ApiClient:
         :param accepts: List of headers.
         :return: Accept (e.g. application/json).
         """
-        if not accepts:
-            return
-
-        for accept in accepts:
-            if re.search('json', accept, re.IGNORECASE):
-                return accept
-
-        return accepts[0]
+        return select_media_type(accepts)
 
     def select_header_content_type(self, content_types):
         """Returns `Content-Type` based on an array of content_types provided.
@@ -601,14 +1480,7 @@ class ApiClient:
         :param content_types: List of content-types.
         :return: Content-Type (e.g. application/json).
         """
-        if not content_types:
-            return None
-
-        for content_type in content_types:
-            if re.search('json', content_type, re.IGNORECASE):
-                return content_type
-
-        return content_types[0]
+        return select_media_type(content_types)
 
     def update_params_for_auth(self, headers, queries, auth_settings,
                                resource_path, method, body,
@@ -634,8 +1506,9 @@ class ApiClient:
                                     request_auth)
             return
 
+        settings = self.configuration.auth_settings()
         for auth in auth_settings:
-            auth_setting = self.configuration.auth_settings().get(auth)
+            auth_setting = settings.get(auth)
             if auth_setting:
                 self._apply_auth_params(headers, queries,
                                         resource_path, method, body,
@@ -675,20 +1548,127 @@ class ApiClient:
         :param response:  RESTResponse.
         :return: file path.
         """
-        fd, path = tempfile.mkstemp(dir=self.configuration.temp_folder_path)
-        os.close(fd)
-        os.remove(path)
+        path, f = self.__open_download_file(
+            response.getheader("Content-Disposition"))
+        with f:
+            f.write(response.data)
+
+        return path
 
-        content_disposition = response.getheader("Content-Disposition")
+    def __open_download_file(self, content_disposition):
+        """Creates a file in the temporary folder for a response body.
+
+        :param content_disposition: `Content-Disposition` header, the file is
+            named after its filename if provided.
+        :return: path of the file and the file object opened for writing.
+        """
+        folder = self.configuration.temp_folder_path or tempfile.gettempdir()
         if content_disposition:
-            filename = re.search(r'filename=[\'"]?([^\'"\s]+)[\'"]?',
-                                 content_disposition).group(1)
-            path = os.path.join(os.path.dirname(path), filename)
+            match = re.search(r'filename=[\'"]?([^\'"\s]+)[\'"]?',
+                              content_disposition)
+            filename = os.path.basename(match.group(1)) if match else None
+            if filename and filename not in ('.', '..'):
+                path = os.path.join(folder, filename)
+                return path, open(path, "wb")
 
-        with open(path, "wb") as f:
-            f.write(response.data)
+        fd, path = tempfile.mkstemp(dir=folder)
+        return path, os.fdopen(fd, "wb")
 
-        return path
+    def __preload(self, response):
+        """Reads the body of a response requested without preloading.
+
+        :raises ApiException: if the response is an error.
+        """
+        response = rest.RESTResponse(response)
+        if not 200 <= response.status <= 299:
+            e = ApiException(http_resp=response)
+            if e.body:
+                e.body = e.body.decode('utf-8')
+            raise e
+        return response
+
+    def __download(self, response, destination, method, url,
+                   headers, request_timeout):
+        """Streams a response body to a file.
+
+        The body is written in chunks of `download_chunk_size` bytes, while
+        the digest is computed if `download_digest` is set, so the memory
+        used does not depend on the size of the file. An interrupted GET
+        response is resumed with a `Range` request, up to
+        `download_resume_attempts` times.
+
+        :param response: HTTP response object, not preloaded.
+        :param destination: Path of the file, or True for a file in the
+            temporary folder.
+        :return: DownloadedFile.
+        """
+        config = self.configuration
+        if not 200 <= response.status <= 299:
+            self.__preload(response)
+        if isinstance(destination, (str, os.PathLike)):
+            path = os.fspath(destination)
+            f = open(path, "wb")
+        else:
+            path, f = self.__open_download_file(
+                response.headers.get("Content-Disposition"))
+
+        # the body must be resumed at an offset of the content as sent
+        resumable = method == "GET" and response.headers.get(
+            "Content-Encoding", "identity") == "identity"
+        validator = response.headers.get("ETag")
+        if not validator or validator.startswith("W/"):
+            # weak validators cannot be used with If-Range
+            validator = response.headers.get("Last-Modified")
+        attempts = config.download_resume_attempts
+
+        digest = None
+        if config.download_digest:
+            digest = hashlib.new(config.download_digest)
+        size = 0
+        with f:
+            while True:
+                try:
+                    for chunk in response.stream(config.download_chunk_size):
+                        f.write(chunk)
+                        size += len(chunk)
+                        if digest is not None:
+                            digest.update(chunk)
+                except rest.INTERRUPTED_TRANSFER_ERRORS:
+                    response.close()
+                    if not resumable or attempts <= 0:
+                        raise
+                    attempts -= 1
+                else:
+                    response.release_conn()
+                    break
+
+                range_headers = dict(headers, Range="bytes=%d-" % size)
+                if validator:
+                    range_headers["If-Range"] = validator
+                response = self.request(
+                    method, url, headers=range_headers,
+                    _preload_content=False,
+                    _request_timeout=request_timeout)
+                if not 200 <= response.status <= 299:
+                    self.__preload(response)
+                if response.status != 206:
+                    # the whole body is sent again
+                    f.seek(0)
+                    f.truncate()
+                    size = 0
+                    if digest is not None:
+                        digest = hashlib.new(config.download_digest)
+                elif not response.headers.get("Content-Range", "").startswith(
+                        "bytes %d-" % size):
+                    response.close()
+                    raise ApiException(
+                        status=0,
+                        reason="Cannot resume the download, unexpected "
+                               "Content-Range: %s"
+                               % response.headers.get("Content-Range"))
+
+        return DownloadedFile(path, size,
+                              digest.hexdigest() if digest else None)
 
     def __deserialize_primitive(self, data, klass):
         """Deserializes string to primitive type.
@@ -715,9 +1695,22 @@ class ApiClient:
     def __deserialize_date(self, string):
         """Deserializes string to date.
 
+        ISO 8601 dates and dates in `Configuration.date_format` are parsed
+        directly, other formats are left to dateutil.
+
         :param string: str.
         :return: date.
         """
+        try:
+            return datetime.date.fromisoformat(string)
+        except ValueError:
+            pass
+        date_format = self.configuration.date_format
+        if date_format:
+            try:
+                return datetime.datetime.strptime(string, date_format).date()
+            except ValueError:
+                pass
         try:
             return parse(string).date()
         except ImportError:
@@ -731,11 +1724,26 @@ class ApiClient:
     def __deserialize_datetime(self, string):
         """Deserializes string to datetime.
 
-        The string should be in iso8601 datetime format.
+        The string should be in iso8601 datetime format. `fromisoformat`
+        and the RFC 3339 pattern are tried first, then
+        `Configuration.datetime_format`, and dateutil as a last resort.
 
         :param string: str.
         :return: datetime.
         """
+        try:
+            return datetime.datetime.fromisoformat(string)
+        except ValueError:
+            pass
+        value = parse_rfc3339_datetime(string)
+        if value is not None:
+            return value
+        datetime_format = self.configuration.datetime_format
+        if datetime_format:
+            try:
+                return datetime.datetime.strptime(string, datetime_format)
+            except ValueError:
+                pass
         try:
             return parse(string)
         except ImportError:
@@ -748,13 +1756,3 @@ class ApiClient:
                     .format(string)
                 )
             )
-
-    def __deserialize_model(self, data, klass):
-        """Deserializes list or dict to model.
-
-        :param data: dict, list.
-        :param klass: class literal.
-        :return: model object.
-        """
-
-        return klass.from_dict(data)
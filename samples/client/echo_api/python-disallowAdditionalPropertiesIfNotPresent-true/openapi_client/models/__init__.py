@@ -14,15 +14,55 @@
 """  # noqa: E501
 
 
-# import models into model package
-from openapi_client.models.bird import Bird
-from openapi_client.models.category import Category
-from openapi_client.models.data_query import DataQuery
-from openapi_client.models.default_value import DefaultValue
-from openapi_client.models.number_properties_only import NumberPropertiesOnly
-from openapi_client.models.pet import Pet
-from openapi_client.models.query import Query
-from openapi_client.models.string_enum_ref import StringEnumRef
-from openapi_client.models.tag import Tag
-from openapi_client.models.test_query_style_deep_object_explode_true_object_all_of_query_object_parameter import TestQueryStyleDeepObjectExplodeTrueObjectAllOfQueryObjectParameter
-from openapi_client.models.test_query_style_form_explode_true_array_string_query_object_parameter import TestQueryStyleFormExplodeTrueArrayStringQueryObjectParameter
+import importlib
+from typing import TYPE_CHECKING
+
+# The models are imported on first access (PEP 562).
+_LAZY_IMPORTS = {
+    'Bird': 'openapi_client.models.bird',
+    'Category': 'openapi_client.models.category',
+    'DataQuery': 'openapi_client.models.data_query',
+    'DefaultValue': 'openapi_client.models.default_value',
+    'NumberPropertiesOnly': 'openapi_client.models.number_properties_only',
+    'Pet': 'openapi_client.models.pet',
+    'Query': 'openapi_client.models.query',
+    'StringEnumRef': 'openapi_client.models.string_enum_ref',
+    'Tag': 'openapi_client.models.tag',
+    'TestQueryStyleDeepObjectExplodeTrueObjectAllOfQueryObjectParameter': 'openapi_client.models.test_query_style_deep_object_explode_true_object_all_of_query_object_parameter',
+    'TestQueryStyleFormExplodeTrueArrayStringQueryObjectParameter': 'openapi_client.models.test_query_style_form_explode_true_array_string_query_object_parameter',
+}
+
+_LAZY_MODULES = frozenset(
+    module.rpartition('.')[2] for module in _LAZY_IMPORTS.values())
+
+__all__ = list(_LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    # import models into model package
+    from openapi_client.models.bird import Bird
+    from openapi_client.models.category import Category
+    from openapi_client.models.data_query import DataQuery
+    from openapi_client.models.default_value import DefaultValue
+    from openapi_client.models.number_properties_only import NumberPropertiesOnly
+    from openapi_client.models.pet import Pet
+    from openapi_client.models.query import Query
+    from openapi_client.models.string_enum_ref import StringEnumRef
+    from openapi_client.models.tag import Tag
+    from openapi_client.models.test_query_style_deep_object_explode_true_object_all_of_query_object_parameter import TestQueryStyleDeepObjectExplodeTrueObjectAllOfQueryObjectParameter
+    from openapi_client.models.test_query_style_form_explode_true_array_string_query_object_parameter import TestQueryStyleFormExplodeTrueArrayStringQueryObjectParameter
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    elif name in _LAZY_MODULES:
+        value = importlib.import_module(__name__ + '.' + name)
+    else:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _LAZY_MODULES)
@@ -17,6 +17,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from openapi_client import json_backend
+from openapi_client import serialization
+from openapi_client.validation import build_model
 
 from datetime import datetime
 from typing import Optional
@@ -36,11 +40,12 @@ class DataQuery(Query):
     suffix: Optional[StrictStr] = Field(default=None, description="test suffix")
     text: Optional[StrictStr] = Field(default=None, description="Some text containing white spaces")
     var_date: Optional[datetime] = Field(default=None, description="A date", alias="date")
-    __properties: ClassVar[List[str]] = ["id", "outcomes", "suffix", "text", "date"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["id", "outcomes", "suffix", "text", "date"])
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -50,20 +55,24 @@ class DataQuery(Query):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of DataQuery from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         return _dict
 
     @classmethod
@@ -76,11 +85,11 @@ class DataQuery(Query):
             return cls.model_validate(obj)
 
         # raise errors for additional fields in the input
-        for _key in obj.keys():
+        for _key in obj:
             if _key not in cls.__properties:
                 raise ValueError("Error due to additional fields (not defined in DataQuery) in the input: " + _key)
 
-        _obj = cls.model_validate({
+        _obj = build_model(cls, {
             "id": obj.get("id"),
             "outcomes": obj.get("outcomes"),
             "suffix": obj.get("suffix"),
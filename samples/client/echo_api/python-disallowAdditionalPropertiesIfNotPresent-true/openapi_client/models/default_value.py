@@ -17,6 +17,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from openapi_client import json_backend
+from openapi_client import serialization
+from openapi_client.validation import build_model
 
 
 from typing import List, Optional
@@ -28,6 +32,8 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+_ARRAY_STRING_ENUM_DEFAULT_VALUES = ('success', 'failure', 'unclassified')
+
 class DefaultValue(BaseModel):
     """
     to test the default value of properties  # noqa: E501
@@ -40,7 +46,7 @@ class DefaultValue(BaseModel):
     array_string_nullable: Optional[List[StrictStr]] = None
     array_string_extension_nullable: Optional[List[StrictStr]] = None
     string_nullable: Optional[StrictStr] = None
-    __properties: ClassVar[List[str]] = ["array_string_enum_ref_default", "array_string_enum_default", "array_string_default", "array_integer_default", "array_string", "array_string_nullable", "array_string_extension_nullable", "string_nullable"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["array_string_enum_ref_default", "array_string_enum_default", "array_string_default", "array_integer_default", "array_string", "array_string_nullable", "array_string_extension_nullable", "string_nullable"])
 
     @field_validator('array_string_enum_default')
     def array_string_enum_default_validate_enum(cls, value):
@@ -49,13 +55,14 @@ class DefaultValue(BaseModel):
             return value
 
         for i in value:
-            if i not in ('success', 'failure', 'unclassified'):
+            if i not in _ARRAY_STRING_ENUM_DEFAULT_VALUES:
                 raise ValueError("each list item must be one of ('success', 'failure', 'unclassified')")
         return value
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -65,20 +72,24 @@ class DefaultValue(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of DefaultValue from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         # set to None if array_string_nullable (nullable) is None
         # and model_fields_set contains the field
         if self.array_string_nullable is None and "array_string_nullable" in self.model_fields_set:
@@ -106,11 +117,11 @@ class DefaultValue(BaseModel):
             return cls.model_validate(obj)
 
         # raise errors for additional fields in the input
-        for _key in obj.keys():
+        for _key in obj:
             if _key not in cls.__properties:
                 raise ValueError("Error due to additional fields (not defined in DefaultValue) in the input: " + _key)
 
-        _obj = cls.model_validate({
+        _obj = build_model(cls, {
             "array_string_enum_ref_default": obj.get("array_string_enum_ref_default"),
             "array_string_enum_default": obj.get("array_string_enum_default"),
             "array_string_default": obj.get("array_string_default"),
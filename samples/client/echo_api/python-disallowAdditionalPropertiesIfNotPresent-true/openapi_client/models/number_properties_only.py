@@ -17,6 +17,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from openapi_client import json_backend
+from openapi_client import serialization
+from openapi_client.validation import build_model
 
 
 from typing import Optional, Union
@@ -36,11 +40,12 @@ class NumberPropertiesOnly(BaseModel):
     number: Optional[Union[StrictFloat, StrictInt]] = None
     var_float: Optional[Union[StrictFloat, StrictInt]] = Field(default=None, alias="float")
     double: Optional[Union[Annotated[float, Field(le=50.2, strict=True, ge=0.8)], Annotated[int, Field(le=50, strict=True, ge=1)]]] = None
-    __properties: ClassVar[List[str]] = ["number", "float", "double"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["number", "float", "double"])
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -50,20 +55,24 @@ class NumberPropertiesOnly(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of NumberPropertiesOnly from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         return _dict
 
     @classmethod
@@ -76,11 +85,11 @@ class NumberPropertiesOnly(BaseModel):
             return cls.model_validate(obj)
 
         # raise errors for additional fields in the input
-        for _key in obj.keys():
+        for _key in obj:
             if _key not in cls.__properties:
                 raise ValueError("Error due to additional fields (not defined in NumberPropertiesOnly) in the input: " + _key)
 
-        _obj = cls.model_validate({
+        _obj = build_model(cls, {
             "number": obj.get("number"),
             "float": obj.get("float"),
             "double": obj.get("double")
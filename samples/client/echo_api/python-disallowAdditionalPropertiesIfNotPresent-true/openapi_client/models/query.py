@@ -17,6 +17,9 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from openapi_client import json_backend
+from openapi_client import serialization
 
 
 from typing import List, Optional
@@ -28,13 +31,15 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+_OUTCOMES_VALUES = ('SUCCESS', 'FAILURE', 'SKIPPED')
+
 class Query(BaseModel):
     """
     Query
     """
     id: Optional[StrictInt] = Field(default=None, description="Query")
     outcomes: Optional[List[StrictStr]] = None
-    __properties: ClassVar[List[str]] = ["id", "outcomes"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["id", "outcomes"])
 
     @field_validator('outcomes')
     def outcomes_validate_enum(cls, value):
@@ -43,13 +48,14 @@ class Query(BaseModel):
             return value
 
         for i in value:
-            if i not in ('SUCCESS', 'FAILURE', 'SKIPPED'):
+            if i not in _OUTCOMES_VALUES:
                 raise ValueError("each list item must be one of ('SUCCESS', 'FAILURE', 'SKIPPED')")
         return value
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -59,20 +65,27 @@ class Query(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of Query from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        if type(self) is not Query and serialization.in_to_dict():
+            # a subclass in a field of this type is dumped as a whole
+            return self.to_dict()
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         return _dict
 
     @classmethod
@@ -1,10 +1,44 @@
 # flake8: noqa
 
-# import apis into api package
-from openapi_client.api.auth_api import AuthApi
-from openapi_client.api.body_api import BodyApi
-from openapi_client.api.form_api import FormApi
-from openapi_client.api.header_api import HeaderApi
-from openapi_client.api.path_api import PathApi
-from openapi_client.api.query_api import QueryApi
+import importlib
+from typing import TYPE_CHECKING
 
+# The apis are imported on first access (PEP 562).
+_LAZY_IMPORTS = {
+    'AuthApi': 'openapi_client.api.auth_api',
+    'BodyApi': 'openapi_client.api.body_api',
+    'FormApi': 'openapi_client.api.form_api',
+    'HeaderApi': 'openapi_client.api.header_api',
+    'PathApi': 'openapi_client.api.path_api',
+    'QueryApi': 'openapi_client.api.query_api',
+}
+
+_LAZY_MODULES = frozenset(
+    module.rpartition('.')[2] for module in _LAZY_IMPORTS.values())
+
+__all__ = list(_LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    # import apis into api package
+    from openapi_client.api.auth_api import AuthApi
+    from openapi_client.api.body_api import BodyApi
+    from openapi_client.api.form_api import FormApi
+    from openapi_client.api.header_api import HeaderApi
+    from openapi_client.api.path_api import PathApi
+    from openapi_client.api.query_api import QueryApi
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    elif name in _LAZY_MODULES:
+        value = importlib.import_module(__name__ + '.' + name)
+    else:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _LAZY_MODULES)
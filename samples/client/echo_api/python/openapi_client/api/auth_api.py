@@ -14,14 +14,12 @@
 
 
 import re  # noqa: F401
-import io
-import warnings
 
-from pydantic import validate_call, ValidationError
+from pydantic import ValidationError
 from typing import Dict, List, Optional, Tuple
 
 
-from openapi_client.api_client import ApiClient
+from openapi_client.api_client import ApiClient, OperationSpec, ParamSpec, validate_arguments
 from openapi_client.api_response import ApiResponse
 from openapi_client.exceptions import (  # noqa: F401
     ApiTypeError,
@@ -41,7 +39,7 @@ class AuthApi:
             api_client = ApiClient.get_default()
         self.api_client = api_client
 
-    @validate_call
+    @validate_arguments
     def test_auth_http_basic(self, **kwargs) -> str:  # noqa: E501
         """To test HTTP basic authentication  # noqa: E501
 
@@ -67,9 +65,22 @@ class AuthApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the test_auth_http_basic_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return self.test_auth_http_basic_with_http_info(**kwargs)  # noqa: E501
+        # the arguments are validated once, by this method
+        return self.api_client.call_operation(
+            self._test_auth_http_basic_operation,
+            [],
+            kwargs)
+
+    _test_auth_http_basic_operation = OperationSpec.create(
+        'test_auth_http_basic', 'POST', '/auth/http/basic',
+        accepts=['text/plain'],
+        auth_settings=['http_auth'],
+        response_types_map={
+            '200': "str",
+        },
+    )
 
-    @validate_call
+    @validate_arguments
     def test_auth_http_basic_with_http_info(self, **kwargs) -> ApiResponse:  # noqa: E501
         """To test HTTP basic authentication  # noqa: E501
 
@@ -87,6 +98,14 @@ class AuthApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -104,71 +123,7 @@ class AuthApi:
                  returns the request thread.
         :rtype: tuple(str, status_code(int), headers(HTTPHeaderDict))
         """
-
-        _params = locals()
-
-        _all_params = [
-        ]
-        _all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method test_auth_http_basic" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        # process the body parameter
-        _body_params = None
-        # set the HTTP header `Accept`
-        _header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain'])  # noqa: E501
-
-        # authentication setting
-        _auth_settings: List[str] = ['http_auth']  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-        }
-
-        return self.api_client.call_api(
-            '/auth/http/basic', 'POST',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            async_req=_params.get('async_req'),
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+        return self.api_client.call_operation(
+            self._test_auth_http_basic_operation,
+            [],
+            kwargs)
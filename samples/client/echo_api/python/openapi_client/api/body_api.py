@@ -14,10 +14,8 @@
 
 
 import re  # noqa: F401
-import io
-import warnings
 
-from pydantic import validate_call, ValidationError
+from pydantic import ValidationError
 from typing import Dict, List, Optional, Tuple
 
 from pydantic import Field
@@ -29,7 +27,7 @@ from typing import Any, Dict, List, Optional, Union
 from openapi_client.models.pet import Pet
 from openapi_client.models.tag import Tag
 
-from openapi_client.api_client import ApiClient
+from openapi_client.api_client import ApiClient, OperationSpec, ParamSpec, validate_arguments
 from openapi_client.api_response import ApiResponse
 from openapi_client.exceptions import (  # noqa: F401
     ApiTypeError,
@@ -49,7 +47,7 @@ class BodyApi:
             api_client = ApiClient.get_default()
         self.api_client = api_client
 
-    @validate_call
+    @validate_arguments
     def test_binary_gif(self, **kwargs) -> bytearray:  # noqa: E501
         """Test binary (gif) response body  # noqa: E501
 
@@ -75,9 +73,21 @@ class BodyApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the test_binary_gif_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return self.test_binary_gif_with_http_info(**kwargs)  # noqa: E501
+        # the arguments are validated once, by this method
+        return self.api_client.call_operation(
+            self._test_binary_gif_operation,
+            [],
+            kwargs)
+
+    _test_binary_gif_operation = OperationSpec.create(
+        'test_binary_gif', 'POST', '/binary/gif',
+        accepts=['image/gif'],
+        response_types_map={
+            '200': "bytearray",
+        },
+    )
 
-    @validate_call
+    @validate_arguments
     def test_binary_gif_with_http_info(self, **kwargs) -> ApiResponse:  # noqa: E501
         """Test binary (gif) response body  # noqa: E501
 
@@ -95,6 +105,14 @@ class BodyApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -112,76 +130,12 @@ class BodyApi:
                  returns the request thread.
         :rtype: tuple(bytearray, status_code(int), headers(HTTPHeaderDict))
         """
+        return self.api_client.call_operation(
+            self._test_binary_gif_operation,
+            [],
+            kwargs)
 
-        _params = locals()
-
-        _all_params = [
-        ]
-        _all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method test_binary_gif" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        # process the body parameter
-        _body_params = None
-        # set the HTTP header `Accept`
-        _header_params['Accept'] = self.api_client.select_header_accept(
-            ['image/gif'])  # noqa: E501
-
-        # authentication setting
-        _auth_settings: List[str] = []  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "bytearray",
-        }
-
-        return self.api_client.call_api(
-            '/binary/gif', 'POST',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            async_req=_params.get('async_req'),
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
-
-    @validate_call
+    @validate_arguments
     def test_body_application_octetstream_binary(self, body : Optional[Union[StrictBytes, StrictStr]] = None, **kwargs) -> str:  # noqa: E501
         """Test body parameter(s)  # noqa: E501
 
@@ -209,9 +163,25 @@ class BodyApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the test_body_application_octetstream_binary_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return self.test_body_application_octetstream_binary_with_http_info(body, **kwargs)  # noqa: E501
+        # the arguments are validated once, by this method
+        return self.api_client.call_operation(
+            self._test_body_application_octetstream_binary_operation,
+            [body],
+            kwargs)
+
+    _test_body_application_octetstream_binary_operation = OperationSpec.create(
+        'test_body_application_octetstream_binary', 'POST', '/body/application/octetstream/binary',
+        params=[
+            ParamSpec('body', 'body', data_format='binary'),
+        ],
+        accepts=['text/plain'],
+        content_types=['application/octet-stream'],
+        response_types_map={
+            '200': "str",
+        },
+    )
 
-    @validate_call
+    @validate_arguments
     def test_body_application_octetstream_binary_with_http_info(self, body : Optional[Union[StrictBytes, StrictStr]] = None, **kwargs) -> ApiResponse:  # noqa: E501
         """Test body parameter(s)  # noqa: E501
 
@@ -231,6 +201,14 @@ class BodyApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -248,92 +226,12 @@ class BodyApi:
                  returns the request thread.
         :rtype: tuple(str, status_code(int), headers(HTTPHeaderDict))
         """
+        return self.api_client.call_operation(
+            self._test_body_application_octetstream_binary_operation,
+            [body],
+            kwargs)
 
-        _params = locals()
-
-        _all_params = [
-            'body'
-        ]
-        _all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method test_body_application_octetstream_binary" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        # process the body parameter
-        _body_params = None
-        if _params['body'] is not None:
-            _body_params = _params['body']
-            # convert to byte array if the input is a file name (str)
-            if isinstance(_body_params, str):
-                with io.open(_body_params, "rb") as _fp:
-                   _body_params_from_file = _fp.read()
-                _body_params = _body_params_from_file
-
-        # set the HTTP header `Accept`
-        _header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain'])  # noqa: E501
-
-        # set the HTTP header `Content-Type`
-        _content_types_list = _params.get('_content_type',
-            self.api_client.select_header_content_type(
-                ['application/octet-stream']))
-        if _content_types_list:
-                _header_params['Content-Type'] = _content_types_list
-
-        # authentication setting
-        _auth_settings: List[str] = []  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-        }
-
-        return self.api_client.call_api(
-            '/body/application/octetstream/binary', 'POST',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            async_req=_params.get('async_req'),
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
-
-    @validate_call
+    @validate_arguments
     def test_body_multipart_formdata_array_of_binary(self, files : List[Union[StrictBytes, StrictStr]], **kwargs) -> str:  # noqa: E501
         """Test array of binary in multipart mime  # noqa: E501
 
@@ -361,9 +259,25 @@ class BodyApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the test_body_multipart_formdata_array_of_binary_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return self.test_body_multipart_formdata_array_of_binary_with_http_info(files, **kwargs)  # noqa: E501
+        # the arguments are validated once, by this method
+        return self.api_client.call_operation(
+            self._test_body_multipart_formdata_array_of_binary_operation,
+            [files],
+            kwargs)
+
+    _test_body_multipart_formdata_array_of_binary_operation = OperationSpec.create(
+        'test_body_multipart_formdata_array_of_binary', 'POST', '/body/application/octetstream/array_of_binary',
+        params=[
+            ParamSpec('files', 'file', 'files', collection_format='csv'),
+        ],
+        accepts=['text/plain'],
+        content_types=['multipart/form-data'],
+        response_types_map={
+            '200': "str",
+        },
+    )
 
-    @validate_call
+    @validate_arguments
     def test_body_multipart_formdata_array_of_binary_with_http_info(self, files : List[Union[StrictBytes, StrictStr]], **kwargs) -> ApiResponse:  # noqa: E501
         """Test array of binary in multipart mime  # noqa: E501
 
@@ -383,6 +297,14 @@ class BodyApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -400,88 +322,12 @@ class BodyApi:
                  returns the request thread.
         :rtype: tuple(str, status_code(int), headers(HTTPHeaderDict))
         """
+        return self.api_client.call_operation(
+            self._test_body_multipart_formdata_array_of_binary_operation,
+            [files],
+            kwargs)
 
-        _params = locals()
-
-        _all_params = [
-            'files'
-        ]
-        _all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method test_body_multipart_formdata_array_of_binary" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        if _params['files'] is not None:
-            _files['files'] = _params['files']
-            _collection_formats['files'] = 'csv'
-
-        # process the body parameter
-        _body_params = None
-        # set the HTTP header `Accept`
-        _header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain'])  # noqa: E501
-
-        # set the HTTP header `Content-Type`
-        _content_types_list = _params.get('_content_type',
-            self.api_client.select_header_content_type(
-                ['multipart/form-data']))
-        if _content_types_list:
-                _header_params['Content-Type'] = _content_types_list
-
-        # authentication setting
-        _auth_settings: List[str] = []  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-        }
-
-        return self.api_client.call_api(
-            '/body/application/octetstream/array_of_binary', 'POST',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            async_req=_params.get('async_req'),
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
-
-    @validate_call
+    @validate_arguments
     def test_echo_body_free_form_object_response_string(self, body : Annotated[Optional[Dict[str, Any]], Field(description="Free form object")] = None, **kwargs) -> str:  # noqa: E501
         """Test free form object  # noqa: E501
 
@@ -509,9 +355,25 @@ class BodyApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the test_echo_body_free_form_object_response_string_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return self.test_echo_body_free_form_object_response_string_with_http_info(body, **kwargs)  # noqa: E501
+        # the arguments are validated once, by this method
+        return self.api_client.call_operation(
+            self._test_echo_body_free_form_object_response_string_operation,
+            [body],
+            kwargs)
+
+    _test_echo_body_free_form_object_response_string_operation = OperationSpec.create(
+        'test_echo_body_free_form_object_response_string', 'POST', '/echo/body/FreeFormObject/response_string',
+        params=[
+            ParamSpec('body', 'body'),
+        ],
+        accepts=['text/plain'],
+        content_types=['application/json'],
+        response_types_map={
+            '200': "str",
+        },
+    )
 
-    @validate_call
+    @validate_arguments
     def test_echo_body_free_form_object_response_string_with_http_info(self, body : Annotated[Optional[Dict[str, Any]], Field(description="Free form object")] = None, **kwargs) -> ApiResponse:  # noqa: E501
         """Test free form object  # noqa: E501
 
@@ -531,6 +393,14 @@ class BodyApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -548,87 +418,12 @@ class BodyApi:
                  returns the request thread.
         :rtype: tuple(str, status_code(int), headers(HTTPHeaderDict))
         """
+        return self.api_client.call_operation(
+            self._test_echo_body_free_form_object_response_string_operation,
+            [body],
+            kwargs)
 
-        _params = locals()
-
-        _all_params = [
-            'body'
-        ]
-        _all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method test_echo_body_free_form_object_response_string" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        # process the body parameter
-        _body_params = None
-        if _params['body'] is not None:
-            _body_params = _params['body']
-
-        # set the HTTP header `Accept`
-        _header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain'])  # noqa: E501
-
-        # set the HTTP header `Content-Type`
-        _content_types_list = _params.get('_content_type',
-            self.api_client.select_header_content_type(
-                ['application/json']))
-        if _content_types_list:
-                _header_params['Content-Type'] = _content_types_list
-
-        # authentication setting
-        _auth_settings: List[str] = []  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-        }
-
-        return self.api_client.call_api(
-            '/echo/body/FreeFormObject/response_string', 'POST',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            async_req=_params.get('async_req'),
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
-
-    @validate_call
+    @validate_arguments
     def test_echo_body_pet(self, pet : Annotated[Optional[Pet], Field(description="Pet object that needs to be added to the store")] = None, **kwargs) -> Pet:  # noqa: E501
         """Test body parameter(s)  # noqa: E501
 
@@ -656,9 +451,25 @@ class BodyApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the test_echo_body_pet_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return self.test_echo_body_pet_with_http_info(pet, **kwargs)  # noqa: E501
+        # the arguments are validated once, by this method
+        return self.api_client.call_operation(
+            self._test_echo_body_pet_operation,
+            [pet],
+            kwargs)
+
+    _test_echo_body_pet_operation = OperationSpec.create(
+        'test_echo_body_pet', 'POST', '/echo/body/Pet',
+        params=[
+            ParamSpec('pet', 'body'),
+        ],
+        accepts=['application/json'],
+        content_types=['application/json'],
+        response_types_map={
+            '200': "Pet",
+        },
+    )
 
-    @validate_call
+    @validate_arguments
     def test_echo_body_pet_with_http_info(self, pet : Annotated[Optional[Pet], Field(description="Pet object that needs to be added to the store")] = None, **kwargs) -> ApiResponse:  # noqa: E501
         """Test body parameter(s)  # noqa: E501
 
@@ -678,6 +489,14 @@ class BodyApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -695,87 +514,12 @@ class BodyApi:
                  returns the request thread.
         :rtype: tuple(Pet, status_code(int), headers(HTTPHeaderDict))
         """
+        return self.api_client.call_operation(
+            self._test_echo_body_pet_operation,
+            [pet],
+            kwargs)
 
-        _params = locals()
-
-        _all_params = [
-            'pet'
-        ]
-        _all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method test_echo_body_pet" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        # process the body parameter
-        _body_params = None
-        if _params['pet'] is not None:
-            _body_params = _params['pet']
-
-        # set the HTTP header `Accept`
-        _header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # set the HTTP header `Content-Type`
-        _content_types_list = _params.get('_content_type',
-            self.api_client.select_header_content_type(
-                ['application/json']))
-        if _content_types_list:
-                _header_params['Content-Type'] = _content_types_list
-
-        # authentication setting
-        _auth_settings: List[str] = []  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "Pet",
-        }
-
-        return self.api_client.call_api(
-            '/echo/body/Pet', 'POST',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            async_req=_params.get('async_req'),
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
-
-    @validate_call
+    @validate_arguments
     def test_echo_body_pet_response_string(self, pet : Annotated[Optional[Pet], Field(description="Pet object that needs to be added to the store")] = None, **kwargs) -> str:  # noqa: E501
         """Test empty response body  # noqa: E501
 
@@ -803,9 +547,25 @@ class BodyApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the test_echo_body_pet_response_string_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return self.test_echo_body_pet_response_string_with_http_info(pet, **kwargs)  # noqa: E501
+        # the arguments are validated once, by this method
+        return self.api_client.call_operation(
+            self._test_echo_body_pet_response_string_operation,
+            [pet],
+            kwargs)
+
+    _test_echo_body_pet_response_string_operation = OperationSpec.create(
+        'test_echo_body_pet_response_string', 'POST', '/echo/body/Pet/response_string',
+        params=[
+            ParamSpec('pet', 'body'),
+        ],
+        accepts=['text/plain'],
+        content_types=['application/json'],
+        response_types_map={
+            '200': "str",
+        },
+    )
 
-    @validate_call
+    @validate_arguments
     def test_echo_body_pet_response_string_with_http_info(self, pet : Annotated[Optional[Pet], Field(description="Pet object that needs to be added to the store")] = None, **kwargs) -> ApiResponse:  # noqa: E501
         """Test empty response body  # noqa: E501
 
@@ -825,6 +585,14 @@ class BodyApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -842,87 +610,12 @@ class BodyApi:
                  returns the request thread.
         :rtype: tuple(str, status_code(int), headers(HTTPHeaderDict))
         """
+        return self.api_client.call_operation(
+            self._test_echo_body_pet_response_string_operation,
+            [pet],
+            kwargs)
 
-        _params = locals()
-
-        _all_params = [
-            'pet'
-        ]
-        _all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method test_echo_body_pet_response_string" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        # process the body parameter
-        _body_params = None
-        if _params['pet'] is not None:
-            _body_params = _params['pet']
-
-        # set the HTTP header `Accept`
-        _header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain'])  # noqa: E501
-
-        # set the HTTP header `Content-Type`
-        _content_types_list = _params.get('_content_type',
-            self.api_client.select_header_content_type(
-                ['application/json']))
-        if _content_types_list:
-                _header_params['Content-Type'] = _content_types_list
-
-        # authentication setting
-        _auth_settings: List[str] = []  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-        }
-
-        return self.api_client.call_api(
-            '/echo/body/Pet/response_string', 'POST',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            async_req=_params.get('async_req'),
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
-
-    @validate_call
+    @validate_arguments
     def test_echo_body_tag_response_string(self, tag : Annotated[Optional[Tag], Field(description="Tag object")] = None, **kwargs) -> str:  # noqa: E501
         """Test empty json (request body)  # noqa: E501
 
@@ -950,9 +643,25 @@ class BodyApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the test_echo_body_tag_response_string_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return self.test_echo_body_tag_response_string_with_http_info(tag, **kwargs)  # noqa: E501
+        # the arguments are validated once, by this method
+        return self.api_client.call_operation(
+            self._test_echo_body_tag_response_string_operation,
+            [tag],
+            kwargs)
+
+    _test_echo_body_tag_response_string_operation = OperationSpec.create(
+        'test_echo_body_tag_response_string', 'POST', '/echo/body/Tag/response_string',
+        params=[
+            ParamSpec('tag', 'body'),
+        ],
+        accepts=['text/plain'],
+        content_types=['application/json'],
+        response_types_map={
+            '200': "str",
+        },
+    )
 
-    @validate_call
+    @validate_arguments
     def test_echo_body_tag_response_string_with_http_info(self, tag : Annotated[Optional[Tag], Field(description="Tag object")] = None, **kwargs) -> ApiResponse:  # noqa: E501
         """Test empty json (request body)  # noqa: E501
 
@@ -972,6 +681,14 @@ class BodyApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -989,82 +706,7 @@ class BodyApi:
                  returns the request thread.
         :rtype: tuple(str, status_code(int), headers(HTTPHeaderDict))
         """
-
-        _params = locals()
-
-        _all_params = [
-            'tag'
-        ]
-        _all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method test_echo_body_tag_response_string" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        # process the body parameter
-        _body_params = None
-        if _params['tag'] is not None:
-            _body_params = _params['tag']
-
-        # set the HTTP header `Accept`
-        _header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain'])  # noqa: E501
-
-        # set the HTTP header `Content-Type`
-        _content_types_list = _params.get('_content_type',
-            self.api_client.select_header_content_type(
-                ['application/json']))
-        if _content_types_list:
-                _header_params['Content-Type'] = _content_types_list
-
-        # authentication setting
-        _auth_settings: List[str] = []  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-        }
-
-        return self.api_client.call_api(
-            '/echo/body/Tag/response_string', 'POST',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            async_req=_params.get('async_req'),
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+        return self.api_client.call_operation(
+            self._test_echo_body_tag_response_string_operation,
+            [tag],
+            kwargs)
@@ -14,10 +14,8 @@
 
 
 import re  # noqa: F401
-import io
-import warnings
 
-from pydantic import validate_call, ValidationError
+from pydantic import ValidationError
 from typing import Dict, List, Optional, Tuple
 
 from pydantic import StrictBool, StrictInt, StrictStr
@@ -25,7 +23,7 @@ from pydantic import StrictBool, StrictInt, StrictStr
 from typing import Optional
 
 
-from openapi_client.api_client import ApiClient
+from openapi_client.api_client import ApiClient, OperationSpec, ParamSpec, validate_arguments
 from openapi_client.api_response import ApiResponse
 from openapi_client.exceptions import (  # noqa: F401
     ApiTypeError,
@@ -45,7 +43,7 @@ class FormApi:
             api_client = ApiClient.get_default()
         self.api_client = api_client
 
-    @validate_call
+    @validate_arguments
     def test_form_integer_boolean_string(self, integer_form : Optional[StrictInt] = None, boolean_form : Optional[StrictBool] = None, string_form : Optional[StrictStr] = None, **kwargs) -> str:  # noqa: E501
         """Test form parameter(s)  # noqa: E501
 
@@ -77,9 +75,27 @@ class FormApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the test_form_integer_boolean_string_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return self.test_form_integer_boolean_string_with_http_info(integer_form, boolean_form, string_form, **kwargs)  # noqa: E501
+        # the arguments are validated once, by this method
+        return self.api_client.call_operation(
+            self._test_form_integer_boolean_string_operation,
+            [integer_form, boolean_form, string_form],
+            kwargs)
+
+    _test_form_integer_boolean_string_operation = OperationSpec.create(
+        'test_form_integer_boolean_string', 'POST', '/form/integer/boolean/string',
+        params=[
+            ParamSpec('integer_form', 'form', 'integer_form'),
+            ParamSpec('boolean_form', 'form', 'boolean_form'),
+            ParamSpec('string_form', 'form', 'string_form'),
+        ],
+        accepts=['text/plain'],
+        content_types=['application/x-www-form-urlencoded'],
+        response_types_map={
+            '200': "str",
+        },
+    )
 
-    @validate_call
+    @validate_arguments
     def test_form_integer_boolean_string_with_http_info(self, integer_form : Optional[StrictInt] = None, boolean_form : Optional[StrictBool] = None, string_form : Optional[StrictStr] = None, **kwargs) -> ApiResponse:  # noqa: E501
         """Test form parameter(s)  # noqa: E501
 
@@ -103,6 +119,14 @@ class FormApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -120,95 +144,12 @@ class FormApi:
                  returns the request thread.
         :rtype: tuple(str, status_code(int), headers(HTTPHeaderDict))
         """
+        return self.api_client.call_operation(
+            self._test_form_integer_boolean_string_operation,
+            [integer_form, boolean_form, string_form],
+            kwargs)
 
-        _params = locals()
-
-        _all_params = [
-            'integer_form',
-            'boolean_form',
-            'string_form'
-        ]
-        _all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method test_form_integer_boolean_string" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        if _params['integer_form'] is not None:
-            _form_params.append(('integer_form', _params['integer_form']))
-
-        if _params['boolean_form'] is not None:
-            _form_params.append(('boolean_form', _params['boolean_form']))
-
-        if _params['string_form'] is not None:
-            _form_params.append(('string_form', _params['string_form']))
-
-        # process the body parameter
-        _body_params = None
-        # set the HTTP header `Accept`
-        _header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain'])  # noqa: E501
-
-        # set the HTTP header `Content-Type`
-        _content_types_list = _params.get('_content_type',
-            self.api_client.select_header_content_type(
-                ['application/x-www-form-urlencoded']))
-        if _content_types_list:
-                _header_params['Content-Type'] = _content_types_list
-
-        # authentication setting
-        _auth_settings: List[str] = []  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-        }
-
-        return self.api_client.call_api(
-            '/form/integer/boolean/string', 'POST',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            async_req=_params.get('async_req'),
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
-
-    @validate_call
+    @validate_arguments
     def test_form_oneof(self, form1 : Optional[StrictStr] = None, form2 : Optional[StrictInt] = None, form3 : Optional[StrictStr] = None, form4 : Optional[StrictBool] = None, id : Optional[StrictInt] = None, name : Optional[StrictStr] = None, **kwargs) -> str:  # noqa: E501
         """Test form parameter(s) for oneOf schema  # noqa: E501
 
@@ -246,9 +187,30 @@ class FormApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the test_form_oneof_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return self.test_form_oneof_with_http_info(form1, form2, form3, form4, id, name, **kwargs)  # noqa: E501
+        # the arguments are validated once, by this method
+        return self.api_client.call_operation(
+            self._test_form_oneof_operation,
+            [form1, form2, form3, form4, id, name],
+            kwargs)
+
+    _test_form_oneof_operation = OperationSpec.create(
+        'test_form_oneof', 'POST', '/form/oneof',
+        params=[
+            ParamSpec('form1', 'form', 'form1'),
+            ParamSpec('form2', 'form', 'form2'),
+            ParamSpec('form3', 'form', 'form3'),
+            ParamSpec('form4', 'form', 'form4'),
+            ParamSpec('id', 'form', 'id'),
+            ParamSpec('name', 'form', 'name'),
+        ],
+        accepts=['text/plain'],
+        content_types=['application/x-www-form-urlencoded'],
+        response_types_map={
+            '200': "str",
+        },
+    )
 
-    @validate_call
+    @validate_arguments
     def test_form_oneof_with_http_info(self, form1 : Optional[StrictStr] = None, form2 : Optional[StrictInt] = None, form3 : Optional[StrictStr] = None, form4 : Optional[StrictBool] = None, id : Optional[StrictInt] = None, name : Optional[StrictStr] = None, **kwargs) -> ApiResponse:  # noqa: E501
         """Test form parameter(s) for oneOf schema  # noqa: E501
 
@@ -278,6 +240,14 @@ class FormApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -295,102 +265,7 @@ class FormApi:
                  returns the request thread.
         :rtype: tuple(str, status_code(int), headers(HTTPHeaderDict))
         """
-
-        _params = locals()
-
-        _all_params = [
-            'form1',
-            'form2',
-            'form3',
-            'form4',
-            'id',
-            'name'
-        ]
-        _all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method test_form_oneof" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        if _params['form1'] is not None:
-            _form_params.append(('form1', _params['form1']))
-
-        if _params['form2'] is not None:
-            _form_params.append(('form2', _params['form2']))
-
-        if _params['form3'] is not None:
-            _form_params.append(('form3', _params['form3']))
-
-        if _params['form4'] is not None:
-            _form_params.append(('form4', _params['form4']))
-
-        if _params['id'] is not None:
-            _form_params.append(('id', _params['id']))
-
-        if _params['name'] is not None:
-            _form_params.append(('name', _params['name']))
-
-        # process the body parameter
-        _body_params = None
-        # set the HTTP header `Accept`
-        _header_params['Accept'] = self.api_client.select_header_accept(
-            ['text/plain'])  # noqa: E501
-
-        # set the HTTP header `Content-Type`
-        _content_types_list = _params.get('_content_type',
-            self.api_client.select_header_content_type(
-                ['application/x-www-form-urlencoded']))
-        if _content_types_list:
-                _header_params['Content-Type'] = _content_types_list
-
-        # authentication setting
-        _auth_settings: List[str] = []  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "str",
-        }
-
-        return self.api_client.call_api(
-            '/form/oneof', 'POST',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            async_req=_params.get('async_req'),
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+        return self.api_client.call_operation(
+            self._test_form_oneof_operation,
+            [form1, form2, form3, form4, id, name],
+            kwargs)
@@ -17,6 +17,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from openapi_client import json_backend
+from openapi_client import serialization
+from openapi_client.validation import build_model
 
 
 from typing import List, Optional
@@ -30,6 +34,8 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+_STATUS_VALUES = frozenset(['available', 'pending', 'sold'])
+
 class Pet(BaseModel):
     """
     Pet
@@ -40,7 +46,7 @@ class Pet(BaseModel):
     photo_urls: List[StrictStr] = Field(alias="photoUrls")
     tags: Optional[List[Tag]] = None
     status: Optional[StrictStr] = Field(default=None, description="pet status in the store")
-    __properties: ClassVar[List[str]] = ["id", "name", "category", "photoUrls", "tags", "status"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["id", "name", "category", "photoUrls", "tags", "status"])
 
     @field_validator('status')
     def status_validate_enum(cls, value):
@@ -48,13 +54,14 @@ class Pet(BaseModel):
         if value is None:
             return value
 
-        if value not in ('available', 'pending', 'sold'):
+        if value not in _STATUS_VALUES:
             raise ValueError("must be one of enum values ('available', 'pending', 'sold')")
         return value
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -64,30 +71,24 @@ class Pet(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of Pet from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic by calling `to_dict()` of category
-        if self.category:
-            _dict['category'] = self.category.to_dict()
-        # override the default output from pydantic by calling `to_dict()` of each item in tags (list)
-        _items = []
-        if self.tags:
-            for _item in self.tags:
-                if _item:
-                    _items.append(_item.to_dict())
-            _dict['tags'] = _items
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         return _dict
 
     @classmethod
@@ -99,12 +100,14 @@ class Pet(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _category = obj.get("category")
+        _tags = obj.get("tags")
+        _obj = build_model(cls, {
             "id": obj.get("id"),
             "name": obj.get("name"),
-            "category": Category.from_dict(obj.get("category")) if obj.get("category") is not None else None,
+            "category": Category.from_dict(_category) if _category is not None else None,
             "photoUrls": obj.get("photoUrls"),
-            "tags": [Tag.from_dict(_item) for _item in obj.get("tags")] if obj.get("tags") is not None else None,
+            "tags": [Tag.from_dict(_item) for _item in _tags] if _tags is not None else None,
             "status": obj.get("status")
         })
         return _obj
@@ -15,9 +15,11 @@
 
 from __future__ import annotations
 import json
+from openapi_client import json_backend
 import pprint
 import re  # noqa: F401
 from enum import Enum
+from typing import Any
 
 
 
@@ -42,6 +44,11 @@ class StringEnumRef(str, Enum):
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of StringEnumRef from a JSON string"""
-        return cls(json.loads(json_str))
+        return cls(json_backend.loads(json_str))
+
+    @classmethod
+    def from_dict(cls, obj: Any) -> Self:
+        """Create an instance of StringEnumRef from a deserialized JSON value"""
+        return cls(obj)
 
 
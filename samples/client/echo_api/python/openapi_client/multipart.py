@@ -0,0 +1,219 @@
+# coding: utf-8
+
+"""
+    Echo Server API
+
+    Echo Server API
+
+    The version of the OpenAPI document: 0.1.0
+    Contact: team@openapitools.org
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import functools
+import io
+import mimetypes
+import mmap
+import os
+import uuid
+
+CHUNK_SIZE = 64 * 1024
+MIMETYPE_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=MIMETYPE_CACHE_SIZE)
+def _guess_content_type(suffix):
+    return (mimetypes.guess_type('file' + suffix)[0] or
+            'application/octet-stream')
+
+
+def guess_content_type(filename):
+    """Guesses the content type of a file from the extension of its name.
+
+    The guess is made once per extension.
+
+    :param filename: Name of the file.
+    :return: The content type, `application/octet-stream` if unknown.
+    """
+    # keep all the extensions so that e.g. `.tar.gz` is recognized
+    _, dot, suffix = os.path.basename(filename).partition('.')
+    return _guess_content_type(dot + suffix)
+
+
+def _is_buffer(source):
+    return isinstance(source, (bytes, bytearray, memoryview, mmap.mmap))
+
+
+def _format_header_param(name, value):
+    # HTML5 form encoding of header parameters, as done by urllib3
+    value = value.replace('\\', '\\\\').replace('"', '%22')
+    value = ''.join('%%%02X' % ord(c) if ord(c) < 0x20 and c != '\x1b' else c
+                    for c in value)
+    return '%s="%s"' % (name, value)
+
+
+class FilePart:
+    """A file field of a multipart body, read in chunks as it is sent.
+
+    :param source: The path of the file (str or os.PathLike), a binary file
+        object or the content (bytes, bytearray, memoryview or mmap).
+        File objects are read from their current position and are not
+        closed.
+    :param filename: Name of the file sent, defaults to the name of the file.
+    :param content_type: Content type of the file, guessed from the filename
+        by default.
+    """
+
+    def __init__(self, source, filename=None, content_type=None) -> None:
+        self.source = source
+        self._offset = None
+        if not _is_buffer(source) and hasattr(source, 'read'):
+            try:
+                if source.seekable():
+                    self._offset = source.tell()
+            except (AttributeError, OSError):
+                pass
+        if filename is None:
+            filename = self.__default_filename(source)
+        self.filename = filename
+        self.content_type = content_type or guess_content_type(filename or '')
+
+    @staticmethod
+    def __default_filename(source):
+        if isinstance(source, (str, os.PathLike)):
+            return os.path.basename(os.fspath(source))
+        name = getattr(source, 'name', None)
+        if isinstance(name, str):
+            return os.path.basename(name)
+        return None
+
+    @property
+    def length(self):
+        """Size of the content in bytes, None if it is not known upfront."""
+        source = self.source
+        if isinstance(source, (str, os.PathLike)):
+            return os.path.getsize(source)
+        if _is_buffer(source):
+            return memoryview(source).nbytes
+        if self._offset is None:
+            return None
+        try:
+            return os.fstat(source.fileno()).st_size - self._offset
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            end = source.seek(0, io.SEEK_END)
+            source.seek(self._offset)
+            return end - self._offset
+
+    def open(self):
+        """Returns a binary file object or a buffer with the content."""
+        source = self.source
+        if isinstance(source, (str, os.PathLike)):
+            return open(source, 'rb')
+        if _is_buffer(source):
+            return memoryview(source).cast('B')
+        if self._offset is not None:
+            source.seek(self._offset)
+        return source
+
+    def chunks(self, chunk_size=CHUNK_SIZE):
+        """Yields the content in chunks of at most `chunk_size` bytes."""
+        content = self.open()
+        if isinstance(content, memoryview):
+            for start in range(0, len(content), chunk_size):
+                yield content[start:start + chunk_size]
+            return
+        try:
+            chunk = content.read(chunk_size)
+            while chunk:
+                yield chunk
+                chunk = content.read(chunk_size)
+        finally:
+            if content is not self.source:
+                content.close()
+
+
+class MultipartEncoder:
+    """Streaming `multipart/form-data` encoder.
+
+    Iterating over the encoder yields the body in chunks; files are only read
+    while the body is sent, so memory use does not depend on their size. The
+    body can be iterated again, e.g. when the request is retried.
+
+    :param fields: List of (name, value) tuples. A value is a FilePart, a
+        (filename, data, content_type) tuple or a form value.
+    :param boundary: The multipart boundary, random by default.
+    :param chunk_size: Size of the chunks yielded.
+    """
+
+    def __init__(self, fields, boundary=None, chunk_size=CHUNK_SIZE) -> None:
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self.content_type = 'multipart/form-data; boundary=%s' % self.boundary
+        self.parts = [self.__encode_part(name, value)
+                      for name, value in fields]
+
+    def __encode_part(self, name, value):
+        """Returns the headers of a part and its content."""
+        if isinstance(value, tuple):
+            filename, data, content_type = (value + (None,))[:3]
+            value = FilePart(data, filename=filename,
+                             content_type=content_type)
+        disposition = 'Content-Disposition: form-data; ' + \
+            _format_header_param('name', name)
+        if isinstance(value, FilePart):
+            if value.filename is not None:
+                disposition += '; ' + _format_header_param('filename',
+                                                           value.filename)
+            headers = '%s\r\nContent-Type: %s\r\n\r\n' % (
+                disposition, value.content_type)
+        else:
+            headers = disposition + '\r\n\r\n'
+            if isinstance(value, str):
+                value = value.encode('utf-8')
+            elif not _is_buffer(value):
+                value = str(value).encode('utf-8')
+        prefix = ('--%s\r\n%s' % (self.boundary, headers)).encode('utf-8')
+        return prefix, value
+
+    @property
+    def content_length(self):
+        """Length of the body, None if the size of a file is not known."""
+        length = len(self.boundary) + 6
+        for prefix, value in self.parts:
+            size = value.length if isinstance(value, FilePart) \
+                else memoryview(value).nbytes
+            if size is None:
+                return None
+            length += len(prefix) + size + 2
+        return length
+
+    def __segments(self):
+        for prefix, value in self.parts:
+            yield prefix
+            if isinstance(value, FilePart):
+                yield from value.chunks(self.chunk_size)
+            else:
+                yield value
+            yield b'\r\n'
+        yield ('--%s--\r\n' % self.boundary).encode('utf-8')
+
+    def __iter__(self):
+        # small segments (headers, form values) are coalesced
+        buffer = bytearray()
+        for segment in self.__segments():
+            if not buffer and len(segment) >= self.chunk_size:
+                yield bytes(segment)
+                continue
+            buffer += segment
+            if len(buffer) >= self.chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    def to_bytes(self):
+        """Returns the whole body, for small bodies and tests."""
+        return b''.join(self)
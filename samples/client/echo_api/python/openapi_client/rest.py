@@ -14,7 +14,6 @@
 
 
 import io
-import json
 import logging
 import re
 import ssl
@@ -22,13 +21,46 @@ import ssl
 from urllib.parse import urlencode, quote_plus
 import urllib3
 
+from openapi_client.multipart import MultipartEncoder
 from openapi_client.exceptions import ApiException, UnauthorizedException, ForbiddenException, NotFoundException, ServiceException, ApiValueError, BadRequestException
 
 
 logger = logging.getLogger(__name__)
 
+# errors reading a response body, after which a download can be resumed
+INTERRUPTED_TRANSFER_ERRORS = (urllib3.exceptions.ProtocolError,
+                               urllib3.exceptions.ReadTimeoutError)
 
-class RESTResponse(io.IOBase):
+
+class LazilyDecodedData:
+    """Holds the `data` of a response, its body as bytes or str.
+
+    A body handed to the JSON parser as bytes is decoded on the first
+    access to `data` (see `decode_later`), so that `data` is still the
+    text of the deserialized responses.
+    """
+
+    __encoding = None
+
+    @property
+    def data(self):
+        if self.__encoding is not None:
+            self.__data = self.__data.decode(self.__encoding)
+            self.__encoding = None
+        return self.__data
+
+    @data.setter
+    def data(self, value) -> None:
+        self.__data = value
+        self.__encoding = None
+
+    def decode_later(self, encoding) -> None:
+        """Decodes the body with `encoding` on the next access to `data`."""
+        if isinstance(self.__data, bytes):
+            self.__encoding = encoding
+
+
+class RESTResponse(LazilyDecodedData, io.IOBase):
 
     def __init__(self, resp) -> None:
         self.urllib3_response = resp
@@ -80,6 +112,9 @@ class RESTClientObject:
             else:
                 maxsize = 4
 
+        # the JSON backend is looked up per request, as it may be changed
+        self.configuration = configuration
+
         # https pool manager
         if configuration.proxy:
             self.pool_manager = urllib3.ProxyManager(
@@ -157,7 +192,7 @@ class RESTClientObject:
                 if not headers.get('Content-Type') or re.search('json', headers['Content-Type'], re.IGNORECASE):
                     request_body = None
                     if body is not None:
-                        request_body = json.dumps(body)
+                        request_body = self.configuration.get_json_backend().dump_body(body)
                     r = self.pool_manager.request(
                         method, url,
                         body=request_body,
@@ -173,14 +208,17 @@ class RESTClientObject:
                         timeout=timeout,
                         headers=headers)
                 elif headers['Content-Type'] == 'multipart/form-data':
-                    # must del headers['Content-Type'], or the correct
-                    # Content-Type which generated by urllib3 will be
-                    # overwritten.
-                    del headers['Content-Type']
+                    # the body is streamed, with a chunked transfer encoding
+                    # if the size of a file is not known
+                    multipart = MultipartEncoder(post_params)
+                    headers['Content-Type'] = multipart.content_type
+                    content_length = multipart.content_length
+                    if content_length is not None:
+                        headers['Content-Length'] = str(content_length)
                     r = self.pool_manager.request(
                         method, url,
-                        fields=post_params,
-                        encode_multipart=True,
+                        body=multipart,
+                        chunked=content_length is None,
                         preload_content=_preload_content,
                         timeout=timeout,
                         headers=headers)
@@ -13,10 +13,8 @@
 
 
 import re  # noqa: F401
-import io
-import warnings
 
-from pydantic import validate_call, ValidationError
+from pydantic import ValidationError
 from typing import Dict, List, Optional, Tuple
 
 from pydantic import Field
@@ -28,7 +26,7 @@ from typing import List, Optional, Union
 from petstore_api.models.api_response import ApiResponse
 from petstore_api.models.pet import Pet
 
-from petstore_api.api_client import ApiClient
+from petstore_api.api_client import ApiClient, OperationSpec, ParamSpec, validate_arguments
 from petstore_api.api_response import ApiResponse
 from petstore_api.exceptions import (  # noqa: F401
     ApiTypeError,
@@ -48,7 +46,7 @@ class PetApi:
             api_client = ApiClient.get_default()
         self.api_client = api_client
 
-    @validate_call
+    @validate_arguments
     async def add_pet(self, pet : Annotated[Pet, Field(description="Pet object that needs to be added to the store")], **kwargs) -> None:  # noqa: E501
         """Add a new pet to the store  # noqa: E501
 
@@ -69,9 +67,22 @@ class PetApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the add_pet_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return await self.add_pet_with_http_info(pet, **kwargs)  # noqa: E501
-
-    @validate_call
+        # the arguments are validated once, by this method
+        return await self.api_client.call_operation(
+            self._add_pet_operation,
+            [pet],
+            kwargs)
+
+    _add_pet_operation = OperationSpec.create(
+        'add_pet', 'POST', '/pet',
+        params=[
+            ParamSpec('pet', 'body'),
+        ],
+        content_types=['application/json', 'application/xml'],
+        auth_settings=['petstore_auth', 'http_signature_test'],
+    )
+
+    @validate_arguments
     async def add_pet_with_http_info(self, pet : Annotated[Pet, Field(description="Pet object that needs to be added to the store")], **kwargs) -> ApiResponse:  # noqa: E501
         """Add a new pet to the store  # noqa: E501
 
@@ -84,6 +95,14 @@ class PetApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an async iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -101,79 +120,12 @@ class PetApi:
                  returns the request thread.
         :rtype: None
         """
+        return await self.api_client.call_operation(
+            self._add_pet_operation,
+            [pet],
+            kwargs)
 
-        _params = locals()
-
-        _all_params = [
-            'pet'
-        ]
-        _all_params.extend(
-            [
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method add_pet" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        # process the body parameter
-        _body_params = None
-        if _params['pet'] is not None:
-            _body_params = _params['pet']
-
-        # set the HTTP header `Content-Type`
-        _content_types_list = _params.get('_content_type',
-            self.api_client.select_header_content_type(
-                ['application/json', 'application/xml']))
-        if _content_types_list:
-                _header_params['Content-Type'] = _content_types_list
-
-        # authentication setting
-        _auth_settings: List[str] = ['petstore_auth', 'http_signature_test']  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {}
-
-        return await self.api_client.call_api(
-            '/pet', 'POST',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
-
-    @validate_call
+    @validate_arguments
     async def delete_pet(self, pet_id : Annotated[StrictInt, Field(description="Pet id to delete")], api_key : Optional[StrictStr] = None, **kwargs) -> None:  # noqa: E501
         """Deletes a pet  # noqa: E501
 
@@ -196,9 +148,22 @@ class PetApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the delete_pet_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return await self.delete_pet_with_http_info(pet_id, api_key, **kwargs)  # noqa: E501
-
-    @validate_call
+        # the arguments are validated once, by this method
+        return await self.api_client.call_operation(
+            self._delete_pet_operation,
+            [pet_id, api_key],
+            kwargs)
+
+    _delete_pet_operation = OperationSpec.create(
+        'delete_pet', 'DELETE', '/pet/{petId}',
+        params=[
+            ParamSpec('pet_id', 'path', 'petId'),
+            ParamSpec('api_key', 'header', 'api_key'),
+        ],
+        auth_settings=['petstore_auth'],
+    )
+
+    @validate_arguments
     async def delete_pet_with_http_info(self, pet_id : Annotated[StrictInt, Field(description="Pet id to delete")], api_key : Optional[StrictStr] = None, **kwargs) -> ApiResponse:  # noqa: E501
         """Deletes a pet  # noqa: E501
 
@@ -213,6 +178,14 @@ class PetApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an async iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -230,76 +203,12 @@ class PetApi:
                  returns the request thread.
         :rtype: None
         """
+        return await self.api_client.call_operation(
+            self._delete_pet_operation,
+            [pet_id, api_key],
+            kwargs)
 
-        _params = locals()
-
-        _all_params = [
-            'pet_id',
-            'api_key'
-        ]
-        _all_params.extend(
-            [
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_pet" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-        if _params['pet_id'] is not None:
-            _path_params['petId'] = _params['pet_id']
-
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        if _params['api_key'] is not None:
-            _header_params['api_key'] = _params['api_key']
-
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        # process the body parameter
-        _body_params = None
-        # authentication setting
-        _auth_settings: List[str] = ['petstore_auth']  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {}
-
-        return await self.api_client.call_api(
-            '/pet/{petId}', 'DELETE',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
-
-    @validate_call
+    @validate_arguments
     async def find_pets_by_status(self, status : Annotated[List[StrictStr], Field(description="Status values that need to be considered for filter")], **kwargs) -> List[Pet]:  # noqa: E501
         """Finds Pets by status  # noqa: E501
 
@@ -320,9 +229,26 @@ class PetApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the find_pets_by_status_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return await self.find_pets_by_status_with_http_info(status, **kwargs)  # noqa: E501
+        # the arguments are validated once, by this method
+        return await self.api_client.call_operation(
+            self._find_pets_by_status_operation,
+            [status],
+            kwargs)
+
+    _find_pets_by_status_operation = OperationSpec.create(
+        'find_pets_by_status', 'GET', '/pet/findByStatus',
+        params=[
+            ParamSpec('status', 'query', 'status', collection_format='csv'),
+        ],
+        accepts=['application/xml', 'application/json'],
+        auth_settings=['petstore_auth', 'http_signature_test'],
+        response_types_map={
+            '200': "List[Pet]",
+            '400': None,
+        },
+    )
 
-    @validate_call
+    @validate_arguments
     async def find_pets_by_status_with_http_info(self, status : Annotated[List[StrictStr], Field(description="Status values that need to be considered for filter")], **kwargs) -> ApiResponse:  # noqa: E501
         """Finds Pets by status  # noqa: E501
 
@@ -335,6 +261,14 @@ class PetApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an async iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -352,80 +286,12 @@ class PetApi:
                  returns the request thread.
         :rtype: tuple(List[Pet], status_code(int), headers(HTTPHeaderDict))
         """
+        return await self.api_client.call_operation(
+            self._find_pets_by_status_operation,
+            [status],
+            kwargs)
 
-        _params = locals()
-
-        _all_params = [
-            'status'
-        ]
-        _all_params.extend(
-            [
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method find_pets_by_status" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        if _params.get('status') is not None:  # noqa: E501
-            _query_params.append(('status', _params['status']))
-            _collection_formats['status'] = 'csv'
-
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        # process the body parameter
-        _body_params = None
-        # set the HTTP header `Accept`
-        _header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/xml', 'application/json'])  # noqa: E501
-
-        # authentication setting
-        _auth_settings: List[str] = ['petstore_auth', 'http_signature_test']  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[Pet]",
-            '400': None,
-        }
-
-        return await self.api_client.call_api(
-            '/pet/findByStatus', 'GET',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
-
-    @validate_call
+    @validate_arguments
     async def find_pets_by_tags(self, tags : Annotated[List[StrictStr], Field(description="Tags to filter by")], **kwargs) -> List[Pet]:  # noqa: E501
         """(Deprecated) Finds Pets by tags  # noqa: E501
 
@@ -446,9 +312,27 @@ class PetApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the find_pets_by_tags_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return await self.find_pets_by_tags_with_http_info(tags, **kwargs)  # noqa: E501
+        # the arguments are validated once, by this method
+        return await self.api_client.call_operation(
+            self._find_pets_by_tags_operation,
+            [tags],
+            kwargs)
+
+    _find_pets_by_tags_operation = OperationSpec.create(
+        'find_pets_by_tags', 'GET', '/pet/findByTags',
+        params=[
+            ParamSpec('tags', 'query', 'tags', collection_format='csv'),
+        ],
+        accepts=['application/xml', 'application/json'],
+        auth_settings=['petstore_auth', 'http_signature_test'],
+        response_types_map={
+            '200': "List[Pet]",
+            '400': None,
+        },
+        deprecated=True,
+    )
 
-    @validate_call
+    @validate_arguments
     async def find_pets_by_tags_with_http_info(self, tags : Annotated[List[StrictStr], Field(description="Tags to filter by")], **kwargs) -> ApiResponse:  # noqa: E501
         """(Deprecated) Finds Pets by tags  # noqa: E501
 
@@ -461,6 +345,14 @@ class PetApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an async iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -478,82 +370,12 @@ class PetApi:
                  returns the request thread.
         :rtype: tuple(List[Pet], status_code(int), headers(HTTPHeaderDict))
         """
+        return await self.api_client.call_operation(
+            self._find_pets_by_tags_operation,
+            [tags],
+            kwargs)
 
-        warnings.warn("GET /pet/findByTags is deprecated.", DeprecationWarning)
-
-        _params = locals()
-
-        _all_params = [
-            'tags'
-        ]
-        _all_params.extend(
-            [
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method find_pets_by_tags" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        if _params.get('tags') is not None:  # noqa: E501
-            _query_params.append(('tags', _params['tags']))
-            _collection_formats['tags'] = 'csv'
-
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        # process the body parameter
-        _body_params = None
-        # set the HTTP header `Accept`
-        _header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/xml', 'application/json'])  # noqa: E501
-
-        # authentication setting
-        _auth_settings: List[str] = ['petstore_auth', 'http_signature_test']  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[Pet]",
-            '400': None,
-        }
-
-        return await self.api_client.call_api(
-            '/pet/findByTags', 'GET',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
-
-    @validate_call
+    @validate_arguments
     async def get_pet_by_id(self, pet_id : Annotated[StrictInt, Field(description="ID of pet to return")], **kwargs) -> Pet:  # noqa: E501
         """Find pet by ID  # noqa: E501
 
@@ -574,9 +396,27 @@ class PetApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the get_pet_by_id_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return await self.get_pet_by_id_with_http_info(pet_id, **kwargs)  # noqa: E501
+        # the arguments are validated once, by this method
+        return await self.api_client.call_operation(
+            self._get_pet_by_id_operation,
+            [pet_id],
+            kwargs)
+
+    _get_pet_by_id_operation = OperationSpec.create(
+        'get_pet_by_id', 'GET', '/pet/{petId}',
+        params=[
+            ParamSpec('pet_id', 'path', 'petId'),
+        ],
+        accepts=['application/xml', 'application/json'],
+        auth_settings=['api_key'],
+        response_types_map={
+            '200': "Pet",
+            '400': None,
+            '404': None,
+        },
+    )
 
-    @validate_call
+    @validate_arguments
     async def get_pet_by_id_with_http_info(self, pet_id : Annotated[StrictInt, Field(description="ID of pet to return")], **kwargs) -> ApiResponse:  # noqa: E501
         """Find pet by ID  # noqa: E501
 
@@ -589,6 +429,14 @@ class PetApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an async iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -606,80 +454,12 @@ class PetApi:
                  returns the request thread.
         :rtype: tuple(Pet, status_code(int), headers(HTTPHeaderDict))
         """
+        return await self.api_client.call_operation(
+            self._get_pet_by_id_operation,
+            [pet_id],
+            kwargs)
 
-        _params = locals()
-
-        _all_params = [
-            'pet_id'
-        ]
-        _all_params.extend(
-            [
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_pet_by_id" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-        if _params['pet_id'] is not None:
-            _path_params['petId'] = _params['pet_id']
-
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        # process the body parameter
-        _body_params = None
-        # set the HTTP header `Accept`
-        _header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/xml', 'application/json'])  # noqa: E501
-
-        # authentication setting
-        _auth_settings: List[str] = ['api_key']  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "Pet",
-            '400': None,
-            '404': None,
-        }
-
-        return await self.api_client.call_api(
-            '/pet/{petId}', 'GET',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
-
-    @validate_call
+    @validate_arguments
     async def update_pet(self, pet : Annotated[Pet, Field(description="Pet object that needs to be added to the store")], **kwargs) -> None:  # noqa: E501
         """Update an existing pet  # noqa: E501
 
@@ -700,9 +480,22 @@ class PetApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the update_pet_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return await self.update_pet_with_http_info(pet, **kwargs)  # noqa: E501
-
-    @validate_call
+        # the arguments are validated once, by this method
+        return await self.api_client.call_operation(
+            self._update_pet_operation,
+            [pet],
+            kwargs)
+
+    _update_pet_operation = OperationSpec.create(
+        'update_pet', 'PUT', '/pet',
+        params=[
+            ParamSpec('pet', 'body'),
+        ],
+        content_types=['application/json', 'application/xml'],
+        auth_settings=['petstore_auth', 'http_signature_test'],
+    )
+
+    @validate_arguments
     async def update_pet_with_http_info(self, pet : Annotated[Pet, Field(description="Pet object that needs to be added to the store")], **kwargs) -> ApiResponse:  # noqa: E501
         """Update an existing pet  # noqa: E501
 
@@ -715,6 +508,14 @@ class PetApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an async iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -732,79 +533,12 @@ class PetApi:
                  returns the request thread.
         :rtype: None
         """
+        return await self.api_client.call_operation(
+            self._update_pet_operation,
+            [pet],
+            kwargs)
 
-        _params = locals()
-
-        _all_params = [
-            'pet'
-        ]
-        _all_params.extend(
-            [
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method update_pet" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        # process the body parameter
-        _body_params = None
-        if _params['pet'] is not None:
-            _body_params = _params['pet']
-
-        # set the HTTP header `Content-Type`
-        _content_types_list = _params.get('_content_type',
-            self.api_client.select_header_content_type(
-                ['application/json', 'application/xml']))
-        if _content_types_list:
-                _header_params['Content-Type'] = _content_types_list
-
-        # authentication setting
-        _auth_settings: List[str] = ['petstore_auth', 'http_signature_test']  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {}
-
-        return await self.api_client.call_api(
-            '/pet', 'PUT',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
-
-    @validate_call
+    @validate_arguments
     async def update_pet_with_form(self, pet_id : Annotated[StrictInt, Field(description="ID of pet that needs to be updated")], name : Annotated[Optional[StrictStr], Field(description="Updated name of the pet")] = None, status : Annotated[Optional[StrictStr], Field(description="Updated status of the pet")] = None, **kwargs) -> None:  # noqa: E501
         """Updates a pet in the store with form data  # noqa: E501
 
@@ -829,9 +563,24 @@ class PetApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the update_pet_with_form_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return await self.update_pet_with_form_with_http_info(pet_id, name, status, **kwargs)  # noqa: E501
-
-    @validate_call
+        # the arguments are validated once, by this method
+        return await self.api_client.call_operation(
+            self._update_pet_with_form_operation,
+            [pet_id, name, status],
+            kwargs)
+
+    _update_pet_with_form_operation = OperationSpec.create(
+        'update_pet_with_form', 'POST', '/pet/{petId}',
+        params=[
+            ParamSpec('pet_id', 'path', 'petId'),
+            ParamSpec('name', 'form', 'name'),
+            ParamSpec('status', 'form', 'status'),
+        ],
+        content_types=['application/x-www-form-urlencoded'],
+        auth_settings=['petstore_auth'],
+    )
+
+    @validate_arguments
     async def update_pet_with_form_with_http_info(self, pet_id : Annotated[StrictInt, Field(description="ID of pet that needs to be updated")], name : Annotated[Optional[StrictStr], Field(description="Updated name of the pet")] = None, status : Annotated[Optional[StrictStr], Field(description="Updated status of the pet")] = None, **kwargs) -> ApiResponse:  # noqa: E501
         """Updates a pet in the store with form data  # noqa: E501
 
@@ -848,6 +597,14 @@ class PetApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an async iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -865,87 +622,12 @@ class PetApi:
                  returns the request thread.
         :rtype: None
         """
+        return await self.api_client.call_operation(
+            self._update_pet_with_form_operation,
+            [pet_id, name, status],
+            kwargs)
 
-        _params = locals()
-
-        _all_params = [
-            'pet_id',
-            'name',
-            'status'
-        ]
-        _all_params.extend(
-            [
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method update_pet_with_form" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-        if _params['pet_id'] is not None:
-            _path_params['petId'] = _params['pet_id']
-
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        if _params['name'] is not None:
-            _form_params.append(('name', _params['name']))
-
-        if _params['status'] is not None:
-            _form_params.append(('status', _params['status']))
-
-        # process the body parameter
-        _body_params = None
-        # set the HTTP header `Content-Type`
-        _content_types_list = _params.get('_content_type',
-            self.api_client.select_header_content_type(
-                ['application/x-www-form-urlencoded']))
-        if _content_types_list:
-                _header_params['Content-Type'] = _content_types_list
-
-        # authentication setting
-        _auth_settings: List[str] = ['petstore_auth']  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {}
-
-        return await self.api_client.call_api(
-            '/pet/{petId}', 'POST',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
-
-    @validate_call
+    @validate_arguments
     async def upload_file(self, pet_id : Annotated[StrictInt, Field(description="ID of pet to update")], additional_metadata : Annotated[Optional[StrictStr], Field(description="Additional data to pass to server")] = None, file : Annotated[Optional[Union[StrictBytes, StrictStr]], Field(description="file to upload")] = None, **kwargs) -> ApiResponse:  # noqa: E501
         """uploads an image  # noqa: E501
 
@@ -970,9 +652,28 @@ class PetApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the upload_file_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return await self.upload_file_with_http_info(pet_id, additional_metadata, file, **kwargs)  # noqa: E501
+        # the arguments are validated once, by this method
+        return await self.api_client.call_operation(
+            self._upload_file_operation,
+            [pet_id, additional_metadata, file],
+            kwargs)
+
+    _upload_file_operation = OperationSpec.create(
+        'upload_file', 'POST', '/pet/{petId}/uploadImage',
+        params=[
+            ParamSpec('pet_id', 'path', 'petId'),
+            ParamSpec('additional_metadata', 'form', 'additionalMetadata'),
+            ParamSpec('file', 'file', 'file'),
+        ],
+        accepts=['application/json'],
+        content_types=['multipart/form-data'],
+        auth_settings=['petstore_auth'],
+        response_types_map={
+            '200': "ApiResponse",
+        },
+    )
 
-    @validate_call
+    @validate_arguments
     async def upload_file_with_http_info(self, pet_id : Annotated[StrictInt, Field(description="ID of pet to update")], additional_metadata : Annotated[Optional[StrictStr], Field(description="Additional data to pass to server")] = None, file : Annotated[Optional[Union[StrictBytes, StrictStr]], Field(description="file to upload")] = None, **kwargs) -> ApiResponse:  # noqa: E501
         """uploads an image  # noqa: E501
 
@@ -989,6 +690,14 @@ class PetApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an async iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -1006,93 +715,12 @@ class PetApi:
                  returns the request thread.
         :rtype: tuple(ApiResponse, status_code(int), headers(HTTPHeaderDict))
         """
+        return await self.api_client.call_operation(
+            self._upload_file_operation,
+            [pet_id, additional_metadata, file],
+            kwargs)
 
-        _params = locals()
-
-        _all_params = [
-            'pet_id',
-            'additional_metadata',
-            'file'
-        ]
-        _all_params.extend(
-            [
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method upload_file" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-        if _params['pet_id'] is not None:
-            _path_params['petId'] = _params['pet_id']
-
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        if _params['additional_metadata'] is not None:
-            _form_params.append(('additionalMetadata', _params['additional_metadata']))
-
-        if _params['file'] is not None:
-            _files['file'] = _params['file']
-
-        # process the body parameter
-        _body_params = None
-        # set the HTTP header `Accept`
-        _header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # set the HTTP header `Content-Type`
-        _content_types_list = _params.get('_content_type',
-            self.api_client.select_header_content_type(
-                ['multipart/form-data']))
-        if _content_types_list:
-                _header_params['Content-Type'] = _content_types_list
-
-        # authentication setting
-        _auth_settings: List[str] = ['petstore_auth']  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ApiResponse",
-        }
-
-        return await self.api_client.call_api(
-            '/pet/{petId}/uploadImage', 'POST',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
-
-    @validate_call
+    @validate_arguments
     async def upload_file_with_required_file(self, pet_id : Annotated[StrictInt, Field(description="ID of pet to update")], required_file : Annotated[Union[StrictBytes, StrictStr], Field(description="file to upload")], additional_metadata : Annotated[Optional[StrictStr], Field(description="Additional data to pass to server")] = None, **kwargs) -> ApiResponse:  # noqa: E501
         """uploads an image (required)  # noqa: E501
 
@@ -1117,9 +745,28 @@ class PetApi:
         if '_preload_content' in kwargs:
             message = "Error! Please call the upload_file_with_required_file_with_http_info method with `_preload_content` instead and obtain raw data from ApiResponse.raw_data"  # noqa: E501
             raise ValueError(message)
-        return await self.upload_file_with_required_file_with_http_info(pet_id, required_file, additional_metadata, **kwargs)  # noqa: E501
+        # the arguments are validated once, by this method
+        return await self.api_client.call_operation(
+            self._upload_file_with_required_file_operation,
+            [pet_id, required_file, additional_metadata],
+            kwargs)
+
+    _upload_file_with_required_file_operation = OperationSpec.create(
+        'upload_file_with_required_file', 'POST', '/fake/{petId}/uploadImageWithRequiredFile',
+        params=[
+            ParamSpec('pet_id', 'path', 'petId'),
+            ParamSpec('required_file', 'file', 'requiredFile'),
+            ParamSpec('additional_metadata', 'form', 'additionalMetadata'),
+        ],
+        accepts=['application/json'],
+        content_types=['multipart/form-data'],
+        auth_settings=['petstore_auth'],
+        response_types_map={
+            '200': "ApiResponse",
+        },
+    )
 
-    @validate_call
+    @validate_arguments
     async def upload_file_with_required_file_with_http_info(self, pet_id : Annotated[StrictInt, Field(description="ID of pet to update")], required_file : Annotated[Union[StrictBytes, StrictStr], Field(description="file to upload")], additional_metadata : Annotated[Optional[StrictStr], Field(description="Additional data to pass to server")] = None, **kwargs) -> ApiResponse:  # noqa: E501
         """uploads an image (required)  # noqa: E501
 
@@ -1136,6 +783,14 @@ class PetApi:
                                  HTTP response body without reading/decoding.
                                  Default is True.
         :type _preload_content: bool, optional
+        :param _stream: if True, a JSON array response is parsed incrementally
+                        while it is read and the data is an async iterator
+                        of the deserialized items. Default is False.
+        :type _stream: bool, optional
+        :param _download: a path, or True for a file in the temp folder:
+                          the response body is streamed to the file and the
+                          data is a DownloadedFile. Default is None.
+        :type _download: str or bool, optional
         :param _return_http_data_only: response data instead of ApiResponse
                                        object with status code, headers, etc
         :type _return_http_data_only: bool, optional
@@ -1153,88 +808,7 @@ class PetApi:
                  returns the request thread.
         :rtype: tuple(ApiResponse, status_code(int), headers(HTTPHeaderDict))
         """
-
-        _params = locals()
-
-        _all_params = [
-            'pet_id',
-            'required_file',
-            'additional_metadata'
-        ]
-        _all_params.extend(
-            [
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout',
-                '_request_auth',
-                '_content_type',
-                '_headers'
-            ]
-        )
-
-        # validate the arguments
-        for _key, _val in _params['kwargs'].items():
-            if _key not in _all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method upload_file_with_required_file" % _key
-                )
-            _params[_key] = _val
-        del _params['kwargs']
-
-        _collection_formats: Dict[str, str] = {}
-
-        # process the path parameters
-        _path_params: Dict[str, str] = {}
-        if _params['pet_id'] is not None:
-            _path_params['petId'] = _params['pet_id']
-
-
-        # process the query parameters
-        _query_params: List[Tuple[str, str]] = []
-        # process the header parameters
-        _header_params = dict(_params.get('_headers', {}))
-        # process the form parameters
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, str] = {}
-        if _params['additional_metadata'] is not None:
-            _form_params.append(('additionalMetadata', _params['additional_metadata']))
-
-        if _params['required_file'] is not None:
-            _files['requiredFile'] = _params['required_file']
-
-        # process the body parameter
-        _body_params = None
-        # set the HTTP header `Accept`
-        _header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # set the HTTP header `Content-Type`
-        _content_types_list = _params.get('_content_type',
-            self.api_client.select_header_content_type(
-                ['multipart/form-data']))
-        if _content_types_list:
-                _header_params['Content-Type'] = _content_types_list
-
-        # authentication setting
-        _auth_settings: List[str] = ['petstore_auth']  # noqa: E501
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ApiResponse",
-        }
-
-        return await self.api_client.call_api(
-            '/fake/{petId}/uploadImageWithRequiredFile', 'POST',
-            _path_params,
-            _query_params,
-            _header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            response_types_map=_response_types_map,
-            auth_settings=_auth_settings,
-            _return_http_data_only=_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=_params.get('_preload_content', True),
-            _request_timeout=_params.get('_request_timeout'),
-            collection_formats=_collection_formats,
-            _request_auth=_params.get('_request_auth'))
+        return await self.api_client.call_operation(
+            self._upload_file_with_required_file_operation,
+            [pet_id, required_file, additional_metadata],
+            kwargs)
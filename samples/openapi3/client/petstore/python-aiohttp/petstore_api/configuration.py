@@ -15,10 +15,14 @@
 import copy
 import logging
 import sys
+import threading
+import time
 import urllib3
 
 import http.client as httplib
 
+from petstore_api.json_backend import get_backend
+
 JSON_SCHEMA_VALIDATION_KEYWORDS = {
     'multipleOf', 'maximum', 'exclusiveMaximum',
     'minimum', 'exclusiveMinimum', 'maxLength',
@@ -147,6 +151,8 @@ conf = petstore_api.Configuration(
         self._base_path = "http://petstore.swagger.io:80/v2" if host is None else host
         """Default Base url
         """
+        self.__host = None
+        self.__operation_hosts = {}
         self.server_index = 0 if server_index is None and host is None else server_index
         self.server_operation_index = server_operation_index or {}
         """Default server index
@@ -158,6 +164,21 @@ conf = petstore_api.Configuration(
         self.temp_folder_path = None
         """Temp file folder for downloading files
         """
+        self.download_chunk_size = 64 * 1024
+        """Size of the chunks in which downloaded files are written to disk
+        """
+        self.download_digest = None
+        """Name of the hashlib algorithm (e.g. sha256) used to compute the
+           digest of downloaded files while they are written
+        """
+        self.download_resume_attempts = 3
+        """Number of times an interrupted download is resumed with a
+           `Range` request
+        """
+        self.coalesce_requests = False
+        """Whether concurrent identical GET/HEAD requests of a client share a
+           single call and its result (the same deserialized data)
+        """
         # Authentication Settings
         self.api_key = {}
         if api_key:
@@ -171,7 +192,18 @@ conf = petstore_api.Configuration(
         """
         self.refresh_api_key_hook = None
         """function hook to refresh API key if expired
-        """
+           It is called with the configuration before the API keys are used,
+           and may return the number of seconds the keys it sets are valid:
+           it is then only called again when they are about to expire.
+        """
+        self.refresh_api_key_ahead = 0
+        """Number of seconds before the API keys expire at which
+           refresh_api_key_hook is run in a background thread, while the
+           current keys are still used
+        """
+        self.__api_key_expires_at = None
+        self.__refresh_lock = threading.Lock()
+        self.__auth_settings = None
         self.username = username
         """Username for HTTP basic authentication
         """
@@ -246,8 +278,25 @@ conf = petstore_api.Configuration(
         self.retries = None
         """Adding retries to override urllib3 default value 3
         """
-        # Enable client side validation
         self.client_side_validation = True
+        """Whether the arguments of the API operation methods are validated
+           (see petstore_api.api_client.validate_arguments); disable it to
+           skip the validation overhead for trusted callers
+        """
+
+        self.trust_responses = False
+        """Whether the models of the responses are built without validating
+           them (see petstore_api.validation.trusted), for a trusted server
+        """
+        self.trusted_validation_rate = 0.0
+        """Fraction of the responses validated anyway when trust_responses is
+           set, e.g. 0.01 to catch schema drifts on 1% of them
+        """
+        self.compact_responses = False
+        """Whether the models of the responses are built in a compact
+           representation (see petstore_api.validation.compact), e.g. to
+           hold many of them in memory
+        """
 
         self.socket_options = None
         """Options to pass down to the underlying urllib3 socket
@@ -261,13 +310,19 @@ conf = petstore_api.Configuration(
         """date format
         """
 
+        self.json_backend = "json"
+        """JSON library used to encode and decode JSON documents
+        """
+
     def __deepcopy__(self, memo):
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            if k not in ('logger', 'logger_file_handler'):
+            if k not in ('logger', 'logger_file_handler',
+                         '_Configuration__refresh_lock'):
                 setattr(result, k, copy.deepcopy(v, memo))
+        result.__refresh_lock = threading.Lock()
         # shallow copy of loggers
         result.logger = copy.copy(self.logger)
         # use setters to configure loggers
@@ -402,6 +457,84 @@ conf = petstore_api.Configuration(
         self.__logger_format = value
         self.logger_formatter = logging.Formatter(self.__logger_format)
 
+    @property
+    def json_backend(self):
+        """The JSON library used to encode and decode JSON documents.
+
+        One of `json` (the standard library, default), `orjson` or `ujson`.
+        The models' `to_json` and `from_json` use the library selected in
+        the default configuration.
+
+        :param value: The name of the JSON library.
+        :type: str
+        """
+        return self.__json_backend
+
+    @json_backend.setter
+    def json_backend(self, value):
+        """The JSON library used to encode and decode JSON documents.
+
+        :param value: The name of the JSON library.
+        :type: str
+        """
+        # fail early if the library is unknown or not installed
+        get_backend(value)
+        self.__json_backend = value
+
+    def get_json_backend(self):
+        """Gets the encoder/decoder of the selected JSON library.
+
+        :return: The JsonBackend instance.
+        """
+        return get_backend(self.__json_backend)
+
+    def __run_refresh_api_key_hook(self, hook):
+        lifetime = hook(self)
+        if isinstance(lifetime, (int, float)) and not isinstance(lifetime, bool):
+            self.__api_key_expires_at = time.monotonic() + lifetime
+        else:
+            self.__api_key_expires_at = None
+
+    def __refresh_api_key_in_background(self, hook):
+        try:
+            self.__run_refresh_api_key_hook(hook)
+        except Exception:
+            # the current keys are used until they expire, the hook is then
+            # run again before the next request
+            self.logger["package_logger"].exception(
+                "refresh_api_key_hook failed")
+        finally:
+            self.__refresh_lock.release()
+
+    def refresh_api_key(self):
+        """Runs refresh_api_key_hook when the API keys it set last have
+        expired or are about to.
+
+        Keys close to their expiration (see refresh_api_key_ahead) are
+        refreshed in a background thread; expired keys are refreshed before
+        returning, once for all the threads using the configuration.
+        """
+        hook = self.refresh_api_key_hook
+        if hook is None:
+            return
+        expires_at = self.__api_key_expires_at
+        if expires_at is None:
+            # no lifetime given, the hook is run every time
+            self.__run_refresh_api_key_hook(hook)
+            return
+        remaining = expires_at - time.monotonic()
+        if remaining > self.refresh_api_key_ahead:
+            return
+        if remaining > 0:
+            if self.__refresh_lock.acquire(blocking=False):
+                threading.Thread(target=self.__refresh_api_key_in_background,
+                                 args=(hook,), daemon=True).start()
+            return
+        with self.__refresh_lock:
+            # unless another thread refreshed them meanwhile
+            if self.__api_key_expires_at == expires_at:
+                self.__run_refresh_api_key_hook(hook)
+
     def get_api_key_with_prefix(self, identifier, alias=None):
         """Gets API key (with prefix if set).
 
@@ -409,8 +542,10 @@ conf = petstore_api.Configuration(
         :param alias: The alternative identifier of apiKey.
         :return: The token for api key authentication.
         """
-        if self.refresh_api_key_hook is not None:
-            self.refresh_api_key_hook(self)
+        self.refresh_api_key()
+        return self.__api_key_with_prefix(identifier, alias)
+
+    def __api_key_with_prefix(self, identifier, alias=None):
         key = self.api_key.get(identifier, self.api_key.get(alias) if alias is not None else None)
         if key:
             prefix = self.api_key_prefix.get(identifier)
@@ -437,8 +572,23 @@ conf = petstore_api.Configuration(
     def auth_settings(self):
         """Gets Auth Settings dict for api client.
 
+        The dict is only built again when the credentials change; it is
+        shared between requests and must not be modified.
+
         :return: The Auth Settings information dict.
         """
+        self.refresh_api_key()
+        credentials = (tuple(self.api_key.items()),
+                       tuple(self.api_key_prefix.items()),
+                       self.username, self.password, self.access_token,
+                       self.signing_info)
+        cached = self.__auth_settings
+        if cached is None or cached[0] != credentials:
+            cached = self.__auth_settings = (credentials,
+                                             self.__build_auth_settings())
+        return cached[1]
+
+    def __build_auth_settings(self):
         auth = {}
         if self.access_token is not None:
             auth['petstore_auth'] = {
@@ -452,7 +602,7 @@ conf = petstore_api.Configuration(
                 'type': 'api_key',
                 'in': 'header',
                 'key': 'api_key',
-                'value': self.get_api_key_with_prefix(
+                'value': self.__api_key_with_prefix(
                     'api_key',
                 ),
             }
@@ -461,7 +611,7 @@ conf = petstore_api.Configuration(
                 'type': 'api_key',
                 'in': 'query',
                 'key': 'api_key_query',
-                'value': self.get_api_key_with_prefix(
+                'value': self.__api_key_with_prefix(
                     'api_key_query',
                 ),
             }
@@ -589,10 +739,43 @@ conf = petstore_api.Configuration(
 
         return url
 
+    def get_operation_host(self, operation_id, servers, index=None):
+        """Gets the host URL of an operation defining its own servers.
+
+        The URL is only resolved once per server index and variables.
+
+        :param operation_id: The operation ID.
+        :param servers: The servers of the operation, see get_host_settings.
+        :param index: Index of the server, defaults to the index of the
+                      operation in server_operation_index, or 0.
+        :return: URL of the server.
+        """
+        if index is None:
+            index = self.server_operation_index.get(operation_id, 0)
+        variables = self.server_operation_variables.get(
+            operation_id, self.server_variables)
+        key = (operation_id, index, tuple(variables.items()))
+        url = self.__operation_hosts.get(key)
+        if url is None:
+            url = self.get_host_from_settings(index, variables=variables,
+                                              servers=servers)
+            self.__operation_hosts[key] = url
+        return url
+
     @property
     def host(self):
-        """Return generated host."""
-        return self.get_host_from_settings(self.server_index, variables=self.server_variables)
+        """Return generated host.
+
+        It is only resolved again when the base path, the server index or
+        the server variables change.
+        """
+        key = (self._base_path, self.server_index,
+               tuple(self.server_variables.items()))
+        cached = self.__host
+        if cached is None or cached[0] != key:
+            cached = self.__host = (key, self.get_host_from_settings(
+                self.server_index, variables=self.server_variables))
+        return cached[1]
 
     @host.setter
     def host(self, value):
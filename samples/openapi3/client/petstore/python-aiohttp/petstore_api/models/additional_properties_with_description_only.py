@@ -16,6 +16,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api.validation import build_model
 
 
 from typing import Optional
@@ -32,39 +36,53 @@ class AdditionalPropertiesWithDescriptionOnly(BaseModel):
     """
     name: Optional[StrictStr] = None
     additional_properties: Dict[str, Any] = {}
-    __properties: ClassVar[List[str]] = ["name"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["name"])
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
+    def __getattr__(self, name: str) -> Any:
+        """Allocates the additional properties of compact models on first
+        access, see petstore_api.validation.compact"""
+        if name == "additional_properties":
+            self.__dict__[name] = {}
+            return self.__dict__[name]
+        return super().__getattr__(name)
+
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
         return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of AdditionalPropertiesWithDescriptionOnly from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                            "additional_properties"
-                          },
-                          exclude_none=True)
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         # puts key-value pairs in additional_properties in the top level
-        if self.additional_properties is not None:
-            for _key, _value in self.additional_properties.items():
-                _dict[_key] = _value
+        _dict.pop("additional_properties", None)
+        # not allocated by compact models while empty
+        _additional_properties = self.__dict__.get("additional_properties")
+        if _additional_properties is not None:
+            _dict.update(_additional_properties)
 
         return _dict
 
@@ -77,13 +95,13 @@ class AdditionalPropertiesWithDescriptionOnly(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _obj = build_model(cls, {
             "name": obj.get("name")
         })
         # store additional fields in additional_properties
-        for _key in obj.keys():
+        for _key, _value in obj.items():
             if _key not in cls.__properties:
-                _obj.additional_properties[_key] = obj.get(_key)
+                _obj.additional_properties[_key] = _value
 
         return _obj
 
@@ -16,6 +16,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api.validation import build_model
 
 
 from typing import List, Optional
@@ -32,11 +36,12 @@ class ArrayOfArrayOfModel(BaseModel):
     ArrayOfArrayOfModel
     """
     another_property: Optional[List[List[Tag]]] = None
-    __properties: ClassVar[List[str]] = ["another_property"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["another_property"])
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -46,29 +51,30 @@ class ArrayOfArrayOfModel(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of ArrayOfArrayOfModel from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic by calling `to_dict()` of each item in another_property (list of list)
-        _items = []
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
+        # leave out the empty lists in another_property (list of list)
         if self.another_property:
-            for _item in self.another_property:
-                if _item:
-                    _items.append(
-                         [_inner_item.to_dict() for _inner_item in _item if _inner_item is not None]
-                    )
-            _dict['another_property'] = _items
+            _dict['another_property'] = [
+                [_inner_item for _inner_item in _item if _inner_item is not None]
+                for _item in _dict['another_property'] if _item
+            ]
         return _dict
 
     @classmethod
@@ -80,11 +86,12 @@ class ArrayOfArrayOfModel(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _another_property = obj.get("another_property")
+        _obj = build_model(cls, {
             "another_property": [
                     [Tag.from_dict(_inner_item) for _inner_item in _item]
-                    for _item in obj.get("another_property")
-                ] if obj.get("another_property") is not None else None
+                    for _item in _another_property
+                ] if _another_property is not None else None
         })
         return _obj
 
@@ -16,6 +16,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api.validation import build_model
 
 
 from typing import List, Optional
@@ -36,11 +40,12 @@ class ArrayTest(BaseModel):
     array_of_string: Optional[Annotated[List[StrictStr], Field(min_length=0, max_length=3)]] = None
     array_array_of_integer: Optional[List[List[StrictInt]]] = None
     array_array_of_model: Optional[List[List[ReadOnlyFirst]]] = None
-    __properties: ClassVar[List[str]] = ["array_of_string", "array_array_of_integer", "array_array_of_model"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["array_of_string", "array_array_of_integer", "array_array_of_model"])
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -50,29 +55,30 @@ class ArrayTest(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of ArrayTest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic by calling `to_dict()` of each item in array_array_of_model (list of list)
-        _items = []
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
+        # leave out the empty lists in array_array_of_model (list of list)
         if self.array_array_of_model:
-            for _item in self.array_array_of_model:
-                if _item:
-                    _items.append(
-                         [_inner_item.to_dict() for _inner_item in _item if _inner_item is not None]
-                    )
-            _dict['array_array_of_model'] = _items
+            _dict['array_array_of_model'] = [
+                [_inner_item for _inner_item in _item if _inner_item is not None]
+                for _item in _dict['array_array_of_model'] if _item
+            ]
         return _dict
 
     @classmethod
@@ -84,13 +90,14 @@ class ArrayTest(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _array_array_of_model = obj.get("array_array_of_model")
+        _obj = build_model(cls, {
             "array_of_string": obj.get("array_of_string"),
             "array_array_of_integer": obj.get("array_array_of_integer"),
             "array_array_of_model": [
                     [ReadOnlyFirst.from_dict(_inner_item) for _inner_item in _item]
-                    for _item in obj.get("array_array_of_model")
-                ] if obj.get("array_array_of_model") is not None else None
+                    for _item in _array_array_of_model
+                ] if _array_array_of_model is not None else None
         })
         return _obj
 
@@ -16,6 +16,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api.validation import build_model
 
 
 from typing import Optional
@@ -32,11 +36,12 @@ class CircularReferenceModel(BaseModel):
     """
     size: Optional[StrictInt] = None
     nested: Optional[FirstRef] = None
-    __properties: ClassVar[List[str]] = ["size", "nested"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["size", "nested"])
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -46,23 +51,24 @@ class CircularReferenceModel(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of CircularReferenceModel from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic by calling `to_dict()` of nested
-        if self.nested:
-            _dict['nested'] = self.nested.to_dict()
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         return _dict
 
     @classmethod
@@ -74,9 +80,10 @@ class CircularReferenceModel(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _nested = obj.get("nested")
+        _obj = build_model(cls, {
             "size": obj.get("size"),
-            "nested": FirstRef.from_dict(obj.get("nested")) if obj.get("nested") is not None else None
+            "nested": FirstRef.from_dict(_nested) if _nested is not None else None
         })
         return _obj
 
@@ -16,6 +16,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api.validation import build_model
 
 
 from typing import List, Optional
@@ -26,13 +30,17 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+_JUST_SYMBOL_VALUES = frozenset(['>=', '$'])
+
+_ARRAY_ENUM_VALUES = ('fish', 'crab')
+
 class EnumArrays(BaseModel):
     """
     EnumArrays
     """
     just_symbol: Optional[StrictStr] = None
     array_enum: Optional[List[StrictStr]] = None
-    __properties: ClassVar[List[str]] = ["just_symbol", "array_enum"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["just_symbol", "array_enum"])
 
     @field_validator('just_symbol')
     def just_symbol_validate_enum(cls, value):
@@ -40,7 +48,7 @@ class EnumArrays(BaseModel):
         if value is None:
             return value
 
-        if value not in ('>=', '$'):
+        if value not in _JUST_SYMBOL_VALUES:
             raise ValueError("must be one of enum values ('>=', '$')")
         return value
 
@@ -51,13 +59,14 @@ class EnumArrays(BaseModel):
             return value
 
         for i in value:
-            if i not in ('fish', 'crab'):
+            if i not in _ARRAY_ENUM_VALUES:
                 raise ValueError("each list item must be one of ('fish', 'crab')")
         return value
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -67,20 +76,24 @@ class EnumArrays(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of EnumArrays from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         return _dict
 
     @classmethod
@@ -92,7 +105,7 @@ class EnumArrays(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _obj = build_model(cls, {
             "just_symbol": obj.get("just_symbol"),
             "array_enum": obj.get("array_enum")
         })
@@ -14,9 +14,11 @@
 
 from __future__ import annotations
 import json
+from petstore_api import json_backend
 import pprint
 import re  # noqa: F401
 from enum import Enum
+from typing import Any
 
 
 
@@ -41,6 +43,11 @@ class EnumClass(str, Enum):
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of EnumClass from a JSON string"""
-        return cls(json.loads(json_str))
+        return cls(json_backend.loads(json_str))
+
+    @classmethod
+    def from_dict(cls, obj: Any) -> Self:
+        """Create an instance of EnumClass from a deserialized JSON value"""
+        return cls(obj)
 
 
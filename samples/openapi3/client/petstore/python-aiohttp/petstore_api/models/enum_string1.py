@@ -14,9 +14,11 @@
 
 from __future__ import annotations
 import json
+from petstore_api import json_backend
 import pprint
 import re  # noqa: F401
 from enum import Enum
+from typing import Any
 
 
 
@@ -40,6 +42,11 @@ class EnumString1(str, Enum):
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of EnumString1 from a JSON string"""
-        return cls(json.loads(json_str))
+        return cls(json_backend.loads(json_str))
+
+    @classmethod
+    def from_dict(cls, obj: Any) -> Self:
+        """Create an instance of EnumString1 from a deserialized JSON value"""
+        return cls(obj)
 
 
@@ -16,6 +16,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api.validation import build_model
 
 
 from typing import Optional
@@ -31,6 +35,16 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+_ENUM_STRING_VALUES = frozenset(['UPPER', 'lower', ''])
+
+_ENUM_STRING_REQUIRED_VALUES = frozenset(['UPPER', 'lower', ''])
+
+_ENUM_INTEGER_DEFAULT_VALUES = frozenset([1, 5, 14])
+
+_ENUM_INTEGER_VALUES = frozenset([1, -1])
+
+_ENUM_NUMBER_VALUES = frozenset([1.1, -1.2])
+
 class EnumTest(BaseModel):
     """
     EnumTest
@@ -44,7 +58,7 @@ class EnumTest(BaseModel):
     outer_enum_integer: Optional[OuterEnumInteger] = Field(default=None, alias="outerEnumInteger")
     outer_enum_default_value: Optional[OuterEnumDefaultValue] = Field(default=None, alias="outerEnumDefaultValue")
     outer_enum_integer_default_value: Optional[OuterEnumIntegerDefaultValue] = Field(default=None, alias="outerEnumIntegerDefaultValue")
-    __properties: ClassVar[List[str]] = ["enum_string", "enum_string_required", "enum_integer_default", "enum_integer", "enum_number", "outerEnum", "outerEnumInteger", "outerEnumDefaultValue", "outerEnumIntegerDefaultValue"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["enum_string", "enum_string_required", "enum_integer_default", "enum_integer", "enum_number", "outerEnum", "outerEnumInteger", "outerEnumDefaultValue", "outerEnumIntegerDefaultValue"])
 
     @field_validator('enum_string')
     def enum_string_validate_enum(cls, value):
@@ -52,14 +66,14 @@ class EnumTest(BaseModel):
         if value is None:
             return value
 
-        if value not in ('UPPER', 'lower', ''):
+        if value not in _ENUM_STRING_VALUES:
             raise ValueError("must be one of enum values ('UPPER', 'lower', '')")
         return value
 
     @field_validator('enum_string_required')
     def enum_string_required_validate_enum(cls, value):
         """Validates the enum"""
-        if value not in ('UPPER', 'lower', ''):
+        if value not in _ENUM_STRING_REQUIRED_VALUES:
             raise ValueError("must be one of enum values ('UPPER', 'lower', '')")
         return value
 
@@ -69,7 +83,7 @@ class EnumTest(BaseModel):
         if value is None:
             return value
 
-        if value not in (1, 5, 14):
+        if value not in _ENUM_INTEGER_DEFAULT_VALUES:
             raise ValueError("must be one of enum values (1, 5, 14)")
         return value
 
@@ -79,7 +93,7 @@ class EnumTest(BaseModel):
         if value is None:
             return value
 
-        if value not in (1, -1):
+        if value not in _ENUM_INTEGER_VALUES:
             raise ValueError("must be one of enum values (1, -1)")
         return value
 
@@ -89,13 +103,14 @@ class EnumTest(BaseModel):
         if value is None:
             return value
 
-        if value not in (1.1, -1.2):
+        if value not in _ENUM_NUMBER_VALUES:
             raise ValueError("must be one of enum values (1.1, -1.2)")
         return value
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -105,20 +120,24 @@ class EnumTest(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of EnumTest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         # set to None if outer_enum (nullable) is None
         # and model_fields_set contains the field
         if self.outer_enum is None and "outer_enum" in self.model_fields_set:
@@ -135,10 +154,11 @@ class EnumTest(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _enum_integer_default = obj.get("enum_integer_default")
+        _obj = build_model(cls, {
             "enum_string": obj.get("enum_string"),
             "enum_string_required": obj.get("enum_string_required"),
-            "enum_integer_default": obj.get("enum_integer_default") if obj.get("enum_integer_default") is not None else 5,
+            "enum_integer_default": _enum_integer_default if _enum_integer_default is not None else 5,
             "enum_integer": obj.get("enum_integer"),
             "enum_number": obj.get("enum_number"),
             "outerEnum": obj.get("outerEnum"),
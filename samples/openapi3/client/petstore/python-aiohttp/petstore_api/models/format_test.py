@@ -16,6 +16,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api.validation import build_model
 
 from datetime import date, datetime
 from typing import Optional, Union
@@ -29,6 +33,14 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+_STRING_PATTERN = re.compile(r"[a-z]", re.IGNORECASE)
+
+_STRING_WITH_DOUBLE_QUOTE_PATTERN_PATTERN = re.compile(r"this is \"something\"")
+
+_PATTERN_WITH_DIGITS_PATTERN = re.compile(r"^\d{10}$")
+
+_PATTERN_WITH_DIGITS_AND_DELIMITER_PATTERN = re.compile(r"^image_\d{1,3}$", re.IGNORECASE)
+
 class FormatTest(BaseModel):
     """
     FormatTest
@@ -50,7 +62,7 @@ class FormatTest(BaseModel):
     password: Annotated[str, Field(min_length=10, strict=True, max_length=64)]
     pattern_with_digits: Optional[Annotated[str, Field(strict=True)]] = Field(default=None, description="A string that is a 10 digit number. Can have leading zeros.")
     pattern_with_digits_and_delimiter: Optional[Annotated[str, Field(strict=True)]] = Field(default=None, description="A string starting with 'image_' (case insensitive) and one to three digits following i.e. Image_01.")
-    __properties: ClassVar[List[str]] = ["integer", "int32", "int64", "number", "float", "double", "decimal", "string", "string_with_double_quote_pattern", "byte", "binary", "date", "dateTime", "uuid", "password", "pattern_with_digits", "pattern_with_digits_and_delimiter"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["integer", "int32", "int64", "number", "float", "double", "decimal", "string", "string_with_double_quote_pattern", "byte", "binary", "date", "dateTime", "uuid", "password", "pattern_with_digits", "pattern_with_digits_and_delimiter"])
 
     @field_validator('string')
     def string_validate_regular_expression(cls, value):
@@ -58,7 +70,7 @@ class FormatTest(BaseModel):
         if value is None:
             return value
 
-        if not re.match(r"[a-z]", value ,re.IGNORECASE):
+        if not _STRING_PATTERN.match(value):
             raise ValueError(r"must validate the regular expression /[a-z]/i")
         return value
 
@@ -68,7 +80,7 @@ class FormatTest(BaseModel):
         if value is None:
             return value
 
-        if not re.match(r"this is \"something\"", value):
+        if not _STRING_WITH_DOUBLE_QUOTE_PATTERN_PATTERN.match(value):
             raise ValueError(r"must validate the regular expression /this is \"something\"/")
         return value
 
@@ -78,7 +90,7 @@ class FormatTest(BaseModel):
         if value is None:
             return value
 
-        if not re.match(r"^\d{10}$", value):
+        if not _PATTERN_WITH_DIGITS_PATTERN.match(value):
             raise ValueError(r"must validate the regular expression /^\d{10}$/")
         return value
 
@@ -88,13 +100,14 @@ class FormatTest(BaseModel):
         if value is None:
             return value
 
-        if not re.match(r"^image_\d{1,3}$", value ,re.IGNORECASE):
+        if not _PATTERN_WITH_DIGITS_AND_DELIMITER_PATTERN.match(value):
             raise ValueError(r"must validate the regular expression /^image_\d{1,3}$/i")
         return value
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -104,20 +117,24 @@ class FormatTest(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of FormatTest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         return _dict
 
     @classmethod
@@ -129,7 +146,7 @@ class FormatTest(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _obj = build_model(cls, {
             "integer": obj.get("integer"),
             "int32": obj.get("int32"),
             "int64": obj.get("int64"),
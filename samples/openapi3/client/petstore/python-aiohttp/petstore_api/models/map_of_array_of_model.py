@@ -16,6 +16,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api.validation import build_model
 
 
 from typing import Dict, List, Optional
@@ -33,11 +37,12 @@ class MapOfArrayOfModel(BaseModel):
     MapOfArrayOfModel
     """
     shop_id_to_org_online_lip_map: Optional[Dict[str, List[Tag]]] = Field(default=None, alias="shopIdToOrgOnlineLipMap")
-    __properties: ClassVar[List[str]] = ["shopIdToOrgOnlineLipMap"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["shopIdToOrgOnlineLipMap"])
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -47,29 +52,29 @@ class MapOfArrayOfModel(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of MapOfArrayOfModel from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic by calling `to_dict()` of each value in shop_id_to_org_online_lip_map (dict of array)
-        _field_dict_of_array = {}
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
+        # leave out the empty lists in shop_id_to_org_online_lip_map (dict of array)
         if self.shop_id_to_org_online_lip_map:
-            for _key in self.shop_id_to_org_online_lip_map:
-                if self.shop_id_to_org_online_lip_map[_key]:
-                    _field_dict_of_array[_key] = [
-                        _item.to_dict() for _item in self.shop_id_to_org_online_lip_map[_key]
-                    ]
-            _dict['shopIdToOrgOnlineLipMap'] = _field_dict_of_array
+            _dict['shopIdToOrgOnlineLipMap'] = dict(
+                (_key, _value) for _key, _value in _dict['shopIdToOrgOnlineLipMap'].items() if _value
+            )
         return _dict
 
     @classmethod
@@ -81,7 +86,7 @@ class MapOfArrayOfModel(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _obj = build_model(cls, {
             "shopIdToOrgOnlineLipMap": dict(
                 (_k,
                         [Tag.from_dict(_item) for _item in _v]
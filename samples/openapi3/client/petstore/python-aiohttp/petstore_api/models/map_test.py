@@ -16,6 +16,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api.validation import build_model
 
 
 from typing import Dict, Optional
@@ -26,6 +30,8 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+_MAP_OF_ENUM_STRING_VALUES = ('UPPER', 'lower')
+
 class MapTest(BaseModel):
     """
     MapTest
@@ -34,7 +40,7 @@ class MapTest(BaseModel):
     map_of_enum_string: Optional[Dict[str, StrictStr]] = None
     direct_map: Optional[Dict[str, StrictBool]] = None
     indirect_map: Optional[Dict[str, StrictBool]] = None
-    __properties: ClassVar[List[str]] = ["map_map_of_string", "map_of_enum_string", "direct_map", "indirect_map"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["map_map_of_string", "map_of_enum_string", "direct_map", "indirect_map"])
 
     @field_validator('map_of_enum_string')
     def map_of_enum_string_validate_enum(cls, value):
@@ -42,13 +48,14 @@ class MapTest(BaseModel):
         if value is None:
             return value
 
-        if value not in ('UPPER', 'lower'):
+        if value not in _MAP_OF_ENUM_STRING_VALUES:
             raise ValueError("must be one of enum values ('UPPER', 'lower')")
         return value
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -58,20 +65,24 @@ class MapTest(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of MapTest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         return _dict
 
     @classmethod
@@ -83,7 +94,7 @@ class MapTest(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _obj = build_model(cls, {
             "map_map_of_string": obj.get("map_map_of_string"),
             "map_of_enum_string": obj.get("map_of_enum_string"),
             "direct_map": obj.get("direct_map"),
@@ -16,6 +16,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api.validation import build_model
 
 from datetime import datetime
 from typing import Dict, Optional
@@ -35,11 +39,12 @@ class MixedPropertiesAndAdditionalPropertiesClass(BaseModel):
     uuid: Optional[StrictStr] = None
     date_time: Optional[datetime] = Field(default=None, alias="dateTime")
     map: Optional[Dict[str, Animal]] = None
-    __properties: ClassVar[List[str]] = ["uuid", "dateTime", "map"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["uuid", "dateTime", "map"])
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -49,27 +54,24 @@ class MixedPropertiesAndAdditionalPropertiesClass(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of MixedPropertiesAndAdditionalPropertiesClass from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic by calling `to_dict()` of each value in map (dict)
-        _field_dict = {}
-        if self.map:
-            for _key in self.map:
-                if self.map[_key]:
-                    _field_dict[_key] = self.map[_key].to_dict()
-            _dict['map'] = _field_dict
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         return _dict
 
     @classmethod
@@ -81,14 +83,15 @@ class MixedPropertiesAndAdditionalPropertiesClass(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _map = obj.get("map")
+        _obj = build_model(cls, {
             "uuid": obj.get("uuid"),
             "dateTime": obj.get("dateTime"),
             "map": dict(
                 (_k, Animal.from_dict(_v))
-                for _k, _v in obj.get("map").items()
+                for _k, _v in _map.items()
             )
-            if obj.get("map") is not None
+            if _map is not None
             else None
         })
         return _obj
@@ -16,6 +16,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api.validation import build_model
 
 
 from typing import Optional
@@ -35,11 +39,12 @@ class Name(BaseModel):
     snake_case: Optional[StrictInt] = None
     var_property: Optional[StrictStr] = Field(default=None, alias="property")
     var_123_number: Optional[StrictInt] = Field(default=None, alias="123Number")
-    __properties: ClassVar[List[str]] = ["name", "snake_case", "property", "123Number"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["name", "snake_case", "property", "123Number"])
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -49,22 +54,26 @@ class Name(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of Name from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                            "snake_case",
-                            "var_123_number",
-                          },
-                          exclude_none=True)
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
+        _dict.pop("snake_case", None)
+        _dict.pop("123Number", None)
         return _dict
 
     @classmethod
@@ -76,7 +85,7 @@ class Name(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _obj = build_model(cls, {
             "name": obj.get("name"),
             "snake_case": obj.get("snake_case"),
             "property": obj.get("property"),
@@ -16,6 +16,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api.validation import build_model
 
 
 from typing import List, Optional
@@ -36,11 +40,12 @@ class ObjectWithDeprecatedFields(BaseModel):
     id: Optional[float] = None
     deprecated_ref: Optional[DeprecatedObject] = Field(default=None, alias="deprecatedRef")
     bars: Optional[List[StrictStr]] = None
-    __properties: ClassVar[List[str]] = ["uuid", "id", "deprecatedRef", "bars"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["uuid", "id", "deprecatedRef", "bars"])
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -50,23 +55,24 @@ class ObjectWithDeprecatedFields(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of ObjectWithDeprecatedFields from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic by calling `to_dict()` of deprecated_ref
-        if self.deprecated_ref:
-            _dict['deprecatedRef'] = self.deprecated_ref.to_dict()
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         return _dict
 
     @classmethod
@@ -78,10 +84,11 @@ class ObjectWithDeprecatedFields(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _deprecated_ref = obj.get("deprecatedRef")
+        _obj = build_model(cls, {
             "uuid": obj.get("uuid"),
             "id": obj.get("id"),
-            "deprecatedRef": DeprecatedObject.from_dict(obj.get("deprecatedRef")) if obj.get("deprecatedRef") is not None else None,
+            "deprecatedRef": DeprecatedObject.from_dict(_deprecated_ref) if _deprecated_ref is not None else None,
             "bars": obj.get("bars")
         })
         return _obj
@@ -16,6 +16,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api.validation import build_model
 
 from datetime import datetime
 from typing import Optional
@@ -27,6 +31,8 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+_STATUS_VALUES = frozenset(['placed', 'approved', 'delivered'])
+
 class Order(BaseModel):
     """
     Order
@@ -37,7 +43,7 @@ class Order(BaseModel):
     ship_date: Optional[datetime] = Field(default=None, alias="shipDate")
     status: Optional[StrictStr] = Field(default=None, description="Order Status")
     complete: Optional[StrictBool] = False
-    __properties: ClassVar[List[str]] = ["id", "petId", "quantity", "shipDate", "status", "complete"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["id", "petId", "quantity", "shipDate", "status", "complete"])
 
     @field_validator('status')
     def status_validate_enum(cls, value):
@@ -45,13 +51,14 @@ class Order(BaseModel):
         if value is None:
             return value
 
-        if value not in ('placed', 'approved', 'delivered'):
+        if value not in _STATUS_VALUES:
             raise ValueError("must be one of enum values ('placed', 'approved', 'delivered')")
         return value
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -61,20 +68,24 @@ class Order(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of Order from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         return _dict
 
     @classmethod
@@ -86,13 +97,14 @@ class Order(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _complete = obj.get("complete")
+        _obj = build_model(cls, {
             "id": obj.get("id"),
             "petId": obj.get("petId"),
             "quantity": obj.get("quantity"),
             "shipDate": obj.get("shipDate"),
             "status": obj.get("status"),
-            "complete": obj.get("complete") if obj.get("complete") is not None else False
+            "complete": _complete if _complete is not None else False
         })
         return _obj
 
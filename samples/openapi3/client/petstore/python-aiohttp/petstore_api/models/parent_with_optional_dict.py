@@ -16,6 +16,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api.validation import build_model
 
 
 from typing import Dict, Optional
@@ -33,11 +37,12 @@ class ParentWithOptionalDict(BaseModel):
     ParentWithOptionalDict
     """
     optional_dict: Optional[Dict[str, InnerDictWithProperty]] = Field(default=None, alias="optionalDict")
-    __properties: ClassVar[List[str]] = ["optionalDict"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["optionalDict"])
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -47,27 +52,24 @@ class ParentWithOptionalDict(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of ParentWithOptionalDict from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic by calling `to_dict()` of each value in optional_dict (dict)
-        _field_dict = {}
-        if self.optional_dict:
-            for _key in self.optional_dict:
-                if self.optional_dict[_key]:
-                    _field_dict[_key] = self.optional_dict[_key].to_dict()
-            _dict['optionalDict'] = _field_dict
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         return _dict
 
     @classmethod
@@ -79,12 +81,13 @@ class ParentWithOptionalDict(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _optional_dict = obj.get("optionalDict")
+        _obj = build_model(cls, {
             "optionalDict": dict(
                 (_k, InnerDictWithProperty.from_dict(_v))
-                for _k, _v in obj.get("optionalDict").items()
+                for _k, _v in _optional_dict.items()
             )
-            if obj.get("optionalDict") is not None
+            if _optional_dict is not None
             else None
         })
         return _obj
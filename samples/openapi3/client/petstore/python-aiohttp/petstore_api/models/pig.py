@@ -15,6 +15,9 @@
 from __future__ import annotations
 from inspect import getfullargspec
 import json
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api import validation
 import pprint
 import re  # noqa: F401
 
@@ -24,7 +27,7 @@ from petstore_api.models.basque_pig import BasquePig
 from petstore_api.models.danish_pig import DanishPig
 from typing import Union, Any, List, TYPE_CHECKING, Optional, Dict
 from typing_extensions import Literal
-from pydantic import StrictStr, Field
+from pydantic import StrictStr, Field, model_serializer
 try:
     from typing import Self
 except ImportError:
@@ -44,7 +47,8 @@ class Pig(BaseModel):
     one_of_schemas: List[str] = Literal["BasquePig", "DanishPig"]
 
     model_config = {
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -63,19 +67,13 @@ class Pig(BaseModel):
 
     @field_validator('actual_instance')
     def actual_instance_must_validate_oneof(cls, v):
-        instance = Pig.model_construct()
+        match = cls.__validate(v, validation.candidate_index(cls))
+        if match == 1:
+            return v
+
+        # validate against every schema again to collect the errors
         error_messages = []
-        match = 0
-        # validate data type: BasquePig
-        if not isinstance(v, BasquePig):
-            error_messages.append(f"Error! Input type `{type(v)}` is not `BasquePig`")
-        else:
-            match += 1
-        # validate data type: DanishPig
-        if not isinstance(v, DanishPig):
-            error_messages.append(f"Error! Input type `{type(v)}` is not `DanishPig`")
-        else:
-            match += 1
+        match = cls.__validate(v, None, error_messages)
         if match > 1:
             # more than 1 match
             raise ValueError("Multiple matches found when setting `actual_instance` in Pig with oneOf schemas: BasquePig, DanishPig. Details: " + ", ".join(error_messages))
@@ -86,29 +84,38 @@ class Pig(BaseModel):
             return v
 
     @classmethod
-    def from_dict(cls, obj: dict) -> Self:
-        return cls.from_json(json.dumps(obj))
+    def __validate(cls, v, candidates, error_messages=None):
+        """Returns the number of oneOf schemas matched by the value, checking
+        only the candidates it may match (all of them if None); the errors
+        are appended to `error_messages` if given."""
+        match = 0
+        # validate data type: BasquePig
+        if isinstance(v, BasquePig):
+            match += 1
+        elif error_messages is not None:
+            error_messages.append(f"Error! Input type `{type(v)}` is not `BasquePig`")
+        # validate data type: DanishPig
+        if isinstance(v, DanishPig):
+            match += 1
+        elif error_messages is not None:
+            error_messages.append(f"Error! Input type `{type(v)}` is not `DanishPig`")
+        return match
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Returns the object represented by the json string"""
-        instance = cls.model_construct()
-        error_messages = []
-        match = 0
+        return cls.from_dict(json_backend.loads(json_str))
 
-        # deserialize data into BasquePig
-        try:
-            instance.actual_instance = BasquePig.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into DanishPig
-        try:
-            instance.actual_instance = DanishPig.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
+    @classmethod
+    def from_dict(cls, obj: Any) -> Self:
+        """Returns the object represented by the deserialized JSON value"""
+        instance, match = cls.__deserialize(obj, validation.candidate_index(cls))
+        if match == 1:
+            return instance
 
+        # deserialize into every schema again to collect the errors
+        error_messages = []
+        instance, match = cls.__deserialize(obj, None, error_messages)
         if match > 1:
             # more than 1 match
             raise ValueError("Multiple matches found when deserializing the JSON string into Pig with oneOf schemas: BasquePig, DanishPig. Details: " + ", ".join(error_messages))
@@ -118,6 +125,32 @@ class Pig(BaseModel):
         else:
             return instance
 
+    @classmethod
+    def __deserialize(cls, obj, candidates, error_messages=None):
+        """Deserializes the value into the oneOf schemas it may match (all of
+        them if `candidates` is None); returns the instance holding the last
+        match and the number of matches. The errors are appended to
+        `error_messages` if given."""
+        instance = cls.model_construct()
+        match = 0
+        # deserialize data into BasquePig
+        if candidates is None or candidates["oneof_schema_1_validator"](obj):
+            try:
+                instance.actual_instance = BasquePig.from_dict(obj)
+                match += 1
+            except (ValidationError, ValueError) as e:
+                if error_messages is not None:
+                    error_messages.append(str(e))
+        # deserialize data into DanishPig
+        if candidates is None or candidates["oneof_schema_2_validator"](obj):
+            try:
+                instance.actual_instance = DanishPig.from_dict(obj)
+                match += 1
+            except (ValidationError, ValueError) as e:
+                if error_messages is not None:
+                    error_messages.append(str(e))
+        return instance, match
+
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
         if self.actual_instance is None:
@@ -127,7 +160,7 @@ class Pig(BaseModel):
         if callable(to_json):
             return self.actual_instance.to_json()
         else:
-            return json.dumps(self.actual_instance)
+            return json_backend.dumps(self.actual_instance)
 
     def to_dict(self) -> dict:
         """Returns the dict representation of the actual instance"""
@@ -141,6 +174,14 @@ class Pig(BaseModel):
             # primitive type
             return self.actual_instance
 
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to the representation of the actual
+        instance"""
+        if serialization.in_to_dict():
+            return self.to_dict()
+        return handler(self)
+
     def to_str(self) -> str:
         """Returns the string representation of the actual instance"""
         return pprint.pformat(self.model_dump())
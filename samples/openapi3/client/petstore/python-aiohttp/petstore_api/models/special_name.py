@@ -16,6 +16,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api.validation import build_model
 
 
 from typing import Optional
@@ -28,6 +32,8 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+_VAR_SCHEMA_VALUES = frozenset(['available', 'pending', 'sold'])
+
 class SpecialName(BaseModel):
     """
     SpecialName
@@ -35,7 +41,7 @@ class SpecialName(BaseModel):
     var_property: Optional[StrictInt] = Field(default=None, alias="property")
     var_async: Optional[Category] = Field(default=None, alias="async")
     var_schema: Optional[StrictStr] = Field(default=None, description="pet status in the store", alias="schema")
-    __properties: ClassVar[List[str]] = ["property", "async", "schema"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["property", "async", "schema"])
 
     @field_validator('var_schema')
     def var_schema_validate_enum(cls, value):
@@ -43,13 +49,14 @@ class SpecialName(BaseModel):
         if value is None:
             return value
 
-        if value not in ('available', 'pending', 'sold'):
+        if value not in _VAR_SCHEMA_VALUES:
             raise ValueError("must be one of enum values ('available', 'pending', 'sold')")
         return value
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -59,23 +66,24 @@ class SpecialName(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of SpecialName from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic by calling `to_dict()` of var_async
-        if self.var_async:
-            _dict['async'] = self.var_async.to_dict()
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         return _dict
 
     @classmethod
@@ -87,9 +95,10 @@ class SpecialName(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _var_async = obj.get("async")
+        _obj = build_model(cls, {
             "property": obj.get("property"),
-            "async": Category.from_dict(obj.get("async")) if obj.get("async") is not None else None,
+            "async": Category.from_dict(_var_async) if _var_async is not None else None,
             "schema": obj.get("schema")
         })
         return _obj
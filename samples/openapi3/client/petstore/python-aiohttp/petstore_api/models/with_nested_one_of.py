@@ -16,6 +16,10 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api.validation import build_model
 
 
 from typing import Optional
@@ -35,11 +39,12 @@ class WithNestedOneOf(BaseModel):
     size: Optional[StrictInt] = None
     nested_pig: Optional[Pig] = None
     nested_oneof_enum_string: Optional[OneOfEnumString] = None
-    __properties: ClassVar[List[str]] = ["size", "nested_pig", "nested_oneof_enum_string"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["size", "nested_pig", "nested_oneof_enum_string"])
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
@@ -49,26 +54,24 @@ class WithNestedOneOf(BaseModel):
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of WithNestedOneOf from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                          },
-                          exclude_none=True)
-        # override the default output from pydantic by calling `to_dict()` of nested_pig
-        if self.nested_pig:
-            _dict['nested_pig'] = self.nested_pig.to_dict()
-        # override the default output from pydantic by calling `to_dict()` of nested_oneof_enum_string
-        if self.nested_oneof_enum_string:
-            _dict['nested_oneof_enum_string'] = self.nested_oneof_enum_string.to_dict()
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         return _dict
 
     @classmethod
@@ -80,10 +83,12 @@ class WithNestedOneOf(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _nested_pig = obj.get("nested_pig")
+        _nested_oneof_enum_string = obj.get("nested_oneof_enum_string")
+        _obj = build_model(cls, {
             "size": obj.get("size"),
-            "nested_pig": Pig.from_dict(obj.get("nested_pig")) if obj.get("nested_pig") is not None else None,
-            "nested_oneof_enum_string": OneOfEnumString.from_dict(obj.get("nested_oneof_enum_string")) if obj.get("nested_oneof_enum_string") is not None else None
+            "nested_pig": Pig.from_dict(_nested_pig) if _nested_pig is not None else None,
+            "nested_oneof_enum_string": OneOfEnumString.from_dict(_nested_oneof_enum_string) if _nested_oneof_enum_string is not None else None
         })
         return _obj
 
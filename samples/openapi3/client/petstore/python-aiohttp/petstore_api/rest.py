@@ -12,8 +12,8 @@
 """  # noqa: E501
 
 
+import asyncio
 import io
-import json
 import logging
 import re
 import ssl
@@ -21,12 +21,72 @@ import ssl
 import aiohttp
 from urllib.parse import urlencode, quote_plus
 
+from petstore_api.multipart import FilePart
 from petstore_api.exceptions import ApiException, ApiValueError
 
 logger = logging.getLogger(__name__)
 
+# errors reading a response body, after which a download can be resumed
+INTERRUPTED_TRANSFER_ERRORS = (aiohttp.ClientPayloadError,
+                               aiohttp.ClientConnectionError,
+                               asyncio.TimeoutError)
 
-class RESTResponse(io.IOBase):
+
+class _UnclosedFile(io.RawIOBase):
+    """Reads a file object of the caller, which is not closed with it."""
+
+    def __init__(self, file) -> None:
+        super().__init__()
+        self.file = file
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        return self.file.read(size)
+
+    def seekable(self):
+        return self.file.seekable()
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        return self.file.seek(offset, whence)
+
+    def tell(self):
+        return self.file.tell()
+
+    def fileno(self):
+        return self.file.fileno()
+
+
+class LazilyDecodedData:
+    """Holds the `data` of a response, its body as bytes or str.
+
+    A body handed to the JSON parser as bytes is decoded on the first
+    access to `data` (see `decode_later`), so that `data` is still the
+    text of the deserialized responses.
+    """
+
+    __encoding = None
+
+    @property
+    def data(self):
+        if self.__encoding is not None:
+            self.__data = self.__data.decode(self.__encoding)
+            self.__encoding = None
+        return self.__data
+
+    @data.setter
+    def data(self, value) -> None:
+        self.__data = value
+        self.__encoding = None
+
+    def decode_later(self, encoding) -> None:
+        """Decodes the body with `encoding` on the next access to `data`."""
+        if isinstance(self.__data, bytes):
+            self.__encoding = encoding
+
+
+class RESTResponse(LazilyDecodedData, io.IOBase):
 
     def __init__(self, resp, data) -> None:
         self.aiohttp_response = resp
@@ -69,6 +129,9 @@ class RESTClientObject:
         self.proxy = configuration.proxy
         self.proxy_headers = configuration.proxy_headers
 
+        # the JSON backend is looked up per request, as it may be changed
+        self.configuration = configuration
+
         # https pool manager
         self.pool_manager = aiohttp.ClientSession(
             connector=connector,
@@ -136,7 +199,7 @@ class RESTClientObject:
         if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
             if re.search('json', headers['Content-Type'], re.IGNORECASE):
                 if body is not None:
-                    body = json.dumps(body)
+                    body = self.configuration.get_json_backend().dump_body(body)
                 args["data"] = body
             elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
                 args["data"] = aiohttp.FormData(post_params)
@@ -147,7 +210,17 @@ class RESTClientObject:
                 data = aiohttp.FormData()
                 for param in post_params:
                     k, v = param
-                    if isinstance(v, tuple) and len(v) == 3:
+                    if isinstance(v, FilePart):
+                        # file objects are streamed (and closed) by aiohttp,
+                        # except those of the caller
+                        content = v.open()
+                        if content is v.source:
+                            content = _UnclosedFile(content)
+                        data.add_field(k,
+                                       value=content,
+                                       filename=v.filename,
+                                       content_type=v.content_type)
+                    elif isinstance(v, tuple) and len(v) == 3:
                         data.add_field(k,
                                        value=v[1],
                                        filename=v[0],
@@ -2,11 +2,17 @@
 
 # flake8: noqa
 
+import os
+import tempfile
 import unittest
 import weakref
 
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
 from tests.util import async_test
 import petstore_api
+from petstore_api.multipart import FilePart
 
 
 class TestApiClient(unittest.TestCase):
@@ -20,3 +26,30 @@ class TestApiClient(unittest.TestCase):
             rest_pool_ref = client.rest_client.pool_manager
 
         self.assertTrue(rest_pool_ref.closed)
+
+    @async_test
+    async def test_upload_does_not_close_file(self):
+        received = []
+
+        async def upload(request):
+            form = await request.post()
+            received.append(form['file'].file.read())
+            return web.json_response({})
+
+        app = web.Application()
+        app.router.add_post('/upload', upload)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'a.txt')
+            with open(path, 'wb') as file:
+                file.write(b'skip:content')
+            with open(path, 'rb') as file:
+                file.seek(5)
+                async with TestServer(app) as server:
+                    async with petstore_api.ApiClient() as client:
+                        await client.rest_client.request(
+                            'POST', str(server.make_url('/upload')),
+                            headers={'Content-Type': 'multipart/form-data'},
+                            post_params=[('file', FilePart(file))])
+                self.assertFalse(file.closed)
+
+        self.assertEqual(received, [b'content'])
@@ -0,0 +1,114 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+Microbenchmark for the deserialization of oneOf/anyOf models.
+
+Compares from_dict against reference implementations of the former
+generated code, which encoded the dict to JSON and decoded it again for
+the discriminator and for each candidate schema, then tried every
+candidate schema, formatting the error of each one it did not match.
+
+$ cd OpenAPIPetstore-python
+$ PYTHONPATH=. python benchmarks/bench_composed.py
+"""
+import json
+import timeit
+
+import petstore_api
+
+DANISH_PIG = {"className": "DanishPig", "size": 2}
+
+
+def legacy_pig_from_dict(obj):
+    """Pig.from_dict with the oneOf discriminator lookup, as generated
+    before."""
+    json_str = json.dumps(obj)
+    instance = petstore_api.Pig.model_construct()
+    _data_type = json.loads(json_str).get("className")
+    if _data_type == "BasquePig":
+        instance.actual_instance = petstore_api.BasquePig.from_json(json_str)
+        return instance
+    if _data_type == "DanishPig":
+        instance.actual_instance = petstore_api.DanishPig.from_json(json_str)
+        return instance
+
+
+def legacy_any_of_pig_from_dict(obj):
+    """AnyOfPig.from_dict as generated before."""
+    json_str = json.dumps(obj)
+    instance = petstore_api.AnyOfPig.model_construct()
+    for klass in (petstore_api.BasquePig, petstore_api.DanishPig):
+        try:
+            instance.actual_instance = klass.from_json(json_str)
+            return instance
+        except ValueError:
+            pass
+
+
+def legacy_color_from_dict(obj):
+    """Color.from_dict as generated before the candidate index: every oneOf
+    schema is tried, each validation of the actual instance too."""
+    instance = petstore_api.Color.model_construct()
+    error_messages = []
+    match = 0
+    for name in ("oneof_schema_1_validator", "oneof_schema_2_validator",
+                 "oneof_schema_3_validator"):
+        try:
+            setattr(instance, name, obj)
+            legacy_validate_color(getattr(instance, name))
+            instance.__dict__["actual_instance"] = getattr(instance, name)
+            match += 1
+        except ValueError as e:
+            error_messages.append(str(e))
+    assert match == 1
+    return instance
+
+
+def legacy_validate_color(v):
+    instance = petstore_api.Color.model_construct()
+    error_messages = []
+    match = 0
+    for name in ("oneof_schema_1_validator", "oneof_schema_2_validator",
+                 "oneof_schema_3_validator"):
+        try:
+            setattr(instance, name, v)
+            match += 1
+        except ValueError as e:
+            error_messages.append(str(e))
+    if match != 1:
+        raise ValueError("Details: " + ", ".join(error_messages))
+
+
+def legacy_any_of_pig_from_dict_every_schema(obj):
+    """AnyOfPig.from_dict as generated before the candidate index."""
+    instance = petstore_api.AnyOfPig.model_construct()
+    error_messages = []
+    for klass in (petstore_api.BasquePig, petstore_api.DanishPig):
+        try:
+            instance.actual_instance = klass.from_dict(obj)
+            return instance
+        except ValueError as e:
+            error_messages.append(str(e))
+
+
+def bench(name, legacy, from_dict, data, number):
+    assert legacy(data).actual_instance == from_dict(data).actual_instance
+    legacy_time = timeit.timeit(lambda: legacy(data), number=number)
+    dict_time = timeit.timeit(lambda: from_dict(data), number=number)
+    print("%-30s legacy %8.3fs  from dict %8.3fs  speedup x%.2f"
+          % (name, legacy_time, dict_time, legacy_time / dict_time))
+
+
+if __name__ == '__main__':
+    bench("Pig (discriminator)", legacy_pig_from_dict,
+          petstore_api.Pig.from_dict, DANISH_PIG, 20000)
+    bench("AnyOfPig (second schema)", legacy_any_of_pig_from_dict,
+          petstore_api.AnyOfPig.from_dict, DANISH_PIG, 20000)
+    bench("AnyOfPig (every schema)", legacy_any_of_pig_from_dict_every_schema,
+          petstore_api.AnyOfPig.from_dict, DANISH_PIG, 20000)
+    bench("Color (hex string)", legacy_color_from_dict,
+          petstore_api.Color.from_dict, "#00FF00", 20000)
+    bench("Color (RGB array)", legacy_color_from_dict,
+          petstore_api.Color.from_dict, [0, 128, 255], 20000)
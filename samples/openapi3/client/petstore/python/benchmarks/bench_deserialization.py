@@ -0,0 +1,68 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+Microbenchmark for ApiClient response deserialization.
+
+Compares the compiled deserializer plans against a reference implementation
+that re-parses the type string and looks up the model class per element.
+
+$ cd OpenAPIPetstore-python
+$ PYTHONPATH=. python benchmarks/bench_deserialization.py
+"""
+import json
+import re
+import timeit
+from collections import namedtuple
+
+import petstore_api
+import petstore_api.models
+
+MockResponse = namedtuple('MockResponse', 'data')
+
+PET = {
+    "id": 1,
+    "category": {"id": 1, "name": "dogs"},
+    "name": "doggie",
+    "photoUrls": ["http://foo.bar.com/1"],
+    "tags": [{"id": 1, "name": "tag1"}],
+    "status": "available",
+}
+
+
+def legacy_deserialize(data, klass):
+    """Per-element deserialization as done before compiled plans."""
+    if data is None:
+        return None
+    if klass.startswith('List['):
+        sub_kls = re.match(r'List\[(.*)]', klass).group(1)
+        return [legacy_deserialize(sub_data, sub_kls) for sub_data in data]
+    if klass.startswith('Dict['):
+        sub_kls = re.match(r'Dict\[([^,]*), (.*)]', klass).group(2)
+        return {k: legacy_deserialize(v, sub_kls) for k, v in data.items()}
+    if klass in petstore_api.ApiClient.NATIVE_TYPES_MAPPING:
+        return petstore_api.ApiClient.NATIVE_TYPES_MAPPING[klass](data)
+    return getattr(petstore_api.models, klass).from_dict(data)
+
+
+def bench(name, data, response_type, number):
+    api_client = petstore_api.ApiClient()
+    body = json.dumps(data)
+
+    legacy = timeit.timeit(
+        lambda: legacy_deserialize(json.loads(body), response_type),
+        number=number)
+    compiled = timeit.timeit(
+        lambda: api_client.deserialize(MockResponse(data=body), response_type),
+        number=number)
+    print("%-40s legacy %8.3fs  compiled %8.3fs  speedup x%.2f"
+          % (name, legacy, compiled, legacy / compiled))
+
+
+if __name__ == '__main__':
+    bench("List[Pet] (20k pets)", [PET] * 20000, "List[Pet]", 3)
+    bench("Dict[str, int] (100k keys)",
+          {"status%d" % i: i for i in range(100000)}, "Dict[str, int]", 20)
+    bench("List[List[str]] (1k x 100)",
+          [["x"] * 100] * 1000, "List[List[str]]", 20)
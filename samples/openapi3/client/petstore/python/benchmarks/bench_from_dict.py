@@ -0,0 +1,69 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+Microbenchmark for the generated from_dict of wide models.
+
+Compares from_dict against a reference implementation of the former
+generated code, which looked up the known properties in a list and read
+the additional properties back from the input.
+
+$ cd OpenAPIPetstore-python
+$ PYTHONPATH=. python benchmarks/bench_from_dict.py
+"""
+import timeit
+
+import petstore_api
+from petstore_api.validation import build_model
+
+FORMAT_TEST = {
+    "integer": 10, "int32": 20, "int64": 30, "number": 33, "float": 54.3,
+    "double": 67.8, "decimal": "1.5", "string": "abc", "byte": "YWJj",
+    "binary": "abc", "date": "2020-01-02",
+    "dateTime": "2020-01-02T03:04:05Z",
+    "uuid": "72f98069-206d-4f12-9f12-3d1e525a8e84",
+    "password": "0123456789", "pattern_with_digits": "0123456789",
+    "pattern_with_digits_and_delimiter": "image_123",
+}
+
+NULLABLE_CLASS = {
+    "required_integer_prop": None, "integer_prop": 1, "number_prop": 2.5,
+    "boolean_prop": True, "string_prop": "s", "date_prop": "2020-01-02",
+    "datetime_prop": "2020-01-02T03:04:05Z", "array_nullable_prop": [{}],
+    "array_and_items_nullable_prop": [None], "array_items_nullable": [{}],
+    "object_nullable_prop": {"a": {}},
+    "object_and_items_nullable_prop": {"a": None},
+    "object_items_nullable": {"a": {}},
+}
+
+# unknown properties, stored in additional_properties
+EXTRA = {"extra%d" % i: i for i in range(10)}
+
+
+def legacy_from_dict(cls, properties, obj):
+    """from_dict of a model with primitive properties as generated before."""
+    _obj = build_model(cls, dict((_key, obj.get(_key)) for _key in properties))
+    for _key in obj.keys():
+        if _key not in properties:
+            _obj.additional_properties[_key] = obj.get(_key)
+    return _obj
+
+
+def bench(name, cls, data, number):
+    properties = list(getattr(cls, '_%s__properties' % cls.__name__))
+    assert legacy_from_dict(cls, properties, data) == cls.from_dict(data)
+    legacy = timeit.timeit(
+        lambda: legacy_from_dict(cls, properties, data), number=number)
+    single_pass = timeit.timeit(lambda: cls.from_dict(data), number=number)
+    print("%-30s legacy %8.3fs  single pass %8.3fs  speedup x%.2f"
+          % (name, legacy, single_pass, legacy / single_pass))
+
+
+if __name__ == '__main__':
+    bench("FormatTest", petstore_api.FormatTest, FORMAT_TEST, 20000)
+    bench("FormatTest (10 extra keys)", petstore_api.FormatTest,
+          dict(FORMAT_TEST, **EXTRA), 20000)
+    bench("NullableClass", petstore_api.NullableClass, NULLABLE_CLASS, 20000)
+    bench("NullableClass (10 extra keys)", petstore_api.NullableClass,
+          dict(NULLABLE_CLASS, **EXTRA), 20000)
@@ -0,0 +1,96 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+Regression benchmark for the cold import time of the package.
+
+Each scenario runs in a fresh interpreter; the startup time of a bare
+interpreter is subtracted. `import petstore_api` alone should not import
+the API and model modules, the other scenarios show the cost of what is
+actually used. The pydantic schemas of the models and API operations are
+built on first use, not on import: the "first use" scenarios include
+building those used. The last column is the time of the scenario alone,
+with the dependencies (pydantic, urllib3, ...) already imported.
+
+$ cd OpenAPIPetstore-python
+$ PYTHONPATH=. python benchmarks/bench_import.py
+"""
+import os
+import subprocess
+import sys
+import time
+
+SCENARIOS = [
+    ("import petstore_api", "import petstore_api"),
+    ("one API and its models",
+     "import petstore_api; petstore_api.ApiClient; petstore_api.PetApi"),
+    ("one model", "from petstore_api.models import Pet"),
+    ("Pet and Order", "from petstore_api.models import Order, Pet"),
+    ("Pet and Order, first use",
+     "from petstore_api.models import Order, Pet\n"
+     "Pet.from_dict({'name': 'doggie', 'photoUrls': []})\n"
+     "Order.from_dict({'id': 1, 'status': 'placed'})"),
+    ("FormatTest", "from petstore_api.models import FormatTest"),
+    ("everything", "from petstore_api import *"),
+]
+
+# the dependencies of the package, imported before the timed scenario
+DEPENDENCIES = """
+import multiprocessing.pool, ssl
+import dateutil.parser, urllib3
+from pydantic import (BaseModel, Field, StrictStr, field_validator,
+                      model_serializer, validate_call)
+from typing_extensions import Annotated
+"""
+
+
+def run(code, repeat):
+    """Returns the best wall time of `code` in a new interpreter."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True, env=env)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_alone(code, repeat):
+    """Returns the best time of `code` in a new interpreter, once the
+    dependencies of the package are imported."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    timed = (DEPENDENCIES + "import time\nstart = time.perf_counter()\n" +
+             code + "\nprint(time.perf_counter() - start)")
+    return min(float(subprocess.run([sys.executable, '-c', timed], check=True,
+                                    env=env, capture_output=True,
+                                    text=True).stdout)
+               for _ in range(repeat))
+
+
+def modules_imported(code):
+    """Returns the number of modules of the package imported by `code`."""
+    output = subprocess.run(
+        [sys.executable, '-c', code + "\nimport sys\n"
+         "print(len([m for m in sys.modules if m.startswith('petstore_api')]))"],
+        check=True, capture_output=True, text=True).stdout
+    return int(output)
+
+
+def bench(repeat):
+    # compile the bytecode once so that it is not measured
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    subprocess.run([sys.executable, '-c', "from petstore_api import *"],
+                   check=True, env=env)
+    interpreter = run("pass", repeat)
+    for name, code in SCENARIOS:
+        elapsed = run(code, repeat) - interpreter
+        print("%-25s %8.1fms  %3d modules  %8.1fms alone"
+              % (name, elapsed * 1e3, modules_imported(code),
+                 run_alone(code, repeat) * 1e3))
+
+
+if __name__ == '__main__':
+    bench(10)
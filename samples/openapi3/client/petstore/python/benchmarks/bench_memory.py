@@ -0,0 +1,67 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+Memory benchmark for the models of the responses.
+
+Measures with tracemalloc the memory held by many models deserialized from
+separate responses, built as before and in the compact representation of
+`petstore_api.validation.compact` (see `Configuration.compact_responses`).
+
+$ cd OpenAPIPetstore-python
+$ PYTHONPATH=. python benchmarks/bench_memory.py
+"""
+import contextlib
+import gc
+import json
+import tracemalloc
+
+import petstore_api
+from petstore_api.validation import compact, trusted
+
+PET = json.dumps({
+    "id": 1,
+    "category": {"id": 1, "name": "dogs"},
+    "name": "doggie",
+    "photoUrls": ["http://foo.bar.com/1"],
+    "tags": [{"id": 1, "name": "tag1"}],
+    "status": "available",
+})
+
+ORDER = json.dumps({
+    "id": 1, "petId": 2, "quantity": 3, "shipDate": "2020-01-02T03:04:05Z",
+    "status": "placed", "complete": True,
+})
+
+
+def held_memory(cls, response, count, *contexts):
+    """Returns the memory held by `count` models, per model."""
+    gc.collect()
+    tracemalloc.start()
+    # one response per model, as held in a cache
+    data = [json.loads(response) for _ in range(count)]
+    with contextlib.ExitStack() as stack:
+        for context in contexts:
+            stack.enter_context(context())
+        models = [cls.from_dict(obj) for obj in data]
+    del data
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del models
+    return size / count
+
+
+def bench(name, cls, response, count):
+    default = held_memory(cls, response, count)
+    compacted = held_memory(cls, response, count, compact)
+    trusted_compacted = held_memory(cls, response, count, trusted, compact)
+    print("%-10s default %6d B  compact %6d B  trusted compact %6d B  "
+          "saving %.0f%%" % (name, default, compacted, trusted_compacted,
+                             100 * (1 - compacted / default)))
+
+
+if __name__ == '__main__':
+    bench("Pet", petstore_api.Pet, PET, 20000)
+    bench("Order", petstore_api.Order, ORDER, 20000)
@@ -0,0 +1,115 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+Microbenchmark for the per-call client overhead of an API operation.
+
+Measures the work done before the HTTP request for `find_pets_by_status`
+(`call_api` is stubbed out): the previous per-call setup of the generated
+method against `ApiClient.call_operation` with the precompiled
+OperationSpec, and the whole generated method including argument
+validation.
+
+$ cd OpenAPIPetstore-python
+$ PYTHONPATH=. python benchmarks/bench_operation.py
+"""
+import timeit
+
+import petstore_api
+
+
+def legacy_setup(api_client, status, **kwargs):
+    """Per-call setup done by find_pets_by_status_with_http_info before
+    precompiled operation specs."""
+    _params = locals()
+
+    _all_params = [
+        'status'
+    ]
+    _all_params.extend(
+        [
+            'async_req',
+            '_return_http_data_only',
+            '_preload_content',
+            '_stream',
+            '_request_timeout',
+            '_request_auth',
+            '_content_type',
+            '_headers'
+        ]
+    )
+
+    for _key, _val in _params['kwargs'].items():
+        if _key not in _all_params:
+            raise petstore_api.ApiTypeError(
+                "Got an unexpected keyword argument '%s'"
+                " to method find_pets_by_status" % _key
+            )
+        _params[_key] = _val
+    del _params['kwargs']
+
+    _collection_formats = {}
+    _path_params = {}
+    _query_params = []
+    if _params.get('status') is not None:
+        _query_params.append(('status', _params['status']))
+        _collection_formats['status'] = 'csv'
+    _header_params = dict(_params.get('_headers', {}))
+    _form_params = []
+    _files = {}
+    _body_params = None
+    _header_params['Accept'] = api_client.select_header_accept(
+        ['application/xml', 'application/json'])
+    _auth_settings = ['petstore_auth', 'http_signature_test']
+    _response_types_map = {
+        '200': "List[Pet]",
+        '400': None,
+    }
+
+    return api_client.call_api(
+        '/pet/findByStatus', 'GET',
+        _path_params,
+        _query_params,
+        _header_params,
+        body=_body_params,
+        post_params=_form_params,
+        files=_files,
+        response_types_map=_response_types_map,
+        auth_settings=_auth_settings,
+        async_req=_params.get('async_req'),
+        _return_http_data_only=_params.get('_return_http_data_only'),
+        _preload_content=_params.get('_preload_content', True),
+        _stream=_params.get('_stream', False),
+        _request_timeout=_params.get('_request_timeout'),
+        collection_formats=_collection_formats,
+        _request_auth=_params.get('_request_auth'))
+
+
+def bench(number):
+    api_client = petstore_api.ApiClient()
+    api_client.call_api = lambda *args, **kwargs: None
+    pet_api = petstore_api.PetApi(api_client)
+    spec = petstore_api.PetApi._find_pets_by_status_operation
+    status = ['available']
+
+    legacy = timeit.timeit(
+        lambda: legacy_setup(api_client, status, _request_timeout=5),
+        number=number)
+    dispatcher = timeit.timeit(
+        lambda: api_client.call_operation(spec, [status],
+                                          {'_request_timeout': 5}),
+        number=number)
+    method = timeit.timeit(
+        lambda: pet_api.find_pets_by_status_with_http_info(
+            status, _request_timeout=5),
+        number=number)
+    print("per-call setup: legacy %.2fus  call_operation %.2fus  speedup x%.2f"
+          % (legacy / number * 1e6, dispatcher / number * 1e6,
+             legacy / dispatcher))
+    print("generated method incl. argument validation: %.2fus"
+          % (method / number * 1e6))
+
+
+if __name__ == '__main__':
+    bench(100000)
@@ -0,0 +1,84 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+Throughput benchmark for request body serialization.
+
+Compares ApiClient.sanitize_for_serialization against the previous
+isinstance-chain implementation, and measures the full path to the bytes
+sent over the wire with each available JSON backend.
+
+$ cd OpenAPIPetstore-python
+$ PYTHONPATH=. python benchmarks/bench_serialization.py
+"""
+import datetime
+import timeit
+
+import petstore_api
+
+PRIMITIVE_TYPES = (float, bool, bytes, str, int)
+
+
+def legacy_sanitize(obj):
+    """Serialization as done before the exact type dispatch."""
+    if obj is None:
+        return None
+    elif isinstance(obj, PRIMITIVE_TYPES):
+        return obj
+    elif isinstance(obj, list):
+        return [legacy_sanitize(sub_obj) for sub_obj in obj]
+    elif isinstance(obj, tuple):
+        return tuple(legacy_sanitize(sub_obj) for sub_obj in obj)
+    elif isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+
+    if isinstance(obj, dict):
+        obj_dict = obj
+    else:
+        obj_dict = obj.to_dict()
+
+    return {key: legacy_sanitize(val) for key, val in obj_dict.items()}
+
+
+def make_users(count):
+    return [petstore_api.User(id=i, username="user%d" % i, firstName="John",
+                              lastName="Doe", email="john%d@example.com" % i,
+                              password="secret", phone="555-0100", userStatus=1)
+            for i in range(count)]
+
+
+def make_orders(count):
+    ship_date = datetime.datetime(2020, 1, 1, 12, 30,
+                                  tzinfo=datetime.timezone.utc)
+    return [petstore_api.Order(id=i, petId=i, quantity=1, shipDate=ship_date,
+                               status="placed", complete=False)
+            for i in range(count)]
+
+
+def bench(name, body, number):
+    api_client = petstore_api.ApiClient()
+
+    legacy = timeit.timeit(lambda: legacy_sanitize(body), number=number)
+    single_pass = timeit.timeit(
+        lambda: api_client.sanitize_for_serialization(body), number=number)
+    print("%-32s legacy %8.0f obj/s  single pass %8.0f obj/s  speedup x%.2f"
+          % (name, len(body) * number / legacy,
+             len(body) * number / single_pass, legacy / single_pass))
+
+    for backend in petstore_api.json_backend.JSON_BACKENDS:
+        try:
+            encoder = petstore_api.json_backend.get_backend(backend)
+        except ImportError:
+            continue
+        elapsed = timeit.timeit(
+            lambda: encoder.dump_body(
+                api_client.sanitize_for_serialization(body)),
+            number=number)
+        print("%-32s   to wire with %-8s %8.0f obj/s"
+              % ("", backend, len(body) * number / elapsed))
+
+
+if __name__ == '__main__':
+    bench("List[User] (10k users)", make_users(10000), 5)
+    bench("List[Order] (10k orders)", make_orders(10000), 5)
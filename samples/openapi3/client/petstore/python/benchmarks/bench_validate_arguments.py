@@ -0,0 +1,93 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+Microbenchmark for the argument validation of the API operation methods.
+
+Times the client side overhead of a call, with `ApiClient.call_operation`
+replaced by a no-op: the former generated code, whose method validated its
+arguments then called its `*_with_http_info` variant validating them again,
+against the methods validating them once, and not at all when
+`Configuration.client_side_validation` is disabled.
+
+$ cd OpenAPIPetstore-python
+$ PYTHONPATH=. python benchmarks/bench_validate_arguments.py
+"""
+import timeit
+from typing import List
+
+from pydantic import Field, StrictInt, StrictStr, validate_call
+from typing_extensions import Annotated
+
+import petstore_api
+from petstore_api import ApiResponse, Pet, PetApi
+
+
+class LegacyPetApi(PetApi):
+    """The operations as generated before: both methods decorated with
+    pydantic's `validate_call`."""
+
+    @validate_call
+    def add_pet(self, pet : Annotated[Pet, Field(description="Pet object that needs to be added to the store")], **kwargs) -> None:
+        kwargs['_return_http_data_only'] = True
+        return self.add_pet_with_http_info(pet, **kwargs)
+
+    @validate_call
+    def add_pet_with_http_info(self, pet : Annotated[Pet, Field(description="Pet object that needs to be added to the store")], **kwargs) -> ApiResponse:
+        return self.api_client.call_operation(self._add_pet_operation, [pet], kwargs)
+
+    @validate_call
+    def find_pets_by_status(self, status : Annotated[List[StrictStr], Field(description="Status values that need to be considered for filter")], **kwargs) -> List[Pet]:
+        kwargs['_return_http_data_only'] = True
+        return self.find_pets_by_status_with_http_info(status, **kwargs)
+
+    @validate_call
+    def find_pets_by_status_with_http_info(self, status : Annotated[List[StrictStr], Field(description="Status values that need to be considered for filter")], **kwargs) -> ApiResponse:
+        return self.api_client.call_operation(self._find_pets_by_status_operation, [status], kwargs)
+
+    @validate_call
+    def get_pet_by_id(self, pet_id : Annotated[StrictInt, Field(description="ID of pet to return")], **kwargs) -> Pet:
+        kwargs['_return_http_data_only'] = True
+        return self.get_pet_by_id_with_http_info(pet_id, **kwargs)
+
+    @validate_call
+    def get_pet_by_id_with_http_info(self, pet_id : Annotated[StrictInt, Field(description="ID of pet to return")], **kwargs) -> ApiResponse:
+        return self.api_client.call_operation(self._get_pet_by_id_operation, [pet_id], kwargs)
+
+
+def make_client(client_side_validation):
+    configuration = petstore_api.Configuration()
+    configuration.client_side_validation = client_side_validation
+    api_client = petstore_api.ApiClient(configuration)
+    # the request is not sent, only the client side overhead is timed
+    api_client.call_operation = lambda operation, args, kwargs: None
+    return api_client
+
+
+def bench(name, operation, args, number):
+    legacy = getattr(LegacyPetApi(make_client(True)), operation)
+    validated = getattr(PetApi(make_client(True)), operation)
+    unvalidated = getattr(PetApi(make_client(False)), operation)
+    legacy_time = timeit.timeit(lambda: legacy(*args), number=number)
+    validated_time = timeit.timeit(lambda: validated(*args), number=number)
+    unvalidated_time = timeit.timeit(lambda: unvalidated(*args), number=number)
+    print("%-30s legacy %8.3fs  validated %8.3fs  not validated %8.3fs  "
+          "speedup x%.2f / x%.2f"
+          % (name, legacy_time, validated_time, unvalidated_time,
+             legacy_time / validated_time, legacy_time / unvalidated_time))
+
+
+if __name__ == '__main__':
+    pet = Pet.from_dict({
+        "id": 1,
+        "category": {"id": 1, "name": "dogs"},
+        "name": "doggie",
+        "photoUrls": ["http://foo.bar.com/1"],
+        "tags": [{"id": 1, "name": "tag1"}],
+        "status": "available",
+    })
+    bench("get_pet_by_id", "get_pet_by_id", (1,), 20000)
+    bench("find_pets_by_status", "find_pets_by_status",
+          (["available", "pending"],), 20000)
+    bench("add_pet", "add_pet", (pet,), 20000)
@@ -0,0 +1,146 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+Microbenchmark for the regular expression and enum validators of the
+generated models.
+
+Compares the models against subclasses overriding their validators with a
+reference implementation of the former generated code, which matched the
+literal patterns with `re.match` and looked the values up in inline tuples.
+
+$ cd OpenAPIPetstore-python
+$ PYTHONPATH=. python benchmarks/bench_validators.py
+"""
+import re
+import timeit
+
+from pydantic import field_validator
+
+import petstore_api
+
+FORMAT_TEST = {
+    "integer": 10, "int32": 20, "int64": 30, "number": 33, "float": 54.3,
+    "double": 67.8, "decimal": "1.5", "string": "abc", "byte": "YWJj",
+    "binary": "abc", "date": "2020-01-02",
+    "dateTime": "2020-01-02T03:04:05Z",
+    "uuid": "72f98069-206d-4f12-9f12-3d1e525a8e84",
+    "password": "0123456789", "pattern_with_digits": "0123456789",
+    "pattern_with_digits_and_delimiter": "image_123",
+}
+
+ENUM_TEST = {
+    "enum_string": "lower", "enum_string_required": "UPPER",
+    "enum_integer_default": 14, "enum_integer": -1, "enum_number": -1.2,
+}
+
+ENUM_ARRAYS = {"just_symbol": "$", "array_enum": ["fish", "crab"] * 10}
+
+
+class LegacyFormatTest(petstore_api.FormatTest):
+
+    @field_validator('string')
+    def string_validate_regular_expression(cls, value):
+        if value is None:
+            return value
+        if not re.match(r"[a-z]", value ,re.IGNORECASE):
+            raise ValueError(r"must validate the regular expression /[a-z]/i")
+        return value
+
+    @field_validator('pattern_with_digits')
+    def pattern_with_digits_validate_regular_expression(cls, value):
+        if value is None:
+            return value
+        if not re.match(r"^\d{10}$", value):
+            raise ValueError(r"must validate the regular expression /^\d{10}$/")
+        return value
+
+    @field_validator('pattern_with_digits_and_delimiter')
+    def pattern_with_digits_and_delimiter_validate_regular_expression(cls, value):
+        if value is None:
+            return value
+        if not re.match(r"^image_\d{1,3}$", value ,re.IGNORECASE):
+            raise ValueError(r"must validate the regular expression /^image_\d{1,3}$/i")
+        return value
+
+
+class LegacyEnumTest(petstore_api.EnumTest):
+
+    @field_validator('enum_string')
+    def enum_string_validate_enum(cls, value):
+        if value is None:
+            return value
+        if value not in ('UPPER', 'lower', ''):
+            raise ValueError("must be one of enum values ('UPPER', 'lower', '')")
+        return value
+
+    @field_validator('enum_string_required')
+    def enum_string_required_validate_enum(cls, value):
+        if value not in ('UPPER', 'lower', ''):
+            raise ValueError("must be one of enum values ('UPPER', 'lower', '')")
+        return value
+
+    @field_validator('enum_integer_default')
+    def enum_integer_default_validate_enum(cls, value):
+        if value is None:
+            return value
+        if value not in (1, 5, 14):
+            raise ValueError("must be one of enum values (1, 5, 14)")
+        return value
+
+    @field_validator('enum_integer')
+    def enum_integer_validate_enum(cls, value):
+        if value is None:
+            return value
+        if value not in (1, -1):
+            raise ValueError("must be one of enum values (1, -1)")
+        return value
+
+    @field_validator('enum_number')
+    def enum_number_validate_enum(cls, value):
+        if value is None:
+            return value
+        if value not in (1.1, -1.2):
+            raise ValueError("must be one of enum values (1.1, -1.2)")
+        return value
+
+
+class LegacyEnumArrays(petstore_api.EnumArrays):
+
+    @field_validator('just_symbol')
+    def just_symbol_validate_enum(cls, value):
+        if value is None:
+            return value
+        if value not in ('>=', '$'):
+            raise ValueError("must be one of enum values ('>=', '$')")
+        return value
+
+    @field_validator('array_enum')
+    def array_enum_validate_enum(cls, value):
+        if value is None:
+            return value
+        for i in value:
+            if i not in ('fish', 'crab'):
+                raise ValueError("each list item must be one of ('fish', 'crab')")
+        return value
+
+
+def bench(name, legacy_cls, cls, data, number):
+    assert legacy_cls.model_validate(data).to_dict() == \
+        cls.model_validate(data).to_dict()
+    legacy = timeit.timeit(lambda: legacy_cls.model_validate(data),
+                           number=number)
+    precompiled = timeit.timeit(lambda: cls.model_validate(data),
+                                number=number)
+    print("%-30s legacy %8.3fs  precompiled %8.3fs  speedup x%.2f"
+          % (name, legacy, precompiled, legacy / precompiled))
+
+
+if __name__ == '__main__':
+    bench("FormatTest", LegacyFormatTest, petstore_api.FormatTest,
+          FORMAT_TEST, 20000)
+    bench("EnumTest", LegacyEnumTest, petstore_api.EnumTest,
+          ENUM_TEST, 20000)
+    bench("EnumArrays (20 items)", LegacyEnumArrays, petstore_api.EnumArrays,
+          ENUM_ARRAYS, 20000)
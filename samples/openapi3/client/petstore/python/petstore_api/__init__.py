@@ -16,104 +16,251 @@
 
 __version__ = "1.0.0"
 
-# import apis into sdk package
-from petstore_api.api.another_fake_api import AnotherFakeApi
-from petstore_api.api.default_api import DefaultApi
-from petstore_api.api.fake_api import FakeApi
-from petstore_api.api.fake_classname_tags123_api import FakeClassnameTags123Api
-from petstore_api.api.pet_api import PetApi
-from petstore_api.api.store_api import StoreApi
-from petstore_api.api.user_api import UserApi
-
-# import ApiClient
-from petstore_api.api_response import ApiResponse
-from petstore_api.api_client import ApiClient
-from petstore_api.configuration import Configuration
-from petstore_api.exceptions import OpenApiException
-from petstore_api.exceptions import ApiTypeError
-from petstore_api.exceptions import ApiValueError
-from petstore_api.exceptions import ApiKeyError
-from petstore_api.exceptions import ApiAttributeError
-from petstore_api.exceptions import ApiException
-from petstore_api.signing import HttpSigningConfiguration
-
-# import models into sdk package
-from petstore_api.models.additional_properties_any_type import AdditionalPropertiesAnyType
-from petstore_api.models.additional_properties_class import AdditionalPropertiesClass
-from petstore_api.models.additional_properties_object import AdditionalPropertiesObject
-from petstore_api.models.additional_properties_with_description_only import AdditionalPropertiesWithDescriptionOnly
-from petstore_api.models.all_of_with_single_ref import AllOfWithSingleRef
-from petstore_api.models.animal import Animal
-from petstore_api.models.any_of_color import AnyOfColor
-from petstore_api.models.any_of_pig import AnyOfPig
-from petstore_api.models.api_response import ApiResponse
-from petstore_api.models.array_of_array_of_model import ArrayOfArrayOfModel
-from petstore_api.models.array_of_array_of_number_only import ArrayOfArrayOfNumberOnly
-from petstore_api.models.array_of_number_only import ArrayOfNumberOnly
-from petstore_api.models.array_test import ArrayTest
-from petstore_api.models.basque_pig import BasquePig
-from petstore_api.models.capitalization import Capitalization
-from petstore_api.models.cat import Cat
-from petstore_api.models.category import Category
-from petstore_api.models.circular_reference_model import CircularReferenceModel
-from petstore_api.models.class_model import ClassModel
-from petstore_api.models.client import Client
-from petstore_api.models.color import Color
-from petstore_api.models.creature import Creature
-from petstore_api.models.creature_info import CreatureInfo
-from petstore_api.models.danish_pig import DanishPig
-from petstore_api.models.deprecated_object import DeprecatedObject
-from petstore_api.models.dog import Dog
-from petstore_api.models.dummy_model import DummyModel
-from petstore_api.models.enum_arrays import EnumArrays
-from petstore_api.models.enum_class import EnumClass
-from petstore_api.models.enum_string1 import EnumString1
-from petstore_api.models.enum_string2 import EnumString2
-from petstore_api.models.enum_test import EnumTest
-from petstore_api.models.file import File
-from petstore_api.models.file_schema_test_class import FileSchemaTestClass
-from petstore_api.models.first_ref import FirstRef
-from petstore_api.models.foo import Foo
-from petstore_api.models.foo_get_default_response import FooGetDefaultResponse
-from petstore_api.models.format_test import FormatTest
-from petstore_api.models.has_only_read_only import HasOnlyReadOnly
-from petstore_api.models.health_check_result import HealthCheckResult
-from petstore_api.models.inner_dict_with_property import InnerDictWithProperty
-from petstore_api.models.int_or_string import IntOrString
-from petstore_api.models.list_class import ListClass
-from petstore_api.models.map_of_array_of_model import MapOfArrayOfModel
-from petstore_api.models.map_test import MapTest
-from petstore_api.models.mixed_properties_and_additional_properties_class import MixedPropertiesAndAdditionalPropertiesClass
-from petstore_api.models.model200_response import Model200Response
-from petstore_api.models.model_return import ModelReturn
-from petstore_api.models.name import Name
-from petstore_api.models.nullable_class import NullableClass
-from petstore_api.models.nullable_property import NullableProperty
-from petstore_api.models.number_only import NumberOnly
-from petstore_api.models.object_to_test_additional_properties import ObjectToTestAdditionalProperties
-from petstore_api.models.object_with_deprecated_fields import ObjectWithDeprecatedFields
-from petstore_api.models.one_of_enum_string import OneOfEnumString
-from petstore_api.models.order import Order
-from petstore_api.models.outer_composite import OuterComposite
-from petstore_api.models.outer_enum import OuterEnum
-from petstore_api.models.outer_enum_default_value import OuterEnumDefaultValue
-from petstore_api.models.outer_enum_integer import OuterEnumInteger
-from petstore_api.models.outer_enum_integer_default_value import OuterEnumIntegerDefaultValue
-from petstore_api.models.outer_object_with_enum_property import OuterObjectWithEnumProperty
-from petstore_api.models.parent import Parent
-from petstore_api.models.parent_with_optional_dict import ParentWithOptionalDict
-from petstore_api.models.pet import Pet
-from petstore_api.models.pig import Pig
-from petstore_api.models.property_name_collision import PropertyNameCollision
-from petstore_api.models.read_only_first import ReadOnlyFirst
-from petstore_api.models.second_ref import SecondRef
-from petstore_api.models.self_reference_model import SelfReferenceModel
-from petstore_api.models.single_ref_type import SingleRefType
-from petstore_api.models.special_character_enum import SpecialCharacterEnum
-from petstore_api.models.special_model_name import SpecialModelName
-from petstore_api.models.special_name import SpecialName
-from petstore_api.models.tag import Tag
-from petstore_api.models.test_inline_freeform_additional_properties_request import TestInlineFreeformAdditionalPropertiesRequest
-from petstore_api.models.tiger import Tiger
-from petstore_api.models.user import User
-from petstore_api.models.with_nested_one_of import WithNestedOneOf
+import importlib
+from typing import TYPE_CHECKING
+
+# The public names are imported on first access (PEP 562), so that importing
+# the package does not import every API and model module.
+_LAZY_IMPORTS = {
+    # apis
+    'AnotherFakeApi': 'petstore_api.api.another_fake_api',
+    'DefaultApi': 'petstore_api.api.default_api',
+    'FakeApi': 'petstore_api.api.fake_api',
+    'FakeClassnameTags123Api': 'petstore_api.api.fake_classname_tags123_api',
+    'PetApi': 'petstore_api.api.pet_api',
+    'StoreApi': 'petstore_api.api.store_api',
+    'UserApi': 'petstore_api.api.user_api',
+    # ApiClient
+    'ApiResponse': 'petstore_api.api_response',
+    'ApiClient': 'petstore_api.api_client',
+    'BoundedExecutor': 'petstore_api.api_client',
+    'Configuration': 'petstore_api.configuration',
+    'ResponseCache': 'petstore_api.response_cache',
+    'OpenApiException': 'petstore_api.exceptions',
+    'ApiTypeError': 'petstore_api.exceptions',
+    'ApiValueError': 'petstore_api.exceptions',
+    'ApiKeyError': 'petstore_api.exceptions',
+    'ApiAttributeError': 'petstore_api.exceptions',
+    'ApiException': 'petstore_api.exceptions',
+    'HttpSigningConfiguration': 'petstore_api.signing',
+    # models
+    'AdditionalPropertiesAnyType': 'petstore_api.models.additional_properties_any_type',
+    'AdditionalPropertiesClass': 'petstore_api.models.additional_properties_class',
+    'AdditionalPropertiesObject': 'petstore_api.models.additional_properties_object',
+    'AdditionalPropertiesWithDescriptionOnly': 'petstore_api.models.additional_properties_with_description_only',
+    'AllOfWithSingleRef': 'petstore_api.models.all_of_with_single_ref',
+    'Animal': 'petstore_api.models.animal',
+    'AnyOfColor': 'petstore_api.models.any_of_color',
+    'AnyOfPig': 'petstore_api.models.any_of_pig',
+    'ApiResponse': 'petstore_api.models.api_response',
+    'ArrayOfArrayOfModel': 'petstore_api.models.array_of_array_of_model',
+    'ArrayOfArrayOfNumberOnly': 'petstore_api.models.array_of_array_of_number_only',
+    'ArrayOfNumberOnly': 'petstore_api.models.array_of_number_only',
+    'ArrayTest': 'petstore_api.models.array_test',
+    'BasquePig': 'petstore_api.models.basque_pig',
+    'Capitalization': 'petstore_api.models.capitalization',
+    'Cat': 'petstore_api.models.cat',
+    'Category': 'petstore_api.models.category',
+    'CircularReferenceModel': 'petstore_api.models.circular_reference_model',
+    'ClassModel': 'petstore_api.models.class_model',
+    'Client': 'petstore_api.models.client',
+    'Color': 'petstore_api.models.color',
+    'Creature': 'petstore_api.models.creature',
+    'CreatureInfo': 'petstore_api.models.creature_info',
+    'DanishPig': 'petstore_api.models.danish_pig',
+    'DeprecatedObject': 'petstore_api.models.deprecated_object',
+    'Dog': 'petstore_api.models.dog',
+    'DummyModel': 'petstore_api.models.dummy_model',
+    'EnumArrays': 'petstore_api.models.enum_arrays',
+    'EnumClass': 'petstore_api.models.enum_class',
+    'EnumString1': 'petstore_api.models.enum_string1',
+    'EnumString2': 'petstore_api.models.enum_string2',
+    'EnumTest': 'petstore_api.models.enum_test',
+    'File': 'petstore_api.models.file',
+    'FileSchemaTestClass': 'petstore_api.models.file_schema_test_class',
+    'FirstRef': 'petstore_api.models.first_ref',
+    'Foo': 'petstore_api.models.foo',
+    'FooGetDefaultResponse': 'petstore_api.models.foo_get_default_response',
+    'FormatTest': 'petstore_api.models.format_test',
+    'HasOnlyReadOnly': 'petstore_api.models.has_only_read_only',
+    'HealthCheckResult': 'petstore_api.models.health_check_result',
+    'InnerDictWithProperty': 'petstore_api.models.inner_dict_with_property',
+    'IntOrString': 'petstore_api.models.int_or_string',
+    'ListClass': 'petstore_api.models.list_class',
+    'MapOfArrayOfModel': 'petstore_api.models.map_of_array_of_model',
+    'MapTest': 'petstore_api.models.map_test',
+    'MixedPropertiesAndAdditionalPropertiesClass': 'petstore_api.models.mixed_properties_and_additional_properties_class',
+    'Model200Response': 'petstore_api.models.model200_response',
+    'ModelReturn': 'petstore_api.models.model_return',
+    'Name': 'petstore_api.models.name',
+    'NullableClass': 'petstore_api.models.nullable_class',
+    'NullableProperty': 'petstore_api.models.nullable_property',
+    'NumberOnly': 'petstore_api.models.number_only',
+    'ObjectToTestAdditionalProperties': 'petstore_api.models.object_to_test_additional_properties',
+    'ObjectWithDeprecatedFields': 'petstore_api.models.object_with_deprecated_fields',
+    'OneOfEnumString': 'petstore_api.models.one_of_enum_string',
+    'Order': 'petstore_api.models.order',
+    'OuterComposite': 'petstore_api.models.outer_composite',
+    'OuterEnum': 'petstore_api.models.outer_enum',
+    'OuterEnumDefaultValue': 'petstore_api.models.outer_enum_default_value',
+    'OuterEnumInteger': 'petstore_api.models.outer_enum_integer',
+    'OuterEnumIntegerDefaultValue': 'petstore_api.models.outer_enum_integer_default_value',
+    'OuterObjectWithEnumProperty': 'petstore_api.models.outer_object_with_enum_property',
+    'Parent': 'petstore_api.models.parent',
+    'ParentWithOptionalDict': 'petstore_api.models.parent_with_optional_dict',
+    'Pet': 'petstore_api.models.pet',
+    'Pig': 'petstore_api.models.pig',
+    'PropertyNameCollision': 'petstore_api.models.property_name_collision',
+    'ReadOnlyFirst': 'petstore_api.models.read_only_first',
+    'SecondRef': 'petstore_api.models.second_ref',
+    'SelfReferenceModel': 'petstore_api.models.self_reference_model',
+    'SingleRefType': 'petstore_api.models.single_ref_type',
+    'SpecialCharacterEnum': 'petstore_api.models.special_character_enum',
+    'SpecialModelName': 'petstore_api.models.special_model_name',
+    'SpecialName': 'petstore_api.models.special_name',
+    'Tag': 'petstore_api.models.tag',
+    'TestInlineFreeformAdditionalPropertiesRequest': 'petstore_api.models.test_inline_freeform_additional_properties_request',
+    'Tiger': 'petstore_api.models.tiger',
+    'User': 'petstore_api.models.user',
+    'WithNestedOneOf': 'petstore_api.models.with_nested_one_of',
+}
+
+# submodules available as attributes of the package
+_LAZY_MODULES = frozenset((
+    'api',
+    'api_client',
+    'api_response',
+    'configuration',
+    'exceptions',
+    'json_backend',
+    'models',
+    'multipart',
+    'response_cache',
+    'rest',
+    'serialization',
+    'signing',
+    'validation',
+))
+
+__all__ = list(_LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    # import apis into sdk package
+    from petstore_api.api.another_fake_api import AnotherFakeApi
+    from petstore_api.api.default_api import DefaultApi
+    from petstore_api.api.fake_api import FakeApi
+    from petstore_api.api.fake_classname_tags123_api import FakeClassnameTags123Api
+    from petstore_api.api.pet_api import PetApi
+    from petstore_api.api.store_api import StoreApi
+    from petstore_api.api.user_api import UserApi
+
+    # import ApiClient
+    from petstore_api.api_response import ApiResponse
+    from petstore_api.api_client import ApiClient
+    from petstore_api.api_client import BoundedExecutor
+    from petstore_api.configuration import Configuration
+    from petstore_api.response_cache import ResponseCache
+    from petstore_api.exceptions import OpenApiException
+    from petstore_api.exceptions import ApiTypeError
+    from petstore_api.exceptions import ApiValueError
+    from petstore_api.exceptions import ApiKeyError
+    from petstore_api.exceptions import ApiAttributeError
+    from petstore_api.exceptions import ApiException
+    from petstore_api.signing import HttpSigningConfiguration
+
+    # import models into sdk package
+    from petstore_api.models.additional_properties_any_type import AdditionalPropertiesAnyType
+    from petstore_api.models.additional_properties_class import AdditionalPropertiesClass
+    from petstore_api.models.additional_properties_object import AdditionalPropertiesObject
+    from petstore_api.models.additional_properties_with_description_only import AdditionalPropertiesWithDescriptionOnly
+    from petstore_api.models.all_of_with_single_ref import AllOfWithSingleRef
+    from petstore_api.models.animal import Animal
+    from petstore_api.models.any_of_color import AnyOfColor
+    from petstore_api.models.any_of_pig import AnyOfPig
+    from petstore_api.models.api_response import ApiResponse
+    from petstore_api.models.array_of_array_of_model import ArrayOfArrayOfModel
+    from petstore_api.models.array_of_array_of_number_only import ArrayOfArrayOfNumberOnly
+    from petstore_api.models.array_of_number_only import ArrayOfNumberOnly
+    from petstore_api.models.array_test import ArrayTest
+    from petstore_api.models.basque_pig import BasquePig
+    from petstore_api.models.capitalization import Capitalization
+    from petstore_api.models.cat import Cat
+    from petstore_api.models.category import Category
+    from petstore_api.models.circular_reference_model import CircularReferenceModel
+    from petstore_api.models.class_model import ClassModel
+    from petstore_api.models.client import Client
+    from petstore_api.models.color import Color
+    from petstore_api.models.creature import Creature
+    from petstore_api.models.creature_info import CreatureInfo
+    from petstore_api.models.danish_pig import DanishPig
+    from petstore_api.models.deprecated_object import DeprecatedObject
+    from petstore_api.models.dog import Dog
+    from petstore_api.models.dummy_model import DummyModel
+    from petstore_api.models.enum_arrays import EnumArrays
+    from petstore_api.models.enum_class import EnumClass
+    from petstore_api.models.enum_string1 import EnumString1
+    from petstore_api.models.enum_string2 import EnumString2
+    from petstore_api.models.enum_test import EnumTest
+    from petstore_api.models.file import File
+    from petstore_api.models.file_schema_test_class import FileSchemaTestClass
+    from petstore_api.models.first_ref import FirstRef
+    from petstore_api.models.foo import Foo
+    from petstore_api.models.foo_get_default_response import FooGetDefaultResponse
+    from petstore_api.models.format_test import FormatTest
+    from petstore_api.models.has_only_read_only import HasOnlyReadOnly
+    from petstore_api.models.health_check_result import HealthCheckResult
+    from petstore_api.models.inner_dict_with_property import InnerDictWithProperty
+    from petstore_api.models.int_or_string import IntOrString
+    from petstore_api.models.list_class import ListClass
+    from petstore_api.models.map_of_array_of_model import MapOfArrayOfModel
+    from petstore_api.models.map_test import MapTest
+    from petstore_api.models.mixed_properties_and_additional_properties_class import MixedPropertiesAndAdditionalPropertiesClass
+    from petstore_api.models.model200_response import Model200Response
+    from petstore_api.models.model_return import ModelReturn
+    from petstore_api.models.name import Name
+    from petstore_api.models.nullable_class import NullableClass
+    from petstore_api.models.nullable_property import NullableProperty
+    from petstore_api.models.number_only import NumberOnly
+    from petstore_api.models.object_to_test_additional_properties import ObjectToTestAdditionalProperties
+    from petstore_api.models.object_with_deprecated_fields import ObjectWithDeprecatedFields
+    from petstore_api.models.one_of_enum_string import OneOfEnumString
+    from petstore_api.models.order import Order
+    from petstore_api.models.outer_composite import OuterComposite
+    from petstore_api.models.outer_enum import OuterEnum
+    from petstore_api.models.outer_enum_default_value import OuterEnumDefaultValue
+    from petstore_api.models.outer_enum_integer import OuterEnumInteger
+    from petstore_api.models.outer_enum_integer_default_value import OuterEnumIntegerDefaultValue
+    from petstore_api.models.outer_object_with_enum_property import OuterObjectWithEnumProperty
+    from petstore_api.models.parent import Parent
+    from petstore_api.models.parent_with_optional_dict import ParentWithOptionalDict
+    from petstore_api.models.pet import Pet
+    from petstore_api.models.pig import Pig
+    from petstore_api.models.property_name_collision import PropertyNameCollision
+    from petstore_api.models.read_only_first import ReadOnlyFirst
+    from petstore_api.models.second_ref import SecondRef
+    from petstore_api.models.self_reference_model import SelfReferenceModel
+    from petstore_api.models.single_ref_type import SingleRefType
+    from petstore_api.models.special_character_enum import SpecialCharacterEnum
+    from petstore_api.models.special_model_name import SpecialModelName
+    from petstore_api.models.special_name import SpecialName
+    from petstore_api.models.tag import Tag
+    from petstore_api.models.test_inline_freeform_additional_properties_request import TestInlineFreeformAdditionalPropertiesRequest
+    from petstore_api.models.tiger import Tiger
+    from petstore_api.models.user import User
+    from petstore_api.models.with_nested_one_of import WithNestedOneOf
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    elif name in _LAZY_MODULES:
+        value = importlib.import_module(__name__ + '.' + name)
+    else:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _LAZY_MODULES)
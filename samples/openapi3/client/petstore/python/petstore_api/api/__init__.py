@@ -1,11 +1,46 @@
 # flake8: noqa
 
-# import apis into api package
-from petstore_api.api.another_fake_api import AnotherFakeApi
-from petstore_api.api.default_api import DefaultApi
-from petstore_api.api.fake_api import FakeApi
-from petstore_api.api.fake_classname_tags123_api import FakeClassnameTags123Api
-from petstore_api.api.pet_api import PetApi
-from petstore_api.api.store_api import StoreApi
-from petstore_api.api.user_api import UserApi
+import importlib
+from typing import TYPE_CHECKING
 
+# The apis are imported on first access (PEP 562).
+_LAZY_IMPORTS = {
+    'AnotherFakeApi': 'petstore_api.api.another_fake_api',
+    'DefaultApi': 'petstore_api.api.default_api',
+    'FakeApi': 'petstore_api.api.fake_api',
+    'FakeClassnameTags123Api': 'petstore_api.api.fake_classname_tags123_api',
+    'PetApi': 'petstore_api.api.pet_api',
+    'StoreApi': 'petstore_api.api.store_api',
+    'UserApi': 'petstore_api.api.user_api',
+}
+
+_LAZY_MODULES = frozenset(
+    module.rpartition('.')[2] for module in _LAZY_IMPORTS.values())
+
+__all__ = list(_LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    # import apis into api package
+    from petstore_api.api.another_fake_api import AnotherFakeApi
+    from petstore_api.api.default_api import DefaultApi
+    from petstore_api.api.fake_api import FakeApi
+    from petstore_api.api.fake_classname_tags123_api import FakeClassnameTags123Api
+    from petstore_api.api.pet_api import PetApi
+    from petstore_api.api.store_api import StoreApi
+    from petstore_api.api.user_api import UserApi
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    elif name in _LAZY_MODULES:
+        value = importlib.import_module(__name__ + '.' + name)
+    else:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | _LAZY_MODULES)
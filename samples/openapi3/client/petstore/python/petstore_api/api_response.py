@@ -12,14 +12,32 @@ class ApiResponse:
     status_code: Optional[StrictInt] = Field(None, description="HTTP status code")
     headers: Optional[Dict[StrictStr, StrictStr]] = Field(None, description="HTTP headers")
     data: Optional[Any] = Field(None, description="Deserialized data given the data type")
-    raw_data: Optional[Any] = Field(None, description="Raw data (HTTP response body)")
 
     def __init__(self,
                  status_code=None,
                  headers=None,
                  data=None,
-                 raw_data=None) -> None:
+                 raw_data=None,
+                 encoding=None) -> None:
         self.status_code = status_code
         self.headers = headers
         self.data = data
-        self.raw_data = raw_data
+        self.__raw_data = raw_data
+        self.__encoding = encoding
+
+    @property
+    def raw_data(self) -> Optional[Any]:
+        """Raw data (HTTP response body).
+
+        When the body was kept as bytes, it is decoded with its charset on
+        first access.
+        """
+        if self.__encoding is not None and isinstance(self.__raw_data, bytes):
+            self.__raw_data = self.__raw_data.decode(self.__encoding)
+            self.__encoding = None
+        return self.__raw_data
+
+    @raw_data.setter
+    def raw_data(self, value) -> None:
+        self.__raw_data = value
+        self.__encoding = None
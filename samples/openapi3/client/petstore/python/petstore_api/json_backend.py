@@ -0,0 +1,140 @@
+# coding: utf-8
+
+"""
+    OpenAPI Petstore
+
+    This spec is mainly for testing Petstore server and contains fake endpoints, models. Please do not use this for any other purpose. Special characters: \" \\
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import json
+
+from petstore_api.exceptions import ApiValueError
+
+
+class JsonBackend:
+    """JSON encoder/decoder based on the standard library `json` module.
+
+    `dumps` keeps the output of `json.dumps` (used by the models' `to_json`),
+    `dumpb` produces the compact UTF-8 encoded form.
+    """
+
+    name = 'json'
+
+    def dumps(self, obj) -> str:
+        """Serializes `obj` to a JSON formatted str."""
+        return json.dumps(obj)
+
+    def dumpb(self, obj) -> bytes:
+        """Serializes `obj` to compact UTF-8 encoded JSON bytes."""
+        return json.dumps(obj, separators=(',', ':'),
+                          ensure_ascii=False).encode('utf-8')
+
+    def dump_body(self, obj):
+        """Serializes a request body.
+
+        The standard library backend sends the `json.dumps` output unchanged,
+        the other backends send the compact bytes of `dumpb`.
+        """
+        return json.dumps(obj)
+
+    def loads(self, data):
+        """Deserializes a JSON document given as str or bytes."""
+        return json.loads(data)
+
+
+class OrjsonBackend(JsonBackend):
+    """JSON encoder/decoder based on `orjson`."""
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj) -> str:
+        return self._dumps(obj).decode('utf-8')
+
+    def dumpb(self, obj) -> bytes:
+        return self._dumps(obj)
+
+    dump_body = dumpb
+
+    def loads(self, data):
+        return self._loads(data)
+
+
+class UjsonBackend(JsonBackend):
+    """JSON encoder/decoder based on `ujson`."""
+
+    name = 'ujson'
+
+    def __init__(self) -> None:
+        import ujson
+        self._dumps = ujson.dumps
+        self._loads = ujson.loads
+
+    def dumps(self, obj) -> str:
+        return self._dumps(obj, ensure_ascii=False,
+                           escape_forward_slashes=False)
+
+    def dumpb(self, obj) -> bytes:
+        return self.dumps(obj).encode('utf-8')
+
+    dump_body = dumpb
+
+    def loads(self, data):
+        return self._loads(data)
+
+
+JSON_BACKENDS = {
+    'json': JsonBackend,
+    'orjson': OrjsonBackend,
+    'ujson': UjsonBackend,
+}
+
+_backends = {}
+
+
+def get_backend(name):
+    """Returns the shared backend instance for a JSON library.
+
+    :param name: `json`, `orjson` or `ujson`.
+    :return: The JsonBackend instance.
+    :raises ApiValueError: if the name is unknown.
+    :raises ImportError: if the library is not installed.
+    """
+    backend = _backends.get(name)
+    if backend is None:
+        if name not in JSON_BACKENDS:
+            raise ApiValueError(
+                "Invalid JSON backend `{0}`. Must be one of {1}.".format(
+                    name, list(JSON_BACKENDS)))
+        backend = _backends[name] = JSON_BACKENDS[name]()
+    return backend
+
+
+def dumps(obj) -> str:
+    """Serializes `obj` to a JSON formatted str with the backend of the
+    default configuration.
+    """
+    return _default_backend().dumps(obj)
+
+
+def loads(data):
+    """Deserializes a JSON document with the backend of the default
+    configuration.
+    """
+    return _default_backend().loads(data)
+
+
+def _default_backend():
+    # imported here as the configuration module depends on this one
+    from petstore_api.configuration import Configuration
+    return Configuration.get_default().get_json_backend()
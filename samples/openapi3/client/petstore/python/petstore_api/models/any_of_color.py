@@ -15,6 +15,9 @@
 from __future__ import annotations
 from inspect import getfullargspec
 import json
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api import validation
 import pprint
 import re  # noqa: F401
 
@@ -24,7 +27,7 @@ from pydantic import Field
 from typing_extensions import Annotated
 from typing import Union, Any, List, TYPE_CHECKING, Optional, Dict
 from typing_extensions import Literal
-from pydantic import StrictStr, Field
+from pydantic import StrictStr, Field, model_serializer
 try:
     from typing import Self
 except ImportError:
@@ -50,7 +53,8 @@ class AnyOfColor(BaseModel):
     any_of_schemas: List[str] = Literal[ANYOFCOLOR_ANY_OF_SCHEMAS]
 
     model_config = {
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
     def __init__(self, *args, **kwargs) -> None:
@@ -65,74 +69,111 @@ class AnyOfColor(BaseModel):
 
     @field_validator('actual_instance')
     def actual_instance_must_validate_anyof(cls, v):
-        instance = AnyOfColor.model_construct()
-        error_messages = []
-        # validate data type: List[int]
-        try:
-            instance.anyof_schema_1_validator = v
-            return v
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # validate data type: List[int]
-        try:
-            instance.anyof_schema_2_validator = v
+        if cls.__validate(v, validation.candidate_index(cls)):
             return v
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # validate data type: str
-        try:
-            instance.anyof_schema_3_validator = v
-            return v
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        if error_messages:
-            # no match
-            raise ValueError("No match found when setting the actual_instance in AnyOfColor with anyOf schemas: List[int], str. Details: " + ", ".join(error_messages))
-        else:
+
+        # validate against every schema again to collect the errors
+        error_messages = []
+        if cls.__validate(v, None, error_messages):
             return v
+        # no match
+        raise ValueError("No match found when setting the actual_instance in AnyOfColor with anyOf schemas: List[int], str. Details: " + ", ".join(error_messages))
 
     @classmethod
-    def from_dict(cls, obj: dict) -> Self:
-        return cls.from_json(json.dumps(obj))
+    def __validate(cls, v, candidates, error_messages=None):
+        """Returns whether the value matches one of the anyOf schemas,
+        checking only the candidates it may match (all of them if None); the
+        errors are appended to `error_messages` if given."""
+        # validate data type: List[int]
+        if candidates is None or candidates["anyof_schema_1_validator"](v):
+            try:
+                instance = AnyOfColor.model_construct()
+                instance.anyof_schema_1_validator = v
+                return True
+            except (ValidationError, ValueError) as e:
+                if error_messages is not None:
+                    error_messages.append(str(e))
+        # validate data type: List[int]
+        if candidates is None or candidates["anyof_schema_2_validator"](v):
+            try:
+                instance = AnyOfColor.model_construct()
+                instance.anyof_schema_2_validator = v
+                return True
+            except (ValidationError, ValueError) as e:
+                if error_messages is not None:
+                    error_messages.append(str(e))
+        # validate data type: str
+        if candidates is None or candidates["anyof_schema_3_validator"](v):
+            try:
+                instance = AnyOfColor.model_construct()
+                instance.anyof_schema_3_validator = v
+                return True
+            except (ValidationError, ValueError) as e:
+                if error_messages is not None:
+                    error_messages.append(str(e))
+        return False
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Returns the object represented by the json string"""
-        instance = cls.model_construct()
+        return cls.from_dict(json_backend.loads(json_str))
+
+    @classmethod
+    def from_dict(cls, obj: Any) -> Self:
+        """Returns the object represented by the deserialized JSON value"""
+        instance = cls.__deserialize(obj, validation.candidate_index(cls))
+        if instance is not None:
+            return instance
+
+        # deserialize into every schema again to collect the errors
         error_messages = []
-        # deserialize data into List[int]
-        try:
-            # validation
-            instance.anyof_schema_1_validator = json.loads(json_str)
-            # assign value to actual_instance
-            instance.actual_instance = instance.anyof_schema_1_validator
+        instance = cls.__deserialize(obj, None, error_messages)
+        if instance is not None:
             return instance
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
+        # no match
+        raise ValueError("No match found when deserializing the JSON string into AnyOfColor with anyOf schemas: List[int], str. Details: " + ", ".join(error_messages))
+
+    @classmethod
+    def __deserialize(cls, obj, candidates, error_messages=None):
+        """Deserializes the value into the first anyOf schema it matches,
+        trying only the candidates it may match (all of them if None);
+        returns None if there is no match. The errors are appended to
+        `error_messages` if given."""
+        instance = cls.model_construct()
         # deserialize data into List[int]
-        try:
-            # validation
-            instance.anyof_schema_2_validator = json.loads(json_str)
-            # assign value to actual_instance
-            instance.actual_instance = instance.anyof_schema_2_validator
-            return instance
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
+        if candidates is None or candidates["anyof_schema_1_validator"](obj):
+            try:
+                # validation
+                instance.anyof_schema_1_validator = obj
+                # assign value to actual_instance
+                instance.actual_instance = instance.anyof_schema_1_validator
+                return instance
+            except (ValidationError, ValueError) as e:
+                if error_messages is not None:
+                    error_messages.append(str(e))
+        # deserialize data into List[int]
+        if candidates is None or candidates["anyof_schema_2_validator"](obj):
+            try:
+                # validation
+                instance.anyof_schema_2_validator = obj
+                # assign value to actual_instance
+                instance.actual_instance = instance.anyof_schema_2_validator
+                return instance
+            except (ValidationError, ValueError) as e:
+                if error_messages is not None:
+                    error_messages.append(str(e))
         # deserialize data into str
-        try:
-            # validation
-            instance.anyof_schema_3_validator = json.loads(json_str)
-            # assign value to actual_instance
-            instance.actual_instance = instance.anyof_schema_3_validator
-            return instance
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-
-        if error_messages:
-            # no match
-            raise ValueError("No match found when deserializing the JSON string into AnyOfColor with anyOf schemas: List[int], str. Details: " + ", ".join(error_messages))
-        else:
-            return instance
+        if candidates is None or candidates["anyof_schema_3_validator"](obj):
+            try:
+                # validation
+                instance.anyof_schema_3_validator = obj
+                # assign value to actual_instance
+                instance.actual_instance = instance.anyof_schema_3_validator
+                return instance
+            except (ValidationError, ValueError) as e:
+                if error_messages is not None:
+                    error_messages.append(str(e))
+        return None
 
     def to_json(self) -> str:
         """Returns the JSON representation of the actual instance"""
@@ -143,7 +184,7 @@ class AnyOfColor(BaseModel):
         if callable(to_json):
             return self.actual_instance.to_json()
         else:
-            return json.dumps(self.actual_instance)
+            return json_backend.dumps(self.actual_instance)
 
     def to_dict(self) -> dict:
         """Returns the dict representation of the actual instance"""
@@ -154,7 +195,15 @@ class AnyOfColor(BaseModel):
         if callable(to_json):
             return self.actual_instance.to_dict()
         else:
-            return json.dumps(self.actual_instance)
+            return json_backend.dumps(self.actual_instance)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to the representation of the actual
+        instance"""
+        if serialization.in_to_dict():
+            return self.to_dict()
+        return handler(self)
 
     def to_str(self) -> str:
         """Returns the string representation of the actual instance"""
@@ -16,9 +16,13 @@ from __future__ import annotations
 import pprint
 import re  # noqa: F401
 import json
+from pydantic import model_serializer
+from petstore_api import json_backend
+from petstore_api import serialization
+from petstore_api.validation import build_model
 
 
-from typing import Any, ClassVar, Dict, List, Optional
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional
 from pydantic import BaseModel, StrictFloat, StrictInt, StrictStr, field_validator
 from pydantic import Field
 from petstore_api.models.outer_enum import OuterEnum
@@ -31,6 +35,16 @@ try:
 except ImportError:
     from typing_extensions import Self
 
+_ENUM_STRING_VALUES = frozenset(['UPPER', 'lower', ''])
+
+_ENUM_STRING_REQUIRED_VALUES = frozenset(['UPPER', 'lower', ''])
+
+_ENUM_INTEGER_DEFAULT_VALUES = frozenset([1, 5, 14])
+
+_ENUM_INTEGER_VALUES = frozenset([1, -1])
+
+_ENUM_NUMBER_VALUES = frozenset([1.1, -1.2])
+
 class EnumTest(BaseModel):
     """
     EnumTest
@@ -45,7 +59,7 @@ class EnumTest(BaseModel):
     outer_enum_default_value: Optional[OuterEnumDefaultValue] = Field(default=None, alias="outerEnumDefaultValue")
     outer_enum_integer_default_value: Optional[OuterEnumIntegerDefaultValue] = Field(default=None, alias="outerEnumIntegerDefaultValue")
     additional_properties: Dict[str, Any] = {}
-    __properties: ClassVar[List[str]] = ["enum_string", "enum_string_required", "enum_integer_default", "enum_integer", "enum_number", "outerEnum", "outerEnumInteger", "outerEnumDefaultValue", "outerEnumIntegerDefaultValue"]
+    __properties: ClassVar[FrozenSet[str]] = frozenset(["enum_string", "enum_string_required", "enum_integer_default", "enum_integer", "enum_number", "outerEnum", "outerEnumInteger", "outerEnumDefaultValue", "outerEnumIntegerDefaultValue"])
 
     @field_validator('enum_string')
     def enum_string_validate_enum(cls, value):
@@ -53,14 +67,14 @@ class EnumTest(BaseModel):
         if value is None:
             return value
 
-        if value not in ('UPPER', 'lower', ''):
+        if value not in _ENUM_STRING_VALUES:
             raise ValueError("must be one of enum values ('UPPER', 'lower', '')")
         return value
 
     @field_validator('enum_string_required')
     def enum_string_required_validate_enum(cls, value):
         """Validates the enum"""
-        if value not in ('UPPER', 'lower', ''):
+        if value not in _ENUM_STRING_REQUIRED_VALUES:
             raise ValueError("must be one of enum values ('UPPER', 'lower', '')")
         return value
 
@@ -70,7 +84,7 @@ class EnumTest(BaseModel):
         if value is None:
             return value
 
-        if value not in (1, 5, 14):
+        if value not in _ENUM_INTEGER_DEFAULT_VALUES:
             raise ValueError("must be one of enum values (1, 5, 14)")
         return value
 
@@ -80,7 +94,7 @@ class EnumTest(BaseModel):
         if value is None:
             return value
 
-        if value not in (1, -1):
+        if value not in _ENUM_INTEGER_VALUES:
             raise ValueError("must be one of enum values (1, -1)")
         return value
 
@@ -90,41 +104,55 @@ class EnumTest(BaseModel):
         if value is None:
             return value
 
-        if value not in (1.1, -1.2):
+        if value not in _ENUM_NUMBER_VALUES:
             raise ValueError("must be one of enum values (1.1, -1.2)")
         return value
 
     model_config = {
         "populate_by_name": True,
-        "validate_assignment": True
+        "validate_assignment": True,
+        "defer_build": True
     }
 
 
+    def __getattr__(self, name: str) -> Any:
+        """Allocates the additional properties of compact models on first
+        access, see petstore_api.validation.compact"""
+        if name == "additional_properties":
+            self.__dict__[name] = {}
+            return self.__dict__[name]
+        return super().__getattr__(name)
+
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
         return pprint.pformat(self.model_dump(by_alias=True))
 
     def to_json(self) -> str:
         """Returns the JSON representation of the model using alias"""
-        # TODO: pydantic v2: use .model_dump_json(by_alias=True, exclude_unset=True) instead
-        return json.dumps(self.to_dict())
+        # not model_dump_json, which differs from json.dumps (e.g. separators)
+        return json_backend.dumps(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Create an instance of EnumTest from a JSON string"""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(json_backend.loads(json_str))
 
     def to_dict(self):
         """Returns the dictionary representation of the model using alias"""
-        _dict = self.model_dump(by_alias=True,
-                          exclude={
-                            "additional_properties"
-                          },
-                          exclude_none=True)
+        return serialization.to_dict(self)
+
+    @model_serializer(mode="wrap")
+    def serialize_model(self, handler):
+        """Dumps the model; in `to_dict`, to its dictionary representation"""
+        _dict = handler(self)
+        if not serialization.in_to_dict():
+            return _dict
         # puts key-value pairs in additional_properties in the top level
-        if self.additional_properties is not None:
-            for _key, _value in self.additional_properties.items():
-                _dict[_key] = _value
+        _dict.pop("additional_properties", None)
+        # not allocated by compact models while empty
+        _additional_properties = self.__dict__.get("additional_properties")
+        if _additional_properties is not None:
+            _dict.update(_additional_properties)
 
         # set to None if outer_enum (nullable) is None
         # and model_fields_set contains the field
@@ -142,10 +170,11 @@ class EnumTest(BaseModel):
         if not isinstance(obj, dict):
             return cls.model_validate(obj)
 
-        _obj = cls.model_validate({
+        _enum_integer_default = obj.get("enum_integer_default")
+        _obj = build_model(cls, {
             "enum_string": obj.get("enum_string"),
             "enum_string_required": obj.get("enum_string_required"),
-            "enum_integer_default": obj.get("enum_integer_default") if obj.get("enum_integer_default") is not None else 5,
+            "enum_integer_default": _enum_integer_default if _enum_integer_default is not None else 5,
             "enum_integer": obj.get("enum_integer"),
             "enum_number": obj.get("enum_number"),
             "outerEnum": obj.get("outerEnum"),
@@ -154,9 +183,9 @@ class EnumTest(BaseModel):
             "outerEnumIntegerDefaultValue": obj.get("outerEnumIntegerDefaultValue")
         })
         # store additional fields in additional_properties
-        for _key in obj.keys():
+        for _key, _value in obj.items():
             if _key not in cls.__properties:
-                _obj.additional_properties[_key] = obj.get(_key)
+                _obj.additional_properties[_key] = _value
 
         return _obj
 
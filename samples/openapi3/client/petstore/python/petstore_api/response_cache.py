@@ -0,0 +1,381 @@
+# coding: utf-8
+
+"""
+    OpenAPI Petstore
+
+    This spec is mainly for testing Petstore server and contains fake endpoints, models. Please do not use this for any other purpose. Special characters: \" \\
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import collections
+import email.utils
+import hashlib
+import http.client
+import json
+import os
+import tempfile
+import threading
+import time
+
+from petstore_api.rest import LazilyDecodedData
+
+
+def parse_cache_control(value):
+    """Parses a `Cache-Control` header.
+
+    :param value: The header value, or None.
+    :return: dict of the lowercased directives to their value (None for
+        directives without a value).
+    """
+    directives = {}
+    if not value:
+        return directives
+    for directive in value.split(','):
+        name, _, argument = directive.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+def _parse_http_date(value):
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class CachedResponse(LazilyDecodedData):
+    """Response served from a cache entry, with the interface of the
+    RESTResponse of the rest module."""
+
+    def __init__(self, entry) -> None:
+        self.status = entry.status
+        self.reason = entry.reason
+        self.data = entry.body
+        self.headers = entry.headers
+
+    def getheaders(self):
+        """Returns the (case insensitive) response headers."""
+        return self.headers
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.headers.get(name, default)
+
+
+class CacheEntry:
+    """A cached GET response.
+
+    `data` maps response types to the data deserialized from the body.
+    """
+
+    # headers of a 304 response updating the stored response
+    REVALIDATION_HEADERS = ('Cache-Control', 'Expires', 'Date', 'ETag',
+                            'Last-Modified', 'Age')
+
+    def __init__(self, key, status, reason, headers, body, vary,
+                 stored_at) -> None:
+        self.key = key
+        self.status = status
+        self.reason = reason
+        self.headers = http.client.HTTPMessage()
+        for name, value in headers:
+            self.headers[name] = value
+        self.body = body
+        self.vary = vary
+        self.stored_at = stored_at
+        self.expires_at = stored_at
+        self.data = {}
+        self.update_freshness(stored_at)
+
+    @property
+    def size(self):
+        """Approximate size of the entry in bytes."""
+        return len(self.body) + sum(len(name) + len(value)
+                                    for name, value in self.headers.items())
+
+    def update_freshness(self, now):
+        """Computes the expiration time from the response headers."""
+        cache_control = parse_cache_control(self.headers.get('Cache-Control'))
+        lifetime = 0
+        if 'no-cache' in cache_control:
+            lifetime = 0
+        elif 'max-age' in cache_control:
+            try:
+                lifetime = int(cache_control['max-age'])
+            except (TypeError, ValueError):
+                lifetime = 0
+        elif 'Expires' in self.headers:
+            expires = _parse_http_date(self.headers['Expires'])
+            date = _parse_http_date(self.headers.get('Date')) or now
+            # an invalid date means already expired
+            lifetime = expires - date if expires is not None else 0
+        try:
+            age = max(0, int(self.headers.get('Age', 0)))
+        except ValueError:
+            age = 0
+        self.expires_at = now + lifetime - age
+
+    def is_fresh(self, now=None):
+        """Whether the entry can be used without revalidation."""
+        return (now if now is not None else time.time()) < self.expires_at
+
+    def conditional_headers(self):
+        """Returns the headers revalidating the entry."""
+        headers = {}
+        if 'ETag' in self.headers:
+            headers['If-None-Match'] = self.headers['ETag']
+        if 'Last-Modified' in self.headers:
+            headers['If-Modified-Since'] = self.headers['Last-Modified']
+        return headers
+
+    def revalidated(self, headers, now=None):
+        """Updates the entry with the headers of a 304 response."""
+        now = now if now is not None else time.time()
+        for name in self.REVALIDATION_HEADERS:
+            value = headers.get(name)
+            if value is not None:
+                del self.headers[name]
+                self.headers[name] = value
+        self.stored_at = now
+        self.update_freshness(now)
+
+    def response(self):
+        """Returns a response object with the cached status, headers and
+        body."""
+        return CachedResponse(self)
+
+    def to_bytes(self):
+        meta = {
+            'key': self.key,
+            'status': self.status,
+            'reason': self.reason,
+            'headers': list(self.headers.items()),
+            'vary': self.vary,
+            'stored_at': self.stored_at,
+        }
+        return json.dumps(meta).encode('utf-8') + b'\n' + self.body
+
+    @classmethod
+    def from_bytes(cls, data):
+        meta, _, body = data.partition(b'\n')
+        meta = json.loads(meta)
+        return cls(meta['key'], meta['status'], meta['reason'],
+                   meta['headers'], body, meta['vary'], meta['stored_at'])
+
+
+class ResponseCache:
+    """HTTP cache of GET responses, see `ApiClient(cache=...)`.
+
+    Responses are stored according to their `Cache-Control` and `Expires`
+    headers. Fresh responses are served without a request, stale ones are
+    revalidated with `If-None-Match`/`If-Modified-Since`. The data
+    deserialized from a response is kept with it, so neither a fresh hit nor
+    a 304 response is parsed again; it is shared between the calls served
+    from the cache and must not be modified.
+
+    Entries are kept in memory in a LRU bounded by their number and their
+    size, and optionally in a directory, where they outlive the memory
+    eviction and the process.
+
+    :param max_entries: Maximum number of entries in memory.
+    :param max_bytes: Maximum size of the entries in memory, in bytes.
+    :param directory: Directory storing the entries on disk, if any.
+    """
+
+    # request headers the responses are not keyed on: the cache directives
+    # and the conditional headers of the revalidation
+    UNKEYED_HEADERS = frozenset(['cache-control', 'pragma', 'if-none-match',
+                                 'if-modified-since'])
+
+    def __init__(self, max_entries=256, max_bytes=16 * 1024 * 1024,
+                 directory=None) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self._entries = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _lower(headers):
+        return {name.lower(): value for name, value in (headers or {}).items()}
+
+    def key(self, url, headers):
+        """Returns the cache key of a request.
+
+        Requests are keyed on their URL and all their other headers, which
+        include the credentials of header API keys, so that the responses to
+        a caller are not served to another. The headers are hashed: they are
+        not kept in clear in the entries stored on disk.
+        """
+        headers = sorted('%s: %s' % (name, value)
+                         for name, value in self._lower(headers).items()
+                         if name not in self.UNKEYED_HEADERS)
+        digest = hashlib.sha256('\n'.join(headers).encode('utf-8'))
+        return url + '\n' + digest.hexdigest()
+
+    def lookup(self, url, headers):
+        """Finds the entry of a GET request.
+
+        :param url: The request URL, with the query string.
+        :param headers: The request headers.
+        :return: The entry (or None) and whether it can be used without
+            revalidation.
+        """
+        lowered = self._lower(headers)
+        cache_control = parse_cache_control(lowered.get('cache-control'))
+        if 'no-store' in cache_control:
+            return None, False
+        key = self.key(url, headers)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None:
+            entry = self._load(key)
+            if entry is None:
+                return None, False
+            self._add(entry)
+        if any(lowered.get(name) != value for name, value in entry.vary.items()):
+            return None, False
+        fresh = 'no-cache' not in cache_control and entry.is_fresh()
+        return entry, fresh
+
+    def store(self, url, headers, response):
+        """Stores the response of a GET request, if it is cacheable.
+
+        :param url: The request URL, with the query string.
+        :param headers: The request headers.
+        :param response: The preloaded response.
+        :return: The new entry, or None if the response is not cacheable.
+        """
+        if response.status != 200:
+            return None
+        request_cache_control = parse_cache_control(
+            self._lower(headers).get('cache-control'))
+        response_headers = response.getheaders()
+        cache_control = parse_cache_control(
+            response_headers.get('Cache-Control'))
+        if 'no-store' in cache_control or 'no-store' in request_cache_control:
+            return None
+        vary = {}
+        if response_headers.get('Vary'):
+            lowered = self._lower(headers)
+            for name in response_headers['Vary'].split(','):
+                name = name.strip().lower()
+                if name == '*':
+                    return None
+                if name:
+                    vary[name] = lowered.get(name)
+
+        body = response.data
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        entry = CacheEntry(self.key(url, headers), response.status,
+                           response.reason, response_headers.items(), body,
+                           vary, time.time())
+        if ('ETag' not in entry.headers and
+                'Last-Modified' not in entry.headers and
+                not entry.is_fresh()):
+            # could neither be used nor revalidated
+            return None
+        self._add(entry)
+        self._save(entry)
+        return entry
+
+    def revalidated(self, entry, headers):
+        """Updates an entry with the headers of a 304 response to its
+        revalidation.
+
+        :return: The entry.
+        """
+        entry.revalidated(headers)
+        self._save(entry)
+        return entry
+
+    def invalidate(self, url):
+        """Removes the entries of a URL, including the ones on disk."""
+        prefix = url + '\n'
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                self._size -= self._entries.pop(key).size
+        if self.directory is not None:
+            # the entries evicted from the memory are on disk only
+            prefix = self._file_prefix(url)
+            for name in os.listdir(self.directory):
+                if name.startswith(prefix) and name.endswith('.cache'):
+                    self._remove(os.path.join(self.directory, name))
+
+    def clear(self):
+        """Removes all the entries, including the ones on disk."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith('.cache'):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _add(self, entry):
+        size = entry.size
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(entry.key, None)
+            if previous is not None:
+                self._size -= previous.size
+            self._entries[entry.key] = entry
+            self._size += size
+            while (len(self._entries) > self.max_entries or
+                   self._size > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+
+    @staticmethod
+    def _file_prefix(url):
+        # the files of the entries of a URL share a prefix, so that they are
+        # invalidated without reading them
+        return hashlib.sha256(url.encode('utf-8')).hexdigest() + '-'
+
+    def _path(self, key):
+        url = key.rpartition('\n')[0]
+        name = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory,
+                            self._file_prefix(url) + name + '.cache')
+
+    def _load(self, key):
+        if self.directory is None:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                entry = CacheEntry.from_bytes(f.read())
+        except (OSError, ValueError, KeyError):
+            return None
+        return entry if entry.key == key else None
+
+    def _save(self, entry):
+        if self.directory is None:
+            return
+        fd, path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(entry.to_bytes())
+        os.replace(path, self._path(entry.key))
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,40 @@
+# coding: utf-8
+
+"""
+    OpenAPI Petstore
+
+    This spec is mainly for testing Petstore server and contains fake endpoints, models. Please do not use this for any other purpose. Special characters: \" \\
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import contextvars
+
+_to_dict = contextvars.ContextVar('petstore_api_to_dict', default=False)
+
+
+def to_dict(model):
+    """Returns the dictionary representation of a model using alias.
+
+    The model and the nested ones are dumped in a single pass of the pydantic
+    serializer; in this context, the `serialize_model` of each model puts its
+    additional properties at the top level, leaves out the read-only
+    properties and keeps the nullable ones explicitly set to None.
+
+    :param model: The model instance.
+    :return: dict of the model, as sent in JSON.
+    """
+    token = _to_dict.set(True)
+    try:
+        return model.model_dump(by_alias=True, exclude_none=True)
+    finally:
+        _to_dict.reset(token)
+
+
+def in_to_dict():
+    """Returns whether the models are dumped by `to_dict`."""
+    return _to_dict.get()
@@ -0,0 +1,389 @@
+# coding: utf-8
+
+"""
+    OpenAPI Petstore
+
+    This spec is mainly for testing Petstore server and contains fake endpoints, models. Please do not use this for any other purpose. Special characters: \" \\
+
+    The version of the OpenAPI document: 1.0.0
+    Generated by OpenAPI Generator (https://openapi-generator.tech)
+
+    Do not edit the class manually.
+"""  # noqa: E501
+
+
+import contextlib
+import contextvars
+import copy
+import enum
+import sys
+import threading
+from collections.abc import Mapping
+import typing
+from typing import Any, Callable, NamedTuple, Optional, Tuple
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticUndefined
+
+_trusted = contextvars.ContextVar('petstore_api_trusted', default=False)
+_compact = contextvars.ContextVar('petstore_api_compact', default=False)
+
+
+@contextlib.contextmanager
+def trusted():
+    """Context in which the models are built from their data without
+    validating it, e.g. for the responses of a trusted server.
+
+    The JSON values are only converted to the types of the fields (e.g.
+    enums, dates); constraints, validators and required fields are not
+    checked. Models built this way are equal to validated ones for valid
+    data.
+    """
+    token = _trusted.set(True)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
+
+@contextlib.contextmanager
+def compact():
+    """Context in which the models are built in a compact representation,
+    e.g. to hold many of them in memory.
+
+    The models do not allocate their additional properties until used, and
+    the strings of their enum properties are interned. They are equal to each other, but
+    not to the models built outside this context.
+    """
+    token = _compact.set(True)
+    try:
+        yield
+    finally:
+        _compact.reset(token)
+
+
+# fields of the model classes with their converters, see `_compile`
+_plans = {}
+_plans_lock = threading.Lock()
+
+_NATIVE_TYPES = (str, int, bool, typing.Any, object, type(None))
+
+_setattr = object.__setattr__
+
+
+def _unwrap(annotation):
+    # drops the constraints (e.g. `Annotated[int, Strict()]`)
+    while typing.get_origin(annotation) is typing.Annotated:
+        annotation = typing.get_args(annotation)[0]
+    return annotation
+
+
+def _converter(annotation):
+    """Returns the callable converting a JSON value to the type of a field,
+    None if no conversion is needed."""
+    annotation = _unwrap(annotation)
+    if annotation in _NATIVE_TYPES:
+        return None
+    if annotation is float:
+        return float
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            # built by the from_dict of the model
+            return None
+        if issubclass(annotation, enum.Enum):
+            return annotation
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Union:
+        types = [arg for arg in args if arg is not type(None)]
+        if len(types) == 1:
+            # Optional, None values are not converted
+            return _converter(types[0])
+        if all(_converter(arg) is None for arg in types):
+            return None
+    elif origin is list and args:
+        convert = _converter(args[0])
+        if convert is None:
+            return None
+        return lambda value: [item if item is None else convert(item)
+                              for item in value]
+    elif origin is dict and len(args) == 2:
+        convert = _converter(args[1])
+        if convert is None:
+            return None
+        return lambda value: {key: item if item is None else convert(item)
+                              for key, item in value.items()}
+    # e.g. dates, bytes, unions of models: converted by pydantic
+    return TypeAdapter(annotation).validate_python
+
+
+class _Plan(NamedTuple):
+    """How the instances of a model class are built without validation."""
+
+    # (key, field name, converter) of each field
+    fields: Tuple[Tuple[str, str, Optional[Callable]], ...]
+    # (field name, default value, whether it is a factory) of the fields
+    # with a default value
+    defaults: Tuple[Tuple[str, Any, bool], ...]
+    # whether the instances are created directly rather than with
+    # `model_construct` (i.e. no extra fields, private attributes or post
+    # init hook)
+    direct: bool
+    # names of the fields holding enum strings, interned in compact instances
+    enums: Tuple[str, ...]
+
+
+def _mutable_default(default):
+    if not default:
+        # e.g. `additional_properties: Dict[str, Any] = {}`
+        return type(default)
+    return lambda: copy.deepcopy(default)
+
+
+def _built(cls):
+    """Whether the schema of a model class is built, building it first if it
+    was deferred (see the `defer_build` entry of the model config)."""
+    return cls.__pydantic_complete__ or bool(cls.model_rebuild(raise_errors=False))
+
+
+def _compile(cls):
+    """Compiles the plan building the instances of a model class."""
+    fields = []
+    defaults = []
+    for name, field in cls.model_fields.items():
+        fields.append((field.alias or name, name, _converter(field.annotation)))
+        if field.default_factory is not None:
+            defaults.append((name, field.default_factory, True))
+        elif field.default is PydanticUndefined:
+            continue
+        elif isinstance(field.default, (dict, list, set)):
+            defaults.append((name, _mutable_default(field.default), True))
+        else:
+            defaults.append((name, field.default, False))
+    direct = (cls.model_config.get('extra') != 'allow' and
+              not cls.__private_attributes__ and
+              cls.__pydantic_post_init__ is None)
+    enums = set()
+    for name, validator in cls.__pydantic_decorators__.field_validators.items():
+        if name.endswith('_validate_enum'):
+            enums.update(validator.info.fields)
+    return _Plan(tuple(fields), tuple(defaults), direct, tuple(sorted(enums)))
+
+
+def _compact_model(model, plan):
+    fields = model.__dict__
+    for name in plan.enums:
+        value = fields.get(name)
+        if type(value) is str:
+            fields[name] = sys.intern(value)
+        elif type(value) is list:
+            for i, item in enumerate(value):
+                if type(item) is str:
+                    value[i] = sys.intern(item)
+    if fields.get('additional_properties') == {}:
+        # allocated on first access, see the `__getattr__` of the models
+        del fields['additional_properties']
+    return model
+
+
+def build_model(cls, values):
+    """Builds a model from the values of its fields, keyed by alias.
+
+    The values are validated with `model_validate`, unless the model is
+    built in a `trusted` context. In a `compact` context, the model is
+    built in a compact representation.
+
+    :param cls: The model class.
+    :param values: dict of the field values.
+    :return: The model instance.
+    """
+    trust = _trusted.get()
+    compacted = _compact.get()
+    if not trust and not compacted:
+        return cls.model_validate(values)
+    plan = _plans.get(cls)
+    if plan is None:
+        if not _built(cls):
+            # e.g. forward references not resolved yet
+            return cls.model_validate(values)
+        with _plans_lock:
+            plan = _plans.get(cls)
+            if plan is None:
+                plan = _plans[cls] = _compile(cls)
+    if not trust:
+        return _compact_model(cls.model_validate(values), plan)
+    fields = {}
+    for key, name, convert in plan.fields:
+        if key in values:
+            value = values[key]
+            if convert is not None and value is not None:
+                value = convert(value)
+            fields[name] = value
+    if not plan.direct:
+        model = cls.model_construct(**fields)
+        return _compact_model(model, plan) if compacted else model
+    fields_set = set(fields)
+    for name, default, factory in plan.defaults:
+        if name not in fields_set:
+            fields[name] = default() if factory else default
+    # what `model_construct` does, without its generic handling
+    model = cls.__new__(cls)
+    _setattr(model, '__dict__', fields)
+    _setattr(model, '__pydantic_fields_set__', fields_set)
+    _setattr(model, '__pydantic_extra__', None)
+    _setattr(model, '__pydantic_private__', None)
+    return _compact_model(model, plan) if compacted else model
+
+
+# predicates of the candidate schemas of the oneOf/anyOf model classes, see
+# `candidate_index`
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+# values which are not valid for a list, in any validation mode
+_NOT_LISTS = (str, bytes, bytearray, int, float, Mapping)
+
+
+def _always(value):
+    return True
+
+
+def _accepts_none(annotation):
+    annotation = _unwrap(annotation)
+    if annotation in (typing.Any, object, type(None)):
+        return True
+    return (typing.get_origin(annotation) is typing.Union and
+            type(None) in typing.get_args(annotation))
+
+
+def _model_predicate(cls):
+    if 'actual_instance' in cls.model_fields:
+        # oneOf/anyOf model, any value may match one of its schemas
+        return None
+    # the required properties, which may not be null
+    required = tuple(field.alias or name
+                     for name, field in cls.model_fields.items()
+                     if field.is_required() and
+                     not _accepts_none(field.annotation))
+
+    def predicate(value):
+        if isinstance(value, dict):
+            for key in required:
+                if value.get(key) is None:
+                    return False
+            return True
+        return isinstance(value, cls)
+    return predicate
+
+
+def _constraints(metadata):
+    # e.g. `Field(min_length=3)` holds `MinLen(3)`
+    yield metadata
+    for item in getattr(metadata, 'metadata', ()):
+        yield item
+
+
+def _predicate(annotation):
+    """Returns the predicate telling whether a JSON value may be valid for a
+    type, i.e. False only if it is certainly not; None if any value may be."""
+    constraints = []
+    while typing.get_origin(annotation) is typing.Annotated:
+        args = typing.get_args(annotation)
+        annotation = args[0]
+        for metadata in args[1:]:
+            constraints.extend(_constraints(metadata))
+    min_length = max((item.min_length for item in constraints
+                      if isinstance(getattr(item, 'min_length', None), int)),
+                     default=None)
+    max_length = min((item.max_length for item in constraints
+                      if isinstance(getattr(item, 'max_length', None), int)),
+                     default=None)
+    predicate = _type_predicate(
+        annotation, any(getattr(item, 'strict', None) for item in constraints))
+    if min_length is None and max_length is None:
+        return predicate
+
+    def sized(value):
+        if isinstance(value, (str, list)):
+            if min_length is not None and len(value) < min_length:
+                return False
+            if max_length is not None and len(value) > max_length:
+                return False
+        return predicate is None or predicate(value)
+    return sized
+
+
+def _type_predicate(annotation, strict):
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union:
+        predicates = []
+        for arg in typing.get_args(annotation):
+            if arg is type(None):
+                continue
+            predicate = _predicate(arg)
+            if predicate is None:
+                return None
+            predicates.append(predicate)
+        return lambda value: any(predicate(value) for predicate in predicates)
+    if origin is list:
+        return lambda value: not isinstance(value, _NOT_LISTS)
+    if origin is dict:
+        return lambda value: isinstance(value, Mapping)
+    if not isinstance(annotation, type):
+        return None
+    if issubclass(annotation, BaseModel):
+        return _model_predicate(annotation)
+    if issubclass(annotation, enum.Enum):
+        values = annotation._value2member_map_
+        return lambda value: (isinstance(value, (str, int, float)) and
+                              value in values)
+    if not strict:
+        # e.g. lax integers, parsed from strings
+        return None
+    if annotation is bool:
+        return lambda value: isinstance(value, bool)
+    if annotation is int:
+        return lambda value: (isinstance(value, int) and
+                              not isinstance(value, bool))
+    if annotation is float:
+        return lambda value: (isinstance(value, (int, float)) and
+                              not isinstance(value, bool))
+    if annotation is str:
+        return lambda value: isinstance(value, str)
+    return None
+
+
+def _none_or(predicate):
+    # None is valid for the (optional) validator fields of the candidates
+    return lambda value: value is None or predicate(value)
+
+
+def candidate_index(cls):
+    """Returns the index of the candidate schemas of a oneOf/anyOf model
+    class, from the required properties and the types of its validator
+    fields.
+
+    A candidate whose predicate is False for a value can be skipped: the
+    value is certainly not valid for it (e.g. a dict missing a required
+    property of a model, a string for a list), so it is not deserialized
+    into it nor validated against it.
+
+    :param cls: The model class.
+    :return: dict of the predicates by field name, None if the class is not
+        complete (e.g. forward references not resolved yet), in which case
+        every candidate has to be tried.
+    """
+    index = _indexes.get(cls)
+    if index is None:
+        if not _built(cls):
+            return None
+        with _indexes_lock:
+            index = _indexes.get(cls)
+            if index is None:
+                index = {}
+                for name, field in cls.model_fields.items():
+                    predicate = _predicate(field.annotation)
+                    index[name] = (_always if predicate is None
+                                   else _none_or(predicate))
+                _indexes[cls] = index
+    return index
@@ -10,10 +10,13 @@ $ pytest
 """
 
 import os
+import queue
+import threading
 import time
 import atexit
 import weakref
 import unittest
+import urllib3
 from dateutil.parser import parse
 
 import petstore_api
@@ -22,6 +25,18 @@ import petstore_api.configuration
 HOST = 'http://localhost/v2'
 
 
+class MockPoolManager(object):
+    def __init__(self, body, content_type='application/json'):
+        self.body = body
+        self.content_type = content_type
+        self.requests = []
+
+    def request(self, *args, **kwargs):
+        self.requests.append(kwargs)
+        return urllib3.HTTPResponse(status=200, body=self.body,
+                                    headers={'Content-Type': self.content_type})
+
+
 class ApiClientTests(unittest.TestCase):
 
     def setUp(self):
@@ -199,6 +214,19 @@ class ApiClientTests(unittest.TestCase):
         result = self.api_client.sanitize_for_serialization(data)
         self.assertEqual(result, list_of_pet_dict)
 
+    def test_sanitize_for_serialization_subclasses(self):
+        # enums and tuples
+        data = (petstore_api.EnumClass.LEFT_PARENTHESIS_XYZ_RIGHT_PARENTHESIS, [petstore_api.OuterEnum.PLACED, None])
+        result = self.api_client.sanitize_for_serialization(data)
+        self.assertEqual(result, ("(xyz)", ["placed", None]))
+
+        # models with dates in containers
+        order = petstore_api.Order(id=1, shipDate=parse("1997-07-16T19:20:30.45+01:00"))
+        data = {"orders": [order, order]}
+        result = self.api_client.sanitize_for_serialization(data)
+        self.assertEqual(result, {"orders": [
+            {"id": 1, "shipDate": "1997-07-16T19:20:30.450000+01:00", "complete": False}] * 2})
+
     def test_context_manager_closes_threadpool(self):
         with petstore_api.ApiClient() as client:
             self.assertIsNotNone(client.pool)
@@ -259,3 +287,323 @@ class ApiClientTests(unittest.TestCase):
 
 
 
+
+    def test_response_body_charset(self):
+        # UTF-8 bodies are parsed from bytes, raw_data and the data of the
+        # last response are decoded on access
+        body = '{"name": "café", "photoUrls": []}'
+        self.api_client.rest_client.pool_manager = MockPoolManager(
+            body.encode('utf-8'), 'application/json; charset=UTF-8')
+        response = self.api_client.call_api('/pet/1', 'GET',
+                                            response_types_map={'200': 'Pet'})
+        self.assertEqual(response.data.name, "café")
+        self.assertEqual(response.raw_data, body)
+        self.assertEqual(self.api_client.last_response.data, body)
+
+        # other charsets are decoded before parsing
+        self.api_client.rest_client.pool_manager = MockPoolManager(
+            body.encode('latin-1'), 'application/json; charset=ISO-8859-1')
+        response = self.api_client.call_api('/pet/1', 'GET',
+                                            response_types_map={'200': 'Pet'})
+        self.assertEqual(response.data.name, "café")
+        self.assertEqual(response.raw_data, body)
+        self.assertEqual(self.api_client.last_response.data, body)
+
+        # bytearray bodies are not decoded
+        self.api_client.rest_client.pool_manager = MockPoolManager(
+            body.encode('utf-8'), 'application/json; charset=UTF-8')
+        self.api_client.call_api('/pet/1', 'GET',
+                                 response_types_map={'200': 'bytearray'})
+        self.assertEqual(self.api_client.last_response.data,
+                         body.encode('utf-8'))
+
+        # text bodies which are not JSON
+        self.api_client.rest_client.pool_manager = MockPoolManager(
+            b'not json', 'text/plain')
+        response = self.api_client.call_api('/pet/1', 'GET',
+                                            response_types_map={'200': 'str'})
+        self.assertEqual(response.data, 'not json')
+
+    def test_request_json_backend(self):
+        # the backend is looked up per request, as for the responses
+        pool_manager = MockPoolManager(b'{}')
+        self.api_client.rest_client.pool_manager = pool_manager
+        self.api_client.call_api('/pet', 'POST', body={"a": [1, 2]},
+                                 header_params={'Content-Type': 'application/json'},
+                                 response_types_map={'200': 'object'})
+        self.api_client.configuration.json_backend = "orjson"
+        self.api_client.call_api('/pet', 'POST', body={"a": [1, 2]},
+                                 header_params={'Content-Type': 'application/json'},
+                                 response_types_map={'200': 'object'})
+        self.assertEqual([request['body'] for request in pool_manager.requests],
+                         ['{"a": [1, 2]}', b'{"a":[1,2]}'])
+
+
+class OperationSpecTests(unittest.TestCase):
+
+    def setUp(self):
+        self.api_client = petstore_api.ApiClient()
+        self.calls = []
+        self.api_client.call_api = lambda *args, **kwargs: self.calls.append((args, kwargs))
+
+    def test_create(self):
+        spec = petstore_api.api.PetApi._find_pets_by_status_operation
+        self.assertEqual(spec.accept, 'application/json')
+        self.assertEqual(spec.path_template, ('/pet/findByStatus',))
+        self.assertEqual(dict(spec.collection_formats), {'status': 'csv'})
+        self.assertNotIn('_host_index', spec.options)
+        with self.assertRaises(TypeError):
+            spec.response_types_map['200'] = None
+
+        spec = petstore_api.api.UserApi._create_user_operation
+        self.assertIn('_host_index', spec.options)
+        self.assertEqual(spec.content_type, 'application/json')
+
+    def test_path_params(self):
+        spec = petstore_api.api_client.OperationSpec.create(
+            'op', 'GET', '/a/{id}/b/{names}/{missing}',
+            params=[
+                petstore_api.api_client.ParamSpec('id', 'path', 'id'),
+                petstore_api.api_client.ParamSpec('names', 'path', 'names', collection_format='csv'),
+                petstore_api.api_client.ParamSpec('missing', 'path', 'missing'),
+            ])
+        self.api_client.call_operation(spec, ['x/y', ['c', 'd'], None], {})
+        args, kwargs = self.calls[0]
+        self.assertEqual(args[:3], ('/a/x%2Fy/b/c%2Cd/{missing}', 'GET', {}))
+
+    def test_params(self):
+        pet_api = petstore_api.PetApi(self.api_client)
+        pet_api.find_pets_by_status_with_http_info(
+            ['available'], _headers={'Accept': 'text/plain', 'X-Test': '1'},
+            _request_timeout=5)
+        args, kwargs = self.calls[0]
+        self.assertEqual(args, ('/pet/findByStatus', 'GET', {},
+                                [('status', ['available'])],
+                                {'X-Test': '1', 'Accept': 'application/json'}))
+        self.assertEqual(kwargs['_request_timeout'], 5)
+        self.assertEqual(kwargs['collection_formats'], {'status': 'csv'})
+        self.assertEqual(kwargs['response_types_map'],
+                         {'200': "List[Pet]", '400': None})
+
+        with self.assertWarns(DeprecationWarning):
+            pet_api.find_pets_by_tags_with_http_info(['tag'])
+
+        with self.assertRaises(petstore_api.ApiTypeError):
+            pet_api.find_pets_by_status_with_http_info(['available'], _host_index=1)
+
+        user_api = petstore_api.UserApi(self.api_client)
+        user_api.create_user_with_http_info(petstore_api.User(), _host_index=1)
+        self.assertEqual(self.calls[-1][1]['_host'], 'http://path-server-test.petstore.local/v2')
+        self.api_client.configuration = petstore_api.Configuration()
+        self.api_client.configuration.server_operation_index['create_user'] = 2
+        self.api_client.configuration.server_operation_variables['create_user'] = {
+            'server': 'qa-petstore', 'port': '8080'}
+        user_api.create_user_with_http_info(petstore_api.User())
+        self.assertEqual(self.calls[-1][1]['_host'], 'http://qa-petstore.swagger.io:8080/v2')
+        with self.assertRaises(petstore_api.ApiValueError):
+            user_api.create_user_with_http_info(petstore_api.User(), _host_index=3)
+
+
+class ExecutorTests(unittest.TestCase):
+
+    def test_async_req_with_executor(self):
+        with petstore_api.BoundedExecutor(max_workers=2) as executor:
+            clients = [petstore_api.ApiClient(executor=executor) for _ in range(2)]
+            for client in clients:
+                client.rest_client.pool_manager = MockPoolManager(b'[1, 2]')
+            futures = [client.call_api('/a', 'GET', response_types_map={'200': 'List[int]'},
+                                       _return_http_data_only=True, async_req=True)
+                       for client in clients]
+            self.assertEqual([f.result() for f in futures], [[1, 2], [1, 2]])
+            # the executor is not owned by the clients
+            clients[0].close()
+            self.assertIsNone(clients[0]._pool)
+            self.assertEqual(clients[1].call_api('/a', 'GET', response_types_map={}, async_req=True).result().status_code, 200)
+
+    def test_bounded_queue(self):
+        release = threading.Event()
+        with petstore_api.BoundedExecutor(max_workers=1, queue_size=1, policy='reject') as executor:
+            first = executor.submit(release.wait)
+            second = executor.submit(lambda: 2)
+            with self.assertRaises(queue.Full):
+                executor.submit(lambda: 3)
+            release.set()
+            self.assertTrue(first.result())
+            self.assertEqual(second.result(), 2)
+            self.assertEqual(executor.submit(lambda: 4).result(), 4)
+
+        with self.assertRaises(petstore_api.ApiValueError):
+            petstore_api.BoundedExecutor(policy='drop')
+
+    def test_blocking_queue(self):
+        release = threading.Event()
+        with petstore_api.BoundedExecutor(max_workers=1, policy='block') as executor:
+            first = executor.submit(release.wait)
+            submitted = []
+            thread = threading.Thread(target=lambda: submitted.append(executor.submit(lambda: 2)))
+            thread.start()
+            thread.join(0.1)
+            self.assertEqual(submitted, [])
+            release.set()
+            thread.join()
+            self.assertTrue(first.result())
+            self.assertEqual(submitted[0].result(), 2)
+
+
+class MapTests(unittest.TestCase):
+
+    def setUp(self):
+        self.api_client = petstore_api.ApiClient()
+
+    def test_map_operation(self):
+        self.api_client.rest_client.pool_manager = MockPoolManager(
+            b'{"id": 1, "name": "doggie", "photoUrls": []}')
+        pet_api = petstore_api.PetApi(self.api_client)
+        results = list(self.api_client.map(pet_api.get_pet_by_id, [1, (2,), {'pet_id': 3}, 'x']))
+        self.assertEqual([r.index for r in results], [0, 1, 2, 3])
+        self.assertEqual([r.arguments for r in results], [1, (2,), {'pet_id': 3}, 'x'])
+        for r in results[:3]:
+            self.assertIsNone(r.exception)
+            self.assertEqual(r.result.name, 'doggie')
+        # argument validation errors are reported per item
+        self.assertIsNone(results[3].result)
+        self.assertIsInstance(results[3].exception, ValueError)
+
+    def test_ordered(self):
+        def operation(delay):
+            time.sleep(delay)
+            return delay
+
+        delays = [0.2, 0.0, 0.1]
+        results = self.api_client.map(operation, delays, concurrency=3)
+        self.assertEqual([r.result for r in results], delays)
+        results = self.api_client.map(operation, delays, concurrency=3, ordered=False)
+        self.assertEqual([r.result for r in results], [0.0, 0.1, 0.2])
+
+    def test_concurrency(self):
+        lock = threading.Lock()
+        state = {'running': 0, 'max': 0}
+
+        def operation(value):
+            with lock:
+                state['running'] += 1
+                state['max'] = max(state['max'], state['running'])
+            time.sleep(0.01)
+            with lock:
+                state['running'] -= 1
+            if value % 3 == 0:
+                raise petstore_api.ApiException(status=404)
+            return value
+
+        results = list(self.api_client.map(operation, range(20), concurrency=4))
+        self.assertEqual(len(results), 20)
+        self.assertLessEqual(state['max'], 4)
+        self.assertEqual([r.result for r in results if r.exception is None],
+                         [v for v in range(20) if v % 3])
+        self.assertEqual(sum(isinstance(r.exception, petstore_api.ApiException) for r in results), 7)
+
+        with self.assertRaises(petstore_api.ApiValueError):
+            self.api_client.map(operation, range(3), concurrency=0)
+
+    def test_lazy_arguments(self):
+        consumed = []
+
+        def arguments():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        results = self.api_client.map(lambda value: value, arguments(), concurrency=2)
+        self.assertEqual(next(results).result, 0)
+        results.close()
+        self.assertLess(len(consumed), 10)
+
+
+class BlockingPoolManager(object):
+    """Answers requests once `release` is set."""
+
+    def __init__(self, body, status=200):
+        self.body = body
+        self.status = status
+        self.release = threading.Event()
+        self.urls = []
+
+    def request(self, method, url, **kwargs):
+        self.urls.append(url)
+        self.release.wait()
+        return urllib3.HTTPResponse(status=self.status, body=self.body,
+                                    headers={'Content-Type': 'application/json'})
+
+
+class CoalescingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.config = petstore_api.Configuration()
+        self.config.coalesce_requests = True
+        self.api_client = petstore_api.ApiClient(self.config, pool_threads=8)
+        self.pet_api = petstore_api.PetApi(self.api_client)
+
+    def tearDown(self):
+        self.api_client.close()
+
+    def serve(self, body=b'{"id": 42, "name": "doggie", "photoUrls": []}', status=200):
+        pool_manager = BlockingPoolManager(body, status)
+        self.api_client.rest_client.pool_manager = pool_manager
+        return pool_manager
+
+    def wait_for_requests(self, pool_manager, count):
+        deadline = time.time() + 5
+        while len(pool_manager.urls) < count and time.time() < deadline:
+            time.sleep(0.01)
+        # give the other calls time to join
+        time.sleep(0.05)
+
+    def test_identical_requests(self):
+        pool_manager = self.serve()
+        threads = [self.pet_api.get_pet_by_id(42, async_req=True) for _ in range(5)]
+        other = self.pet_api.get_pet_by_id(43, async_req=True)
+        self.wait_for_requests(pool_manager, 2)
+        pool_manager.release.set()
+        pets = [thread.get() for thread in threads]
+        self.assertEqual(pets[0].name, 'doggie')
+        self.assertTrue(all(pet is pets[0] for pet in pets))
+        self.assertIsNot(other.get(), pets[0])
+        self.assertEqual(sorted(pool_manager.urls),
+                         ['http://petstore.swagger.io:80/v2/pet/42',
+                          'http://petstore.swagger.io:80/v2/pet/43'])
+
+        # finished requests are not shared
+        self.pet_api.get_pet_by_id(42)
+        self.assertEqual(len(pool_manager.urls), 3)
+
+    def test_errors_are_shared(self):
+        pool_manager = self.serve(b'{}', status=404)
+        threads = [self.pet_api.get_pet_by_id(42, async_req=True) for _ in range(3)]
+        self.wait_for_requests(pool_manager, 1)
+        pool_manager.release.set()
+        errors = []
+        for thread in threads:
+            with self.assertRaises(petstore_api.exceptions.NotFoundException) as context:
+                thread.get()
+            errors.append(context.exception)
+        self.assertEqual(len(pool_manager.urls), 1)
+
+        # each waiting thread raises its own copy, chained to the error of
+        # the request
+        self.assertEqual(len(set(map(id, errors))), 3)
+        original = [error for error in errors if error.__cause__ is None]
+        self.assertEqual(len(original), 1)
+        for error in errors:
+            self.assertEqual((error.status, error.body), (404, '{}'))
+            if error is not original[0]:
+                self.assertIs(error.__cause__, original[0])
+
+    def test_disabled(self):
+        self.config.coalesce_requests = False
+        pool_manager = self.serve()
+        threads = [self.pet_api.get_pet_by_id(42, async_req=True) for _ in range(3)]
+        self.wait_for_requests(pool_manager, 3)
+        pool_manager.release.set()
+        for thread in threads:
+            thread.get()
+        self.assertEqual(len(pool_manager.urls), 3)
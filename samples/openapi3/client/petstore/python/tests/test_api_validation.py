@@ -12,6 +12,7 @@ $ pytest
 import os
 import sys
 import unittest
+from unittest import mock
 
 import petstore_api
 from petstore_api.rest import ApiException
@@ -79,3 +80,23 @@ class ApiExceptionTests(unittest.TestCase):
 
     def checkRegex(self, text, expected_regex):
         return self.assertRegex(text, expected_regex)
+
+    def test_validation_disabled(self):
+        self.api_client.client_side_validation = False
+        with mock.patch.object(self.api_client, 'call_operation',
+                               return_value=None) as call_operation:
+            # not a valid integer, passed as is
+            self.pet_api.get_pet_by_id("123")
+        call_operation.assert_called_once_with(
+            petstore_api.PetApi._get_pet_by_id_operation, ["123"],
+            {'_return_http_data_only': True})
+
+    def test_validated_once(self):
+        with mock.patch.object(self.api_client, 'call_operation',
+                               return_value=None) as call_operation, \
+                mock.patch.object(petstore_api.PetApi, 'add_pet_with_http_info') as with_http_info:
+            self.pet_api.add_pet(self.pet)
+        with_http_info.assert_not_called()
+        call_operation.assert_called_once()
+        with self.assertRaises(ValidationError):
+            self.pet_api.add_pet(None)
@@ -10,6 +10,9 @@ $ pytest
 """
 from __future__ import absolute_import
 
+import copy
+import threading
+import time
 import unittest
 
 import petstore_api
@@ -58,5 +61,131 @@ class TestConfiguration(unittest.TestCase):
         c1 = petstore_api.Configuration(access_token="12345")
         self.assertEqual(c1.access_token, "12345")
 
+    def testJsonBackend(self):
+        c1 = petstore_api.Configuration()
+        self.assertEqual(c1.json_backend, "json")
+        self.assertEqual(c1.get_json_backend().dumpb({"a": [1, "é"]}),
+                         '{"a":[1,"é"]}'.encode('utf-8'))
+
+        c1.json_backend = "orjson"
+        self.assertEqual(c1.get_json_backend().name, "orjson")
+        self.assertEqual(c1.get_json_backend().dump_body({"a": 1}), b'{"a":1}')
+        self.assertEqual(c1.get_json_backend().loads(b'{"a": [1, 2]}'), {"a": [1, 2]})
+
+        with self.assertRaises(petstore_api.ApiValueError):
+            c1.json_backend = "simplejson"
+        self.assertEqual(c1.json_backend, "orjson")
+
+    def testModelJsonBackend(self):
+        pet = petstore_api.Pet(name="doggie", photoUrls=["http://a/b"])
+        expected = pet.to_json()
+        self.assertEqual(expected, '{"name": "doggie", "photoUrls": ["http://a/b"]}')
+
+        c1 = petstore_api.Configuration()
+        c1.json_backend = "orjson"
+        petstore_api.Configuration.set_default(c1)
+        self.assertEqual(pet.to_json(), '{"name":"doggie","photoUrls":["http://a/b"]}')
+        self.assertEqual(petstore_api.Pet.from_json(pet.to_json()), pet)
+
+    def testAuthSettingsCache(self):
+        c1 = petstore_api.Configuration(username="user", password="secret")
+        settings = c1.auth_settings()
+        self.assertIs(c1.auth_settings(), settings)
+        self.assertEqual(settings['http_basic_test']['value'], 'Basic dXNlcjpzZWNyZXQ=')
+
+        # credentials changes are picked up, including in place changes
+        c1.password = "other"
+        self.assertEqual(c1.auth_settings()['http_basic_test']['value'], 'Basic dXNlcjpvdGhlcg==')
+        c1.api_key['api_key'] = 'a'
+        c1.api_key_prefix['api_key'] = 'Token'
+        self.assertEqual(c1.auth_settings()['api_key']['value'], 'Token a')
+        c1.api_key['api_key'] = 'b'
+        self.assertEqual(c1.auth_settings()['api_key']['value'], 'Token b')
+
+        c2 = copy.deepcopy(c1)
+        c2.access_token = 'token'
+        self.assertNotIn('petstore_auth', c1.auth_settings())
+        self.assertEqual(c2.auth_settings()['petstore_auth']['value'], 'Bearer token')
+
+    def testRefreshApiKeyHook(self):
+        calls = []
+
+        def refresh(config):
+            calls.append(threading.current_thread())
+            config.api_key['api_key'] = 'key%d' % len(calls)
+
+        # without a lifetime, the hook is run every time
+        c1 = petstore_api.Configuration()
+        c1.refresh_api_key_hook = refresh
+        self.assertEqual(c1.auth_settings()['api_key']['value'], 'key1')
+        self.assertEqual(c1.get_api_key_with_prefix('api_key'), 'key2')
+        self.assertEqual(len(calls), 2)
+
+        lifetime = [0]
+        release = threading.Event()
+        release.set()
+
+        def refresh_with_lifetime(config):
+            release.wait(5)
+            refresh(config)
+            return lifetime[0]
+
+        # expired keys are refreshed before they are used
+        c1.refresh_api_key_hook = refresh_with_lifetime
+        self.assertEqual(c1.auth_settings()['api_key']['value'], 'key3')
+        self.assertEqual(c1.auth_settings()['api_key']['value'], 'key4')
+        lifetime[0] = 60
+        self.assertEqual(c1.auth_settings()['api_key']['value'], 'key5')
+        self.assertEqual(c1.auth_settings()['api_key']['value'], 'key5')
+        self.assertEqual(len(calls), 5)
+
+        # keys about to expire are refreshed in the background
+        c1.refresh_api_key_ahead = 120
+        release.clear()
+        self.assertEqual(c1.auth_settings()['api_key']['value'], 'key5')
+        # while it runs, the current keys are used
+        self.assertEqual(c1.auth_settings()['api_key']['value'], 'key5')
+        release.set()
+        deadline = time.time() + 5
+        while len(calls) < 6 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertIsNot(calls[5], threading.current_thread())
+        c1.refresh_api_key_ahead = 0
+        self.assertEqual(c1.auth_settings()['api_key']['value'], 'key6')
+        self.assertEqual(len(calls), 6)
+
+    def testHost(self):
+        c1 = petstore_api.Configuration()
+        calls = []
+        get_host_settings = c1.get_host_settings
+        c1.get_host_settings = lambda: calls.append(1) or get_host_settings()
+        self.assertEqual(c1.host, "http://petstore.swagger.io:80/v2")
+        self.assertEqual(c1.host, "http://petstore.swagger.io:80/v2")
+        self.assertEqual(len(calls), 1)
+
+        c1.server_variables['port'] = '8080'
+        self.assertEqual(c1.host, "http://petstore.swagger.io:8080/v2")
+        c1.server_index = 1
+        self.assertEqual(c1.host, "https://localhost:8080/v2")
+        c1.host = "http://example.com"
+        self.assertEqual(c1.host, "http://example.com")
+        c1._base_path = "http://example.org"
+        self.assertEqual(c1.host, "http://example.org")
+        self.assertEqual(len(calls), 3)
+
+    def testOperationHost(self):
+        c1 = petstore_api.Configuration()
+        servers = [{'url': 'http://a'},
+                   {'url': 'http://{name}', 'variables': {
+                       'name': {'default_value': 'b', 'enum_values': ['b', 'c']}}}]
+        self.assertEqual(c1.get_operation_host('op', servers), 'http://a')
+        self.assertEqual(c1.get_operation_host('op', servers, 1), 'http://b')
+        c1.server_operation_index['op'] = 1
+        c1.server_operation_variables['op'] = {'name': 'c'}
+        self.assertEqual(c1.get_operation_host('op', servers), 'http://c')
+        c1.server_operation_variables['op']['name'] = 'd'
+        with self.assertRaises(ValueError):
+            c1.get_operation_host('op', servers)
+
 if __name__ == '__main__':
     unittest.main()
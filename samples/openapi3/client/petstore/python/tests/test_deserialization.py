@@ -9,6 +9,7 @@ $ cd OpenAPIPetstore-python
 $ pytest
 """
 from collections import namedtuple
+import io
 import json
 import os
 import time
@@ -16,6 +17,7 @@ import unittest
 import datetime
 
 import pytest as pytest
+import urllib3
 
 import petstore_api
 
@@ -132,6 +134,36 @@ class DeserializationTests(unittest.TestCase):
         deserialized = self.deserialize(response, "datetime")
         self.assertTrue(isinstance(deserialized, datetime.datetime))
 
+    def test_deserialize_datetime_formats(self):
+        """ deserialize datetime without dateutil where possible """
+        utc = datetime.timezone.utc
+        cases = {
+            "1997-07-16T19:20:30.45+01:00": datetime.datetime(
+                1997, 7, 16, 18, 20, 30, 450000, tzinfo=utc),
+            "1997-07-16T19:20:30Z": datetime.datetime(
+                1997, 7, 16, 19, 20, 30, tzinfo=utc),
+            "1997-07-16t19:20:30.123456789-0130": datetime.datetime(
+                1997, 7, 16, 20, 50, 30, 123456, tzinfo=utc),
+            "1997-07-16 19:20:30": datetime.datetime(1997, 7, 16, 19, 20, 30),
+            # dateutil fallback
+            "16 July 1997 19:20": datetime.datetime(1997, 7, 16, 19, 20),
+        }
+        for data, expected in cases.items():
+            deserialized = self.deserialize(MockResponse(data=json.dumps(data)), "datetime")
+            self.assertEqual(deserialized, expected)
+
+        self.assertIsNone(petstore_api.api_client.parse_rfc3339_datetime("1997-13-16T19:20:30Z"))
+        with self.assertRaises(petstore_api.ApiException):
+            self.deserialize(MockResponse(data=json.dumps("1997-13-16T19:20:30Z")), "datetime")
+
+    def test_deserialize_date_format(self):
+        """ deserialize date with Configuration.date_format """
+        self.api_client.configuration.date_format = "%d/%m/%Y"
+        deserialized = self.deserialize(MockResponse(data=json.dumps("16/07/1997")), "date")
+        self.assertEqual(deserialized, datetime.date(1997, 7, 16))
+        deserialized = self.deserialize(MockResponse(data=json.dumps("1997-07-16")), "date")
+        self.assertEqual(deserialized, datetime.date(1997, 7, 16))
+
     def test_deserialize_pet(self):
         """ deserialize pet """
         data = {
@@ -236,6 +268,40 @@ class DeserializationTests(unittest.TestCase):
         self.assertTrue(isinstance(deserialized[0], list))
         self.assertTrue(isinstance(deserialized[0][0], str))
 
+    def test_deserialize_primitive_containers(self):
+        """ deserialize Dict[str, int] and List[float] """
+        data = {"available": 3, "pending": 1, "sold": 0}
+        response = MockResponse(data=json.dumps(data))
+
+        deserialized = self.deserialize(response, "Dict[str, int]")
+        self.assertEqual(deserialized, data)
+
+        # values not already of the expected type are still converted
+        response = MockResponse(data=json.dumps([1, 2.5, None]))
+        deserialized = self.deserialize(response, "List[float]")
+        self.assertEqual(deserialized, [1.0, 2.5, None])
+        self.assertTrue(isinstance(deserialized[0], float))
+
+    def test_deserialize_list_with_none(self):
+        """ deserialize List[Tag] with null items """
+        data = [{"id": 1, "name": "tag1"}, None]
+        response = MockResponse(data=json.dumps(data))
+
+        deserialized = self.deserialize(response, "List[Tag]")
+        self.assertTrue(isinstance(deserialized[0], petstore_api.Tag))
+        self.assertIsNone(deserialized[1])
+
+    def test_deserializer_cache(self):
+        """ type strings are compiled once per client """
+        data = [{"id": 1, "name": "tag1"}]
+        for _ in range(3):
+            response = MockResponse(data=json.dumps(data))
+            self.deserialize(response, "List[Tag]")
+
+        cache_info = self.api_client._ApiClient__deserializers.cache_info()
+        self.assertEqual(cache_info.misses, 2)  # List[Tag] and Tag
+        self.assertEqual(cache_info.hits, 2)
+
     def test_deserialize_none(self):
         """ deserialize None """
         response = MockResponse(data=json.dumps(None))
@@ -293,3 +359,59 @@ class DeserializationTests(unittest.TestCase):
         self.assertEqual(deserialized.class_name, "Cat")
         self.assertEqual(deserialized.declawed, True)
         self.assertEqual(deserialized.to_json(), '{"className": "Cat", "color": "red", "declawed": true}')
+
+
+class StreamDeserializationTests(unittest.TestCase):
+
+    def setUp(self):
+        self.api_client = petstore_api.ApiClient()
+
+    def make_response(self, body):
+        return urllib3.HTTPResponse(body=io.BytesIO(body),
+                                    headers={'Content-Type': 'application/json'},
+                                    status=200, preload_content=False)
+
+    def test_parser_split_chunks(self):
+        """ items split across chunk boundaries """
+        document = json.dumps([1, 23, "a,]b", {"x": [1, 2]}, None, True, 4.5])
+        for size in range(1, len(document) + 1):
+            parser = petstore_api.api_client.JsonArrayStreamParser()
+            items = []
+            for i in range(0, len(document), size):
+                items.extend(parser.feed(document[i:i + size]))
+            items.extend(parser.feed('', final=True))
+            self.assertEqual(items, [1, 23, "a,]b", {"x": [1, 2]}, None, True, 4.5])
+
+    def test_parser_invalid_document(self):
+        parser = petstore_api.api_client.JsonArrayStreamParser()
+        with self.assertRaises(json.JSONDecodeError):
+            parser.feed('{"foo": 1}')
+
+        parser = petstore_api.api_client.JsonArrayStreamParser()
+        parser.feed('[1, 2')
+        with self.assertRaises(json.JSONDecodeError):
+            parser.feed('', final=True)
+
+    def test_deserialize_stream(self):
+        """ deserialize List[Pet] lazily """
+        pets = [{"id": i, "name": "doggie%d" % i, "photoUrls": []}
+                for i in range(100)]
+        response = self.make_response(json.dumps(pets).encode('utf-8'))
+        self.api_client.STREAM_CHUNK_SIZE = 64
+
+        deserialized = self.api_client.deserialize_stream(response, "List[Pet]")
+        self.assertFalse(isinstance(deserialized, list))
+        first = next(deserialized)
+        self.assertTrue(isinstance(first, petstore_api.Pet))
+        self.assertEqual(first.name, "doggie0")
+        rest = list(deserialized)
+        self.assertEqual(len(rest), 99)
+        self.assertEqual(rest[-1].id, 99)
+
+    def test_deserialize_stream_invalid(self):
+        response = self.make_response(b'[{"id": 1, "name": "a", "photoUrls": []}')
+        with self.assertRaises(petstore_api.ApiException):
+            list(self.api_client.deserialize_stream(response, "List[Pet]"))
+
+        with self.assertRaises(petstore_api.ApiValueError):
+            self.api_client.deserialize_stream(self.make_response(b'{}'), "Pet")
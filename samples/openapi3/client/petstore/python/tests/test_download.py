@@ -0,0 +1,155 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+Run the tests.
+$ pip install -U pytest
+$ cd petstore_api-python
+$ pytest
+"""
+
+import hashlib
+import http.client
+import io
+import os
+import re
+import shutil
+import tempfile
+import unittest
+
+import urllib3
+
+import petstore_api
+
+
+class InterruptedBody(io.RawIOBase):
+    """Response body whose connection is lost after `limit` bytes."""
+
+    def __init__(self, data, limit=None):
+        self.data = io.BytesIO(data)
+        self.limit = limit
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self.limit is not None and self.data.tell() >= self.limit:
+            raise http.client.IncompleteRead(b'')
+        size = len(b)
+        if self.limit is not None:
+            size = min(size, self.limit - self.data.tell())
+        chunk = self.data.read(size)
+        b[:len(chunk)] = chunk
+        return len(chunk)
+
+
+class RangePoolManager(object):
+    """Serves `content`, honouring Range requests; the connection of the
+    n-th response is lost after `interruptions[n]` bytes of its body."""
+
+    def __init__(self, content, interruptions=(), headers=None, ranges=True):
+        self.content = content
+        self.interruptions = list(interruptions)
+        self.headers = headers or {}
+        self.ranges = ranges
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        headers = kwargs.get('headers') or {}
+        self.requests.append(dict(headers))
+        start, status = 0, 200
+        response_headers = {'Content-Type': 'application/octet-stream',
+                            'ETag': '"v1"'}
+        response_headers.update(self.headers)
+        match = re.match(r'bytes=(\d+)-', headers.get('Range', ''))
+        if match and self.ranges and headers.get('If-Range') == '"v1"':
+            start, status = int(match.group(1)), 206
+            response_headers['Content-Range'] = 'bytes %d-%d/%d' % (
+                start, len(self.content) - 1, len(self.content))
+        body = self.content[start:]
+        response_headers['Content-Length'] = str(len(body))
+        limit = self.interruptions.pop(0) if self.interruptions else None
+        return urllib3.HTTPResponse(
+            body=io.BufferedReader(InterruptedBody(body, limit)),
+            headers=response_headers, status=status,
+            preload_content=kwargs.get('preload_content', True))
+
+
+class DownloadTests(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.config = petstore_api.Configuration()
+        self.config.temp_folder_path = self.folder
+        self.config.download_chunk_size = 1024
+        self.config.download_digest = 'sha256'
+        self.api_client = petstore_api.ApiClient(self.config)
+        self.content = os.urandom(10000)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def call(self, pool_manager, **kwargs):
+        self.api_client.rest_client.pool_manager = pool_manager
+        return self.api_client.call_api(
+            '/file', 'GET', response_types_map={'200': 'bytearray'},
+            _return_http_data_only=True, **kwargs)
+
+    def assertDownloaded(self, downloaded):
+        self.assertEqual(downloaded.size, len(self.content))
+        self.assertEqual(downloaded.digest, hashlib.sha256(self.content).hexdigest())
+        with open(downloaded.path, 'rb') as f:
+            self.assertEqual(f.read(), self.content)
+
+    def test_download_to_path(self):
+        path = os.path.join(self.folder, 'out.bin')
+        downloaded = self.call(RangePoolManager(self.content), _download=path)
+        self.assertEqual(downloaded.path, path)
+        self.assertDownloaded(downloaded)
+
+    def test_download_to_temp_folder(self):
+        pool_manager = RangePoolManager(self.content, headers={
+            'Content-Disposition': 'attachment; filename="../pet.png"'})
+        downloaded = self.call(pool_manager, _download=True)
+        self.assertEqual(downloaded.path, os.path.join(self.folder, 'pet.png'))
+        self.assertDownloaded(downloaded)
+
+        downloaded = self.call(RangePoolManager(self.content), _download=True)
+        self.assertEqual(os.path.dirname(downloaded.path), self.folder)
+        self.assertDownloaded(downloaded)
+
+    def test_file_response_type(self):
+        self.api_client.rest_client.pool_manager = RangePoolManager(self.content)
+        response = self.api_client.call_api(
+            '/file', 'GET', response_types_map={'200': 'file'})
+        self.assertEqual(response.status_code, 200)
+        with open(response.data, 'rb') as f:
+            self.assertEqual(f.read(), self.content)
+
+    def test_resume(self):
+        pool_manager = RangePoolManager(self.content, interruptions=[3072, 4096])
+        downloaded = self.call(pool_manager, _download=True)
+        self.assertDownloaded(downloaded)
+        self.assertEqual([r.get('Range') for r in pool_manager.requests],
+                         [None, 'bytes=3072-', 'bytes=7168-'])
+        self.assertEqual(pool_manager.requests[1]['If-Range'], '"v1"')
+
+    def test_resume_without_range_support(self):
+        pool_manager = RangePoolManager(self.content, interruptions=[3000], ranges=False)
+        downloaded = self.call(pool_manager, _download=True)
+        self.assertDownloaded(downloaded)
+        self.assertEqual(len(pool_manager.requests), 2)
+
+    def test_resume_attempts(self):
+        self.config.download_resume_attempts = 1
+        pool_manager = RangePoolManager(self.content, interruptions=[3000, 4000])
+        with self.assertRaises(urllib3.exceptions.ProtocolError):
+            self.call(pool_manager, _download=True)
+
+        # compressed bodies cannot be resumed
+        pool_manager = RangePoolManager(self.content, interruptions=[3000],
+                                        headers={'Content-Encoding': 'br'})
+        with self.assertRaises(urllib3.exceptions.ProtocolError):
+            self.call(pool_manager, _download=True)
+        self.assertEqual(len(pool_manager.requests), 1)
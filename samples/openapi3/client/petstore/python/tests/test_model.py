@@ -276,6 +276,24 @@ class ModelTests(unittest.TestCase):
         nested2 = petstore_api.WithNestedOneOf.from_json(nested_json)
         self.assertEqual(nested2.to_json(), nested_json)
 
+    def test_oneOf_discriminator(self):
+        p = petstore_api.Pig.from_dict({"className": "DanishPig", "size": 2})
+        self.assertIsInstance(p.actual_instance, petstore_api.DanishPig)
+        self.assertEqual(p.actual_instance.size, 2)
+
+        # the data type given by the discriminator is validated alone
+        with self.assertRaises(ValueError):
+            petstore_api.Pig.from_dict({"className": "DanishPig", "color": "red"})
+
+        # unknown values fall back to the oneOf schemas
+        p = petstore_api.Pig.from_dict({"className": "Pig", "color": "red"})
+        self.assertIsInstance(p.actual_instance, petstore_api.BasquePig)
+
+    def test_oneOf_enum_from_dict(self):
+        e = petstore_api.OneOfEnumString.from_dict("a")
+        self.assertEqual(e.actual_instance, petstore_api.EnumString1.A)
+        self.assertEqual(petstore_api.OuterEnum.from_dict("placed"), petstore_api.OuterEnum.PLACED)
+
     def test_anyOf(self):
         # test new AnyOfPig
         new_anypig = petstore_api.AnyOfPig()
@@ -399,6 +417,30 @@ class ModelTests(unittest.TestCase):
         except ValueError as e:
             self.assertTrue("must be one of enum values ('available', 'pending', 'sold')" in str(e))
 
+    def test_enum_validators(self):
+        a = petstore_api.EnumArrays(just_symbol="$", array_enum=["fish", "crab"])
+        self.assertEqual(a.array_enum, ["fish", "crab"])
+        with self.assertRaises(ValueError) as context:
+            a.array_enum = ["fish", "tuna"]
+        self.assertIn("each list item must be one of ('fish', 'crab')", str(context.exception))
+
+        e = petstore_api.EnumTest(enum_string_required="lower", enum_integer=-1, enum_number=-1.2)
+        self.assertEqual((e.enum_integer, e.enum_number), (-1, -1.2))
+        e.enum_string = ""
+        with self.assertRaises(ValueError) as context:
+            e.enum_number = 1.2
+        self.assertIn("must be one of enum values (1.1, -1.2)", str(context.exception))
+
+    def test_enum_validators_unhashable(self):
+        # container values are not hashable, the enum tables must not need it
+        with self.assertRaises(ValueError) as context:
+            petstore_api.MapTest(map_of_enum_string={"a": "UPPER"})
+        self.assertIn("must be one of enum values ('UPPER', 'lower')", str(context.exception))
+        with self.assertRaises(ValueError):
+            petstore_api.EnumArrays(array_enum=[["fish"]])
+        with self.assertRaises(ValueError):
+            petstore_api.EnumArrays(just_symbol=[">="])
+
     def test_constraints(self):
         rgb = [128, 128, 128]
         rgba = [128, 128, 128, 128]
@@ -554,6 +596,27 @@ class ModelTests(unittest.TestCase):
         a2 = petstore_api.ArrayOfArrayOfModel.from_dict(a.to_dict())
         self.assertEqual(a.to_dict(), a2.to_dict())
 
+    def test_to_dict_nested(self):
+        a = petstore_api.MixedPropertiesAndAdditionalPropertiesClass.from_dict({
+            "map": {"dog": {"className": "Dog", "breed": "bulldog", "bark": True}},
+            "extra": 1})
+        # the Dog in the Dict[str, Animal] field is dumped as a Dog, with
+        # additional properties at the top level of each model
+        self.assertEqual(a.to_dict(), {
+            "map": {"dog": {"className": "Dog", "color": "red", "breed": "bulldog", "bark": True}},
+            "extra": 1})
+        self.assertEqual(a.to_json(), '{"map": {"dog": {"className": "Dog", "color": "red", '
+                                      '"breed": "bulldog", "bark": true}}, "extra": 1}')
+        # model_dump is left unchanged
+        self.assertEqual(a.model_dump(exclude_none=True)["additional_properties"], {"extra": 1})
+
+        b = petstore_api.WithNestedOneOf(size=1, nested_pig=petstore_api.Pig(
+            actual_instance=petstore_api.BasquePig(className="BasquePig", color="red")))
+        self.assertEqual(b.to_dict(), {"size": 1, "nested_pig": {"className": "BasquePig", "color": "red"}})
+
+        c = petstore_api.ArrayOfArrayOfModel(another_property=[[petstore_api.Tag(id=1)], []])
+        self.assertEqual(c.to_dict(), {"another_property": [[{"id": 1}]]})
+
     def test_object_with_additional_properties(self):
         a = petstore_api.ObjectToTestAdditionalProperties()
         a.additional_properties = { "abc": 123 }
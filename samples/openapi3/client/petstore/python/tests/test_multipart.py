@@ -0,0 +1,128 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+Run the tests.
+$ pip install -U pytest
+$ cd petstore_api-python
+$ pytest
+"""
+
+import io
+import mmap
+import os
+import tempfile
+import unittest
+
+import urllib3
+from urllib3.filepost import encode_multipart_formdata
+
+import petstore_api
+from petstore_api.multipart import FilePart, MultipartEncoder, guess_content_type
+
+
+class CapturingPoolManager(object):
+    def __init__(self):
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        body = kwargs.get('body')
+        if isinstance(body, MultipartEncoder):
+            kwargs['body'] = b''.join(body)
+        self.calls.append(kwargs)
+        return urllib3.HTTPResponse(status=200, body=b'{"code": 200}',
+                                    headers={'Content-Type': 'application/json'})
+
+
+class UnsizedReader(io.RawIOBase):
+    """A stream of unknown length, like a pipe."""
+
+    def __init__(self, data):
+        self.data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        chunk = self.data.read(len(b))
+        b[:len(chunk)] = chunk
+        return len(chunk)
+
+
+class MultipartTests(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.png')
+        self.content = os.urandom(200 * 1024)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self.content)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_same_body_as_urllib3(self):
+        fields = [('name', 'doggie'), ('id', 5),
+                  ('file', ('a "b".txt', b'content', 'text/plain'))]
+        body, content_type = encode_multipart_formdata(fields, boundary='xyz')
+        encoder = MultipartEncoder(fields, boundary='xyz')
+        self.assertEqual(encoder.content_type, content_type)
+        self.assertEqual(encoder.to_bytes(), body)
+        self.assertEqual(encoder.content_length, len(body))
+
+    def test_sources(self):
+        expected, _ = encode_multipart_formdata(
+            [('file', (os.path.basename(self.path), self.content, 'image/png'))],
+            boundary='xyz')
+        with open(self.path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for source in (self.path, f, mapped, self.content):
+                part = FilePart(source, filename=os.path.basename(self.path))
+                encoder = MultipartEncoder([('file', part)], boundary='xyz',
+                                           chunk_size=8192)
+                self.assertEqual(encoder.content_length, len(expected))
+                chunks = list(encoder)
+                self.assertTrue(all(len(c) <= 2 * 8192 for c in chunks))
+                self.assertEqual(b''.join(chunks), expected)
+                # the body can be sent again
+                self.assertEqual(encoder.to_bytes(), expected)
+            self.assertFalse(f.closed)
+
+    def test_unknown_length(self):
+        part = FilePart(io.BufferedReader(UnsizedReader(b'abc')), filename='a.bin')
+        self.assertIsNone(part.length)
+        encoder = MultipartEncoder([('file', part)], boundary='xyz')
+        self.assertIsNone(encoder.content_length)
+        self.assertIn(b'\r\n\r\nabc\r\n--xyz--\r\n', encoder.to_bytes())
+
+    def test_guess_content_type(self):
+        self.assertEqual(guess_content_type('/tmp/a.png'), 'image/png')
+        self.assertEqual(guess_content_type('a.tar.gz'), 'application/x-tar')
+        self.assertEqual(guess_content_type('noextension'), 'application/octet-stream')
+
+    def test_files_parameters(self):
+        api_client = petstore_api.ApiClient()
+        params = api_client.files_parameters({'file': [self.path, b'data'], 'other': None})
+        self.assertEqual([k for k, _ in params], ['file', 'file'])
+        self.assertEqual(params[0][1].filename, os.path.basename(self.path))
+        self.assertEqual(params[0][1].content_type, 'image/png')
+        self.assertEqual(params[0][1].length, len(self.content))
+        self.assertEqual(params[1][1].filename, 'file')
+
+    def test_upload_file(self):
+        api_client = petstore_api.ApiClient()
+        pool_manager = CapturingPoolManager()
+        api_client.rest_client.pool_manager = pool_manager
+        pet_api = petstore_api.PetApi(api_client)
+        pet_api.upload_file(1, additional_metadata='meta', file=self.path)
+        call = pool_manager.calls[0]
+        content_type = call['headers']['Content-Type']
+        self.assertTrue(content_type.startswith('multipart/form-data; boundary='))
+        self.assertFalse(call['chunked'])
+        self.assertEqual(int(call['headers']['Content-Length']), len(call['body']))
+        boundary = content_type.split('=', 1)[1]
+        expected, _ = encode_multipart_formdata(
+            [('additionalMetadata', 'meta'),
+             ('file', (os.path.basename(self.path), self.content, 'image/png'))],
+            boundary=boundary)
+        self.assertEqual(call['body'], expected)
@@ -0,0 +1,219 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+Run the tests.
+$ pip install -U pytest
+$ cd petstore_api-python
+$ pytest
+"""
+
+import email.utils
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import urllib3
+
+import petstore_api
+
+PET = b'{"id": 1, "name": "doggie", "photoUrls": []}'
+
+
+class ConditionalPoolManager(object):
+    """Serves `body` with the `headers`, answering 304 to a matching
+    If-None-Match."""
+
+    def __init__(self, body=PET, headers=None, etag='"v1"'):
+        self.body = body
+        self.headers = headers or {}
+        self.etag = etag
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        headers = kwargs.get('headers') or {}
+        self.requests.append((method, dict(headers)))
+        response_headers = {'Content-Type': 'application/json'}
+        if self.etag:
+            response_headers['ETag'] = self.etag
+        response_headers.update(self.headers)
+        if self.etag and headers.get('If-None-Match') == self.etag:
+            return urllib3.HTTPResponse(status=304, body=b'', headers=response_headers)
+        return urllib3.HTTPResponse(status=200, body=self.body, headers=response_headers)
+
+
+class ResponseCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = petstore_api.ResponseCache()
+        self.api_client = petstore_api.ApiClient(cache=self.cache)
+        self.pet_api = petstore_api.PetApi(self.api_client)
+
+    def serve(self, **kwargs):
+        pool_manager = ConditionalPoolManager(**kwargs)
+        self.api_client.rest_client.pool_manager = pool_manager
+        return pool_manager
+
+    def test_fresh_response(self):
+        pool_manager = self.serve(headers={'Cache-Control': 'max-age=60'})
+        pet = self.pet_api.get_pet_by_id(1)
+        # served from the cache, with the deserialized data
+        self.assertIs(self.pet_api.get_pet_by_id(1), pet)
+        self.assertEqual(len(pool_manager.requests), 1)
+
+        response = self.pet_api.get_pet_by_id_with_http_info(1)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['etag'], '"v1"')
+        self.assertEqual(response.raw_data, PET.decode('utf-8'))
+        self.assertEqual(self.api_client.last_response.data, PET.decode('utf-8'))
+        self.assertEqual(len(pool_manager.requests), 1)
+
+        # other URLs are not cached
+        self.pet_api.get_pet_by_id(2)
+        self.assertEqual(len(pool_manager.requests), 2)
+
+    def test_revalidation(self):
+        pool_manager = self.serve(headers={'Cache-Control': 'no-cache'})
+        pet = self.pet_api.get_pet_by_id(1)
+        self.assertIs(self.pet_api.get_pet_by_id(1), pet)
+        self.assertEqual(len(pool_manager.requests), 2)
+        self.assertEqual(pool_manager.requests[1][1]['If-None-Match'], '"v1"')
+
+        # a new version is stored
+        pool_manager.etag = '"v2"'
+        pool_manager.body = b'{"id": 1, "name": "cat", "photoUrls": []}'
+        self.assertEqual(self.pet_api.get_pet_by_id(1).name, 'cat')
+        self.assertEqual(self.pet_api.get_pet_by_id(1).name, 'cat')
+        self.assertEqual(pool_manager.requests[3][1]['If-None-Match'], '"v2"')
+
+    def test_expires(self):
+        now = time.time()
+        pool_manager = self.serve(etag=None, headers={
+            'Date': email.utils.formatdate(now, usegmt=True),
+            'Expires': email.utils.formatdate(now + 60, usegmt=True)})
+        self.pet_api.get_pet_by_id(1)
+        self.pet_api.get_pet_by_id(1)
+        self.assertEqual(len(pool_manager.requests), 1)
+
+        self.cache.clear()
+        pool_manager = self.serve(etag=None, headers={'Expires': '0'})
+        self.pet_api.get_pet_by_id(1)
+        self.pet_api.get_pet_by_id(1)
+        self.assertEqual(len(pool_manager.requests), 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_not_cacheable(self):
+        pool_manager = self.serve(headers={'Cache-Control': 'no-store, max-age=60'})
+        self.pet_api.get_pet_by_id(1)
+        self.pet_api.get_pet_by_id(1)
+        self.assertEqual(len(pool_manager.requests), 2)
+
+        pool_manager = self.serve(headers={'Cache-Control': 'max-age=60', 'Vary': '*'})
+        self.pet_api.get_pet_by_id(1)
+        self.pet_api.get_pet_by_id(1)
+        self.assertEqual(len(pool_manager.requests), 2)
+
+        pool_manager = self.serve(headers={'Cache-Control': 'max-age=60'})
+        self.pet_api.get_pet_by_id(1, _headers={'Cache-Control': 'no-store'})
+        self.pet_api.get_pet_by_id(1)
+        self.assertEqual(len(pool_manager.requests), 2)
+
+    def test_keyed_on_authorization(self):
+        pool_manager = self.serve(headers={'Cache-Control': 'max-age=60'})
+        self.pet_api.get_pet_by_id(1, _headers={'Authorization': 'a'})
+        self.pet_api.get_pet_by_id(1, _headers={'Authorization': 'b'})
+        self.pet_api.get_pet_by_id(1, _headers={'Authorization': 'a'})
+        self.assertEqual(len(pool_manager.requests), 2)
+
+    def test_keyed_on_api_key(self):
+        directory = tempfile.mkdtemp()
+        try:
+            pool_manager = ConditionalPoolManager(
+                headers={'Cache-Control': 'max-age=60'})
+            pet_apis = {}
+            for api_key in ('key-a', 'key-b'):
+                config = petstore_api.Configuration(api_key={'api_key': api_key})
+                api_client = petstore_api.ApiClient(
+                    config, cache=petstore_api.ResponseCache(directory=directory))
+                api_client.rest_client.pool_manager = pool_manager
+                pet_apis[api_key] = petstore_api.PetApi(api_client)
+            pet_apis['key-a'].get_pet_by_id(1)
+            pet_apis['key-b'].get_pet_by_id(1)
+            pet_apis['key-a'].get_pet_by_id(1)
+            self.assertEqual([headers['api_key'] for _, headers in pool_manager.requests],
+                             ['key-a', 'key-b'])
+
+            # the keys are not stored in clear
+            for name in os.listdir(directory):
+                with open(os.path.join(directory, name), 'rb') as f:
+                    self.assertNotIn(b'key-a', f.read())
+        finally:
+            shutil.rmtree(directory)
+
+    def test_invalidation(self):
+        pool_manager = self.serve(headers={'Cache-Control': 'max-age=60'})
+        self.pet_api.get_pet_by_id(1)
+        self.pet_api.delete_pet(1)
+        self.pet_api.get_pet_by_id(1)
+        self.assertEqual([method for method, _ in pool_manager.requests],
+                         ['GET', 'DELETE', 'GET'])
+
+    def test_invalidation_on_disk(self):
+        directory = tempfile.mkdtemp()
+        try:
+            self.api_client.cache = petstore_api.ResponseCache(
+                max_entries=1, directory=directory)
+            pool_manager = self.serve(headers={'Cache-Control': 'max-age=60'})
+            self.pet_api.get_pet_by_id(1)
+            # evicts the entry of the first pet from the memory
+            self.pet_api.get_pet_by_id(2)
+            self.pet_api.delete_pet(1)
+            self.pet_api.get_pet_by_id(1)
+            self.pet_api.get_pet_by_id(2)
+            self.assertEqual([method for method, _ in pool_manager.requests],
+                             ['GET', 'GET', 'DELETE', 'GET'])
+        finally:
+            shutil.rmtree(directory)
+
+    def test_no_invalidation_by_safe_methods(self):
+        pool_manager = self.serve(body=b'[]',
+                                  headers={'Cache-Control': 'max-age=60'})
+        pets = self.pet_api.find_pets_by_status(['available'])
+        # a streamed GET skips the cache, without invalidating it
+        self.pet_api.find_pets_by_status_with_http_info(['available'],
+                                                        _stream=True)
+        self.assertIs(self.pet_api.find_pets_by_status(['available']), pets)
+        self.assertEqual(len(pool_manager.requests), 2)
+
+    def test_lru_bounds(self):
+        self.cache.max_entries = 2
+        pool_manager = self.serve(headers={'Cache-Control': 'max-age=60'})
+        for pet_id in (1, 2, 3):
+            self.pet_api.get_pet_by_id(pet_id)
+        self.assertEqual(len(self.cache), 2)
+        self.pet_api.get_pet_by_id(1)
+        self.assertEqual(len(pool_manager.requests), 4)
+
+        self.cache.max_bytes = 10
+        self.cache.clear()
+        self.pet_api.get_pet_by_id(1)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_directory(self):
+        directory = tempfile.mkdtemp()
+        try:
+            self.api_client.cache = petstore_api.ResponseCache(directory=directory)
+            pool_manager = self.serve(headers={'Cache-Control': 'max-age=60'})
+            self.pet_api.get_pet_by_id(1)
+            # another client (or process) reads the entry from the disk
+            api_client = petstore_api.ApiClient(
+                cache=petstore_api.ResponseCache(directory=directory))
+            api_client.rest_client.pool_manager = pool_manager
+            pet = petstore_api.PetApi(api_client).get_pet_by_id(1)
+            self.assertEqual(pet.name, 'doggie')
+            self.assertEqual(len(pool_manager.requests), 1)
+        finally:
+            shutil.rmtree(directory)
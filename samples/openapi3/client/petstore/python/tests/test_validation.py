@@ -0,0 +1,256 @@
+# coding: utf-8
+
+# flake8: noqa
+
+"""
+Run the tests.
+$ pip install -U pytest
+$ cd petstore_api-python
+$ pytest
+"""
+
+from collections import namedtuple
+import datetime
+import json
+import os
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+import petstore_api
+from petstore_api.validation import build_model, candidate_index, compact, trusted
+
+MockResponse = namedtuple('MockResponse', 'data')
+
+CASES = [
+    ('Pet', {"id": 1, "name": "doggie", "photoUrls": ["a"],
+             "category": {"id": 2, "name": "c"},
+             "tags": [{"id": 3, "name": "t"}], "status": "available",
+             "extra": 1}),
+    ('Order', {"id": 1, "petId": 2, "quantity": 3,
+               "shipDate": "2020-01-02T03:04:05.123Z", "status": "placed",
+               "complete": True}),
+    ('EnumTest', {"enum_string": "UPPER", "enum_string_required": "lower",
+                  "enum_integer": 1, "enum_number": 1.1,
+                  "outerEnum": "placed", "outerEnumInteger": 2,
+                  "outerEnumDefaultValue": "placed"}),
+    ('FormatTest', {"integer": 10, "int32": 20, "number": 33, "float": 54.3,
+                    "double": 67.8, "decimal": "1.5", "string": "abc",
+                    "byte": "YWJj", "binary": "abc", "date": "2020-01-02",
+                    "dateTime": "2020-01-02T03:04:05Z",
+                    "uuid": "72f98069-206d-4f12-9f12-3d1e525a8e84",
+                    "password": "0123456789",
+                    "pattern_with_digits": "0123456789",
+                    "pattern_with_digits_and_delimiter": "image_123"}),
+    ('EnumArrays', {"just_symbol": ">=", "array_enum": ["fish", "crab"]}),
+    ('ArrayTest', {"array_of_string": ["a"], "array_array_of_integer": [[1]],
+                   "array_array_of_model": [[{"bar": "x", "baz": "y"}]]}),
+    ('NullableClass', {"required_integer_prop": None, "integer_prop": 1,
+                       "number_prop": 2, "boolean_prop": True,
+                       "string_prop": "s", "date_prop": "2020-01-02",
+                       "datetime_prop": "2020-01-02T03:04:05Z",
+                       "array_nullable_prop": [{}],
+                       "object_nullable_prop": {"a": {}}}),
+    ('ArrayOfArrayOfNumberOnly', {"ArrayArrayNumber": [[1, 2.5]]}),
+]
+
+
+class TrustedTests(unittest.TestCase):
+
+    def test_same_models(self):
+        for name, data in CASES:
+            cls = getattr(petstore_api, name)
+            validated = cls.from_dict(data)
+            with trusted():
+                model = cls.from_dict(data)
+            self.assertEqual(model, validated, name)
+            self.assertEqual(model.to_dict(), validated.to_dict(), name)
+            self.assertEqual(model.model_fields_set,
+                             validated.model_fields_set, name)
+
+    def test_conversions(self):
+        with trusted():
+            order = petstore_api.Order.from_dict(
+                {"id": 1, "shipDate": "2020-01-02T03:04:05Z"})
+            number = petstore_api.NumberOnly.from_dict({"JustNumber": 1})
+        self.assertEqual(order.ship_date, datetime.datetime(
+            2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc))
+        self.assertIsInstance(number.just_number, float)
+
+    def test_not_validated(self):
+        data = {"id": 1, "name": "doggie", "photoUrls": [], "status": "lost"}
+        with self.assertRaises(ValueError):
+            petstore_api.Pet.from_dict(data)
+        with trusted():
+            pet = petstore_api.Pet.from_dict(data)
+        self.assertEqual(pet.status, "lost")
+
+    def test_fresh_defaults(self):
+        with trusted():
+            first = petstore_api.Tag.from_dict({"id": 1})
+            second = petstore_api.Tag.from_dict({"id": 2})
+        first.additional_properties["a"] = 1
+        self.assertEqual(second.additional_properties, {})
+
+    def test_trust_responses(self):
+        response = MockResponse(data=json.dumps(
+            {"id": 1, "name": "doggie", "photoUrls": [], "status": "lost"}))
+        config = petstore_api.Configuration()
+        api_client = petstore_api.ApiClient(config)
+        with self.assertRaises(ValueError):
+            api_client.deserialize(response, 'Pet')
+
+        config.trust_responses = True
+        pet = api_client.deserialize(response, 'Pet')
+        self.assertEqual(pet.status, "lost")
+
+        # every response is validated
+        config.trusted_validation_rate = 1.0
+        with self.assertRaises(ValueError):
+            api_client.deserialize(response, 'Pet')
+
+
+class CompactTests(unittest.TestCase):
+
+    def test_same_dicts(self):
+        for name, data in CASES:
+            cls = getattr(petstore_api, name)
+            validated = cls.from_dict(data)
+            with compact():
+                model = cls.from_dict(data)
+            with compact(), trusted():
+                trusted_model = cls.from_dict(data)
+            self.assertEqual(model.to_dict(), validated.to_dict(), name)
+            self.assertEqual(trusted_model.to_dict(), validated.to_dict(), name)
+
+    def test_compact_representation(self):
+        data = {"id": 1, "name": "doggie", "photoUrls": [], "status": "sold"}
+        with compact():
+            first = petstore_api.Pet.from_dict(json.loads(json.dumps(data)))
+            second = petstore_api.Pet.from_dict(json.loads(json.dumps(data)))
+        self.assertIs(first.status, second.status)
+        self.assertNotIn("additional_properties", first.__dict__)
+
+        # the fields sets are not shared
+        self.assertIsNot(first.model_fields_set, second.model_fields_set)
+        first.id = 2
+        self.assertEqual(second.id, 1)
+
+        # allocated on first access
+        first.additional_properties["a"] = 1
+        self.assertEqual(second.additional_properties, {})
+        self.assertEqual(first.to_dict()["a"], 1)
+        self.assertNotIn("a", second.to_dict())
+
+    def test_fields_set(self):
+        # the fields set of a model holds the fields it was built with only,
+        # so that the absent nullable fields are not emitted as null
+        with compact():
+            model = build_model(petstore_api.HealthCheckResult, {})
+        with compact(), trusted():
+            trusted_model = build_model(petstore_api.HealthCheckResult, {})
+        for model in (model, trusted_model):
+            self.assertEqual(model.model_fields_set, set())
+            self.assertEqual(model.to_dict(), {})
+
+        with compact():
+            model = build_model(petstore_api.NullableClass,
+                                {"required_integer_prop": None})
+        self.assertEqual(model.model_fields_set, {"required_integer_prop"})
+        self.assertEqual(model.to_dict(), {"required_integer_prop": None})
+
+    def test_extra_properties(self):
+        with compact():
+            pet = petstore_api.Pet.from_dict(
+                {"name": "doggie", "photoUrls": [], "extra": 1})
+        self.assertEqual(pet.additional_properties, {"extra": 1})
+
+    def test_compact_responses(self):
+        response = MockResponse(data=json.dumps(
+            {"id": 1, "name": "doggie", "photoUrls": [], "status": "sold"}))
+        config = petstore_api.Configuration()
+        config.compact_responses = True
+        api_client = petstore_api.ApiClient(config)
+        pet = api_client.deserialize(response, 'Pet')
+        self.assertNotIn("additional_properties", pet.__dict__)
+        with self.assertRaises(ValueError):
+            api_client.deserialize(MockResponse(data=json.dumps(
+                {"id": 1, "name": "doggie", "photoUrls": [], "status": "lost"})), 'Pet')
+
+
+class CandidateIndexTests(unittest.TestCase):
+
+    def test_index(self):
+        index = candidate_index(petstore_api.AnyOfPig)
+        basque_pig = index["anyof_schema_1_validator"]
+        self.assertTrue(basque_pig({"className": "BasquePig", "color": "red"}))
+        self.assertTrue(basque_pig(None))
+        self.assertFalse(basque_pig({"className": "DanishPig", "size": 2}))
+        self.assertFalse(basque_pig({"className": "BasquePig", "color": None}))
+        self.assertFalse(basque_pig("BasquePig"))
+
+        index = candidate_index(petstore_api.Color)
+        rgb, rgba, hex_string = (index["oneof_schema_1_validator"],
+                                 index["oneof_schema_2_validator"],
+                                 index["oneof_schema_3_validator"])
+        self.assertEqual([rgb([1, 2, 3]), rgba([1, 2, 3]), hex_string([1, 2, 3])],
+                         [True, False, False])
+        self.assertEqual([rgb("#00FF00"), rgba("#00FF00"), hex_string("#00FF00")],
+                         [False, False, True])
+        # the items are not checked
+        self.assertTrue(rgb([1, 2, 300]))
+
+        index = candidate_index(petstore_api.OneOfEnumString)
+        self.assertTrue(index["oneof_schema_1_validator"]("a"))
+        self.assertFalse(index["oneof_schema_1_validator"]("c"))
+        self.assertFalse(index["oneof_schema_1_validator"]({}))
+
+    def test_only_candidates_tried(self):
+        with mock.patch.object(petstore_api.BasquePig, "from_dict",
+                               side_effect=AssertionError) as from_dict:
+            pig = petstore_api.AnyOfPig.from_dict(
+                {"className": "DanishPig", "size": 2})
+        from_dict.assert_not_called()
+        self.assertIsInstance(pig.actual_instance, petstore_api.DanishPig)
+
+        color = petstore_api.Color.from_dict([1, 2, 3, 4])
+        self.assertEqual(color.actual_instance, [1, 2, 3, 4])
+
+    def test_errors_of_every_schema(self):
+        with self.assertRaises(ValueError) as context:
+            petstore_api.Color.from_dict("#00FF")
+        message = str(context.exception)
+        self.assertIn("No match found when deserializing the JSON string into "
+                      "Color with oneOf schemas: List[int], str. Details: ",
+                      message)
+        self.assertIn("Input should be a valid list", message)
+        self.assertIn("String should have at least 7 characters", message)
+
+
+class DeferredBuildTests(unittest.TestCase):
+
+    def test_built_on_first_use(self):
+        # in a new interpreter, as the other tests build the models they use
+        code = """if True:
+            from petstore_api.models.any_of_pig import AnyOfPig
+            from petstore_api.models.pet import Pet
+            from petstore_api.validation import candidate_index, trusted
+            assert not Pet.__pydantic_complete__
+            assert not AnyOfPig.__pydantic_complete__
+
+            # built without validation on first use
+            with trusted():
+                pet = Pet.from_dict({"name": "doggie", "photoUrls": [],
+                                     "status": "lost"})
+            assert pet.status == "lost"
+            assert Pet.__pydantic_complete__
+            assert candidate_index(AnyOfPig) is not None
+        """
+        path = os.path.dirname(os.path.dirname(petstore_api.__file__))
+        env = dict(os.environ, PYTHONPATH=path)
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,19 @@
 import datetime
+import re
 
 import typing
 from typing import Union
 from openapi_server import typing_utils
 
+try:
+    from dateutil.parser import parse as dateutil_parse
+except ImportError:
+    dateutil_parse = None
+
+RFC3339_DATETIME = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})[Tt ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?'
+    r'(?:([Zz])|([+-])(\d{2}):?(\d{2}))?')
+
 T = typing.TypeVar('T')
 Class = typing.Type[T]
 
@@ -66,10 +76,12 @@ def deserialize_date(string: str) -> datetime.date:
     :return: date.
     """
     try:
-        from dateutil.parser import parse
-        return parse(string).date()
-    except ImportError:
+        return datetime.date.fromisoformat(string)
+    except ValueError:
+        pass
+    if dateutil_parse is None:
         return string
+    return dateutil_parse(string).date()
 
 
 def deserialize_datetime(string: str) -> datetime.datetime:
@@ -81,10 +93,45 @@ def deserialize_datetime(string: str) -> datetime.datetime:
     :return: datetime.
     """
     try:
-        from dateutil.parser import parse
-        return parse(string)
-    except ImportError:
+        return datetime.datetime.fromisoformat(string)
+    except ValueError:
+        pass
+    value = parse_rfc3339_datetime(string)
+    if value is not None:
+        return value
+    if dateutil_parse is None:
         return string
+    return dateutil_parse(string)
+
+
+def parse_rfc3339_datetime(string: str) -> typing.Optional[datetime.datetime]:
+    """Parses an RFC 3339 date-time without going through dateutil.
+
+    Fractions of a second are truncated to microseconds.
+
+    :param string: str.
+    :return: datetime, or None if the string is not an RFC 3339 date-time.
+    """
+    match = RFC3339_DATETIME.fullmatch(string)
+    if match is None:
+        return None
+    (year, month, day, hour, minute, second, fraction,
+     utc, sign, offset_hours, offset_minutes) = match.groups()
+    microsecond = int(fraction[:6].ljust(6, '0')) if fraction else 0
+    try:
+        if utc:
+            tzinfo = datetime.timezone.utc
+        elif sign:
+            offset = datetime.timedelta(hours=int(offset_hours),
+                                        minutes=int(offset_minutes))
+            tzinfo = datetime.timezone(-offset if sign == '-' else offset)
+        else:
+            tzinfo = None
+        return datetime.datetime(int(year), int(month), int(day), int(hour),
+                                 int(minute), int(second), microsecond, tzinfo)
+    except ValueError:
+        # out of range fields
+        return None
 
 
 def deserialize_model(data: Union[dict, list], klass: T) -> T: